@@ -1,635 +1,192 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import json
-import pickle
-from enum import Enum
-from datetime import datetime
 import os
+import queue
+import threading
 
-class Idioma(Enum):
-    INGLES = "inglés"
-    ESPANOL = "español"
-    FRANCES = "francés"
-    PORTUGUES = "portugués"
+from motor_traduccion import Idioma, TraductorAprendizajeConcurrente
+from motor_traduccion.progreso import OperacionCancelada
+from motor_traduccion.modelos import IDIOMAS_POR_VALOR
+from motor_traduccion.serializacion import es_json, ruta_anterior
 
-class Traduccion:
-    def __init__(self, texto_traduccion):
-        self.texto = texto_traduccion
-        self.puntuacion_promedio = 5.0
-        self.total_evaluaciones = 1
-        self.historial_puntuaciones = [5.0]
-        self.fecha_creacion = datetime.now()
-        self.fecha_ultima_modificacion = datetime.now()
-    
-    def actualizar_puntuacion(self, nueva_puntuacion):
-        self.historial_puntuaciones.append(nueva_puntuacion)
-        self.total_evaluaciones += 1
-        self.puntuacion_promedio = sum(self.historial_puntuaciones) / self.total_evaluaciones
-        self.fecha_ultima_modificacion = datetime.now()
-    
-    def to_dict(self):
-        return {
-            'texto': self.texto,
-            'puntuacion_promedio': self.puntuacion_promedio,
-            'total_evaluaciones': self.total_evaluaciones,
-            'historial_puntuaciones': self.historial_puntuaciones,
-            'fecha_creacion': self.fecha_creacion.isoformat(),
-            'fecha_ultima_modificacion': self.fecha_ultima_modificacion.isoformat()
-        }
-    
-    @classmethod
-    def from_dict(cls, data):
-        traduccion = cls(data['texto'])
-        traduccion.puntuacion_promedio = data['puntuacion_promedio']
-        traduccion.total_evaluaciones = data['total_evaluaciones']
-        traduccion.historial_puntuaciones = data['historial_puntuaciones']
-        traduccion.fecha_creacion = datetime.fromisoformat(data['fecha_creacion'])
-        traduccion.fecha_ultima_modificacion = datetime.fromisoformat(data['fecha_ultima_modificacion'])
-        return traduccion
+HISTORIAL_POR_PAGINA = 50
+SUGERENCIAS = 8
+TODOS = "(todos)"
 
-class TraductorAprendizaje:
-    """Clase del traductor con capacidad de fusionar diccionarios"""
-    def __init__(self):
-        self.diccionario = {}
-        self.historial_traducciones = []
-        self.inicializar_diccionario()
-        self.inicializar_traducciones()
-    
-    def inicializar_diccionario(self):
-        for idioma_origen in Idioma:
-            self.diccionario[idioma_origen] = {}
-            for idioma_destino in Idioma:
-                if idioma_origen != idioma_destino:
-                    self.diccionario[idioma_origen][idioma_destino] = {}
-    
-    def inicializar_traducciones(self):
-        """Agrega traducciones iniciales al diccionario (con puntuación por defecto 5)"""
-        # Español -> Inglés
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "hola", "hello")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "adiós", "goodbye")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "gracias", "thank you")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "por favor", "please")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "agua", "water")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "comida", "food")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "casa", "house")
-        
-        # Inglés -> Español
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "hello", "hola")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "goodbye", "adiós")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "thank you", "gracias")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "please", "por favor")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "water", "agua")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "food", "comida")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "house", "casa")
-        
-        # Español -> Francés
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "hola", "bonjour")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "adiós", "au revoir")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "gracias", "merci")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "agua", "eau")
-        
-        # Francés -> Español
-        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "bonjour", "hola")
-        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "au revoir", "adiós")
-        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "merci", "gracias")
-        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "eau", "agua")
-        
-        # Español -> Portugués
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "hola", "olá")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "adiós", "adeus")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "gracias", "obrigado")
-        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "agua", "água")
-        
-        # Portugués -> Español
-        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "olá", "hola")
-        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "adeus", "adiós")
-        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "obrigado", "gracias")
-        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "água", "agua")
-        
-        # Inglés -> Francés
-        self.agregar_traduccion(Idioma.INGLES, Idioma.FRANCES, "hello", "bonjour")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.FRANCES, "goodbye", "au revoir")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.FRANCES, "water", "eau")
-        
-        # Inglés -> Portugués
-        self.agregar_traduccion(Idioma.INGLES, Idioma.PORTUGUES, "hello", "olá")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.PORTUGUES, "goodbye", "adeus")
-        self.agregar_traduccion(Idioma.INGLES, Idioma.PORTUGUES, "water", "água")
-    
-    def fusionar_traduccion(self, origen, destino, texto_origen, nueva_traduccion):
-        """
-        Fusiona una traducción: si ya existe, combina las estadísticas
-        Si no existe, la agrega
-        """
-        texto_origen_lower = texto_origen.lower()
-        
-        
-        existe = (origen in self.diccionario and 
-                destino in self.diccionario[origen] and
-                texto_origen_lower in self.diccionario[origen][destino])
-        
-        if existe:
-            existente = self.diccionario[origen][destino][texto_origen_lower]
-            
-            if existente.texto != nueva_traduccion.texto:
-                existente.texto = nueva_traduccion.texto
-            
-            historial_combinado = existente.historial_puntuaciones + nueva_traduccion.historial_puntuaciones
-            existente.historial_puntuaciones = historial_combinado
-            existente.total_evaluaciones = len(historial_combinado)
-            existente.puntuacion_promedio = sum(historial_combinado) / existente.total_evaluaciones
-            
-            existente.fecha_ultima_modificacion = datetime.now()
-            
-            return "actualizada"
+class ListaVirtual:
+    """
+    Treeview que sólo contiene las filas visibles.
+    
+    obtener(inicio, cantidad) devuelve (total, filas) con los valores de las
+    posiciones [inicio, inicio + cantidad). La barra de desplazamiento recorre
+    las `total` posiciones y cada movimiento pide únicamente la ventana nueva,
+    que se escribe sobre las filas ya existentes en lugar de borrarlas y
+    volver a insertarlas.
+    """
+    
+    def __init__(self, parent, columnas, anchos, filas=15):
+        self.arbol = ttk.Treeview(parent, columns=columnas, show='headings', height=filas)
+        for col in columnas:
+            self.arbol.heading(col, text=col)
+            ancho, alineacion = anchos.get(col, (100, 'center'))
+            self.arbol.column(col, width=ancho, anchor=alineacion)
+        
+        self.barra = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.desplazar)
+        self.arbol.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.filas = filas
+        self.alto_fila = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        self.inicio = 0
+        self.total = 0
+        self.obtener = None
+        
+        self.arbol.bind('<Configure>', self.redimensionar)
+        self.arbol.bind('<MouseWheel>', lambda e: self.mover(-1 if e.delta > 0 else 1, 'units'))
+        self.arbol.bind('<Button-4>', lambda e: self.mover(-1, 'units'))
+        self.arbol.bind('<Button-5>', lambda e: self.mover(1, 'units'))
+        self.arbol.bind('<Prior>', lambda e: self.mover(-1, 'pages'))
+        self.arbol.bind('<Next>', lambda e: self.mover(1, 'pages'))
+        self.arbol.bind('<Home>', lambda e: self.ir_a(0))
+        self.arbol.bind('<End>', lambda e: self.ir_a(self.total))
+    
+    def mostrar(self, obtener):
+        """Empieza a mostrar otra consulta desde la primera posición"""
+        self.obtener = obtener
+        self.inicio = 0
+        self.refrescar()
+        return self.total
+    
+    def refrescar(self):
+        """Vuelve a pedir la ventana actual (por ejemplo, tras modificar el diccionario)"""
+        if self.obtener is None:
+            return
+        self.total, valores = self.obtener(self.inicio, self.filas)
+        if self.inicio and self.inicio + self.filas > self.total:
+            # La consulta se ha quedado más corta: se ajusta al final
+            self.inicio = max(self.total - self.filas, 0)
+            self.total, valores = self.obtener(self.inicio, self.filas)
+        
+        hijos = self.arbol.get_children()
+        for hijo, fila in zip(hijos, valores):
+            self.arbol.item(hijo, values=fila)
+        for fila in valores[len(hijos):]:
+            self.arbol.insert('', tk.END, values=fila)
+        if len(hijos) > len(valores):
+            self.arbol.delete(*hijos[len(valores):])
+        self.arbol.yview_moveto(0)
+        
+        if self.total:
+            self.barra.set(self.inicio / self.total, (self.inicio + len(valores)) / self.total)
         else:
-            if origen not in self.diccionario:
-                self.diccionario[origen] = {}
-            if destino not in self.diccionario[origen]:
-                self.diccionario[origen][destino] = {}
-            
-            self.diccionario[origen][destino][texto_origen_lower] = nueva_traduccion
-            return "agregada"
+            self.barra.set(0, 1)
+    
+    def ir_a(self, inicio):
+        inicio = max(min(inicio, self.total - self.filas), 0)
+        if inicio != self.inicio:
+            self.inicio = inicio
+            self.refrescar()
+        return 'break'
+    
+    def mover(self, cantidad, unidad):
+        paso = max(self.filas - 1, 1) if unidad == 'pages' else 1
+        return self.ir_a(self.inicio + cantidad * paso)
+    
+    def desplazar(self, accion, cantidad, unidad=None):
+        """Comando de la barra de desplazamiento ('moveto' o 'scroll')"""
+        if accion == 'moveto':
+            self.ir_a(int(float(cantidad) * self.total))
+        else:
+            self.mover(int(cantidad), unidad)
+    
+    def redimensionar(self, evento):
+        # La cabecera ocupa aproximadamente una fila
+        filas = max(evento.height // self.alto_fila - 1, 1)
+        if filas != self.filas:
+            self.filas = filas
+            self.refrescar()
+
+
+class Autocompletado:
+    """
+    Lista de sugerencias bajo un campo de texto.
     
-    def fusionar_diccionario_completo(self, nuevo_diccionario, nuevo_historial):
-        """
-        Fusiona un diccionario completo con el existente
-        Devuelve estadísticas de la fusión
-        """
-        estadisticas = {
-            'total_traducciones_antes': self.obtener_total_traducciones(),
-            'traducciones_agregadas': 0,
-            'traducciones_actualizadas': 0,
-            'errores': 0
-        }
-        
-        for origen, destinos in nuevo_diccionario.items():
-            for destino, traducciones in destinos.items():
-                for texto_origen, nueva_traduccion in traducciones.items():
-                    try:
-                        resultado = self.fusionar_traduccion(origen, destino, texto_origen, nueva_traduccion)
-                        if resultado == "agregada":
-                            estadisticas['traducciones_agregadas'] += 1
-                        elif resultado == "actualizada":
-                            estadisticas['traducciones_actualizadas'] += 1
-                    except Exception as e:
-                        estadisticas['errores'] += 1
-                        print(f"Error fusionando traducción: {e}")
-        
-        if nuevo_historial:
-            self.historial_traducciones.extend(nuevo_historial)
-            self.historial_traducciones.sort(key=lambda x: x['fecha'])
-        
-        estadisticas['total_traducciones_despues'] = self.obtener_total_traducciones()
-        return estadisticas
-    
-    def obtener_total_traducciones(self):
-        """Obtiene el número total de traducciones en el diccionario"""
-        total = 0
-        for destinos in self.diccionario.values():
-            for traducciones in destinos.values():
-                total += len(traducciones)
-        return total
-    
-    def agregar_traduccion(self, idioma_origen, idioma_destino, texto_origen, texto_traduccion):
-        """Agrega una traducción con puntuación inicial por defecto (5)"""
-        self.agregar_traduccion_con_puntuacion(idioma_origen, idioma_destino, texto_origen, texto_traduccion, 5)
-    
-    def agregar_traduccion_con_puntuacion(self, idioma_origen, idioma_destino, texto_origen, texto_traduccion, puntuacion):
-        texto_origen_lower = texto_origen.lower()
-        
-        if idioma_origen not in self.diccionario:
-            self.diccionario[idioma_origen] = {}
-        if idioma_destino not in self.diccionario[idioma_origen]:
-            self.diccionario[idioma_origen][idioma_destino] = {}
-        
-        nueva_traduccion = Traduccion(texto_traduccion)
-        nueva_traduccion.historial_puntuaciones = [puntuacion]
-        nueva_traduccion.puntuacion_promedio = puntuacion
-        
-        self.diccionario[idioma_origen][idioma_destino][texto_origen_lower] = nueva_traduccion
-        
-        self.historial_traducciones.append({
-            'fecha': datetime.now(),
-            'accion': 'agregar',
-            'origen': idioma_origen,
-            'destino': idioma_destino,
-            'texto_origen': texto_origen,
-            'texto_traduccion': texto_traduccion
-        })
-    
-    def traducir(self, idioma_origen, idioma_destino, texto):
-        texto_lower = texto.lower()
-        
-        if (idioma_origen in self.diccionario and 
-            idioma_destino in self.diccionario[idioma_origen] and
-            texto_lower in self.diccionario[idioma_origen][idioma_destino]):
-            
-            traduccion = self.diccionario[idioma_origen][idioma_destino][texto_lower]
-            
-            self.historial_traducciones.append({
-                'fecha': datetime.now(),
-                'accion': 'traducir',
-                'origen': idioma_origen,
-                'destino': idioma_destino,
-                'texto_origen': texto,
-                'texto_traduccion': traduccion.texto,
-                'puntuacion': traduccion.puntuacion_promedio
-            })
-            
-            return traduccion.texto
-        
-        return None
-    
-    def existe_traduccion(self, idioma_origen, idioma_destino, texto):
-        texto_lower = texto.lower()
-        return (idioma_origen in self.diccionario and 
-                idioma_destino in self.diccionario[idioma_origen] and
-                texto_lower in self.diccionario[idioma_origen][idioma_destino])
-    
-    def evaluar_traduccion(self, idioma_origen, idioma_destino, texto, puntuacion):
-        if puntuacion < 1 or puntuacion > 10:
-            return False, "La puntuación debe estar entre 1 y 10"
-        
-        texto_lower = texto.lower()
-        
-        if not self.existe_traduccion(idioma_origen, idioma_destino, texto):
-            return False, "No existe una traducción para ese texto"
-        
-        traduccion = self.diccionario[idioma_origen][idioma_destino][texto_lower]
-        puntuacion_anterior = traduccion.puntuacion_promedio
-        
-        traduccion.actualizar_puntuacion(puntuacion)
-        
-        self.historial_traducciones.append({
-            'fecha': datetime.now(),
-            'accion': 'evaluar',
-            'origen': idioma_origen,
-            'destino': idioma_destino,
-            'texto_origen': texto,
-            'puntuacion': puntuacion,
-            'puntuacion_anterior': puntuacion_anterior
-        })
-        
-        mensaje = (f"Evaluación registrada: {puntuacion}/10\n"
-                f"Puntuación anterior: {puntuacion_anterior:.1f}/10\n"
-                f"Nueva puntuación: {traduccion.puntuacion_promedio:.1f}/10")
-        
-        return True, mensaje
-    
-    def obtener_estadisticas(self):
-        total_traducciones = 0
-        total_evaluaciones = 0
-        puntuacion_global = 0
-        combinaciones_con_traducciones = 0
-        
-        estadisticas_idiomas = {}
-        
-        for idioma in Idioma:
-            estadisticas_idiomas[idioma.value] = {
-                'como_origen': 0,
-                'como_destino': 0,
-                'mejor_puntuacion': 0,
-                'peor_puntuacion': 10
-            }
-        
-        for idioma_origen in self.diccionario:
-            for idioma_destino in self.diccionario[idioma_origen]:
-                traducciones = self.diccionario[idioma_origen][idioma_destino]
-                
-                if traducciones:
-                    total_combinacion = len(traducciones)
-                    total_traducciones += total_combinacion
-                    
-                    estadisticas_idiomas[idioma_origen.value]['como_origen'] += total_combinacion
-                    estadisticas_idiomas[idioma_destino.value]['como_destino'] += total_combinacion
-                    
-                    suma_puntuaciones = 0
-                    for trad in traducciones.values():
-                        suma_puntuaciones += trad.puntuacion_promedio
-                        total_evaluaciones += trad.total_evaluaciones
-                        
-                        if trad.puntuacion_promedio > estadisticas_idiomas[idioma_origen.value]['mejor_puntuacion']:
-                            estadisticas_idiomas[idioma_origen.value]['mejor_puntuacion'] = trad.puntuacion_promedio
-                        if trad.puntuacion_promedio < estadisticas_idiomas[idioma_origen.value]['peor_puntuacion']:
-                            estadisticas_idiomas[idioma_origen.value]['peor_puntuacion'] = trad.puntuacion_promedio
-                    
-                    promedio_combinacion = suma_puntuaciones / len(traducciones) if traducciones else 0
-                    puntuacion_global += promedio_combinacion
-                    combinaciones_con_traducciones += 1
-        
-        puntuacion_global_promedio = puntuacion_global / combinaciones_con_traducciones if combinaciones_con_traducciones > 0 else 0
-        
-        return {
-            'total_traducciones': total_traducciones,
-            'total_evaluaciones': total_evaluaciones,
-            'puntuacion_global': puntuacion_global_promedio,
-            'combinaciones_con_traducciones': combinaciones_con_traducciones,
-            'estadisticas_idiomas': estadisticas_idiomas,
-            'historial_traducciones': len(self.historial_traducciones)
-        }
+    Cada pulsación reprograma una única consulta a `espera` ms vista, así que
+    mientras se escribe deprisa no se busca nada y al parar se busca una sola
+    vez. buscar(prefijo) devuelve [(texto, descripcion)]; elegir una
+    sugerencia (doble clic o Intro; Abajo pasa del campo a la lista) llama a
+    escribir(texto).
+    """
     
-    def obtener_mejores_traducciones(self, idioma_origen, idioma_destino, limite=10):
-        if (idioma_origen not in self.diccionario or 
-            idioma_destino not in self.diccionario[idioma_origen]):
-            return []
-        
-        traducciones = self.diccionario[idioma_origen][idioma_destino]
-        
-        lista_traducciones = [
-            (texto_origen, trad) 
-            for texto_origen, trad in traducciones.items()
-        ]
-        
-        lista_traducciones.sort(key=lambda x: x[1].puntuacion_promedio, reverse=True)
-        
-        return lista_traducciones[:limite]
+    TECLAS_SIN_CAMBIOS = {'Up', 'Down', 'Left', 'Right', 'Escape', 'Return', 'Tab', 'Home', 'End',
+                          'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R'}
     
-    def obtener_peores_traducciones(self, idioma_origen, idioma_destino, limite=10):
-        if (idioma_origen not in self.diccionario or 
-            idioma_destino not in self.diccionario[idioma_origen]):
-            return []
-        
-        traducciones = self.diccionario[idioma_origen][idioma_destino]
-        
-        lista_traducciones = [
-            (texto_origen, trad) 
-            for texto_origen, trad in traducciones.items()
-        ]
-        
-        lista_traducciones.sort(key=lambda x: x[1].puntuacion_promedio)
+    def __init__(self, root, campo, leer, escribir, buscar, despues_de, espera=150, filas=6):
+        self.root = root
+        self.campo = campo
+        self.leer = leer
+        self.escribir = escribir
+        self.buscar = buscar
+        self.despues_de = despues_de
+        self.espera = espera
+        self.pendiente = None
+        self.textos = []
+        
+        self.lista = tk.Listbox(despues_de.master, height=filas, font=('Arial', 10))
+        self.lista.bind('<Double-Button-1>', self.elegir)
+        self.lista.bind('<Return>', self.elegir)
+        self.lista.bind('<Escape>', lambda e: self.ocultar(enfocar_campo=True))
+        
+        campo.bind('<KeyRelease>', self.al_escribir, add='+')
+        campo.bind('<Down>', self.bajar, add='+')
+        campo.bind('<Escape>', lambda e: self.ocultar(), add='+')
+    
+    def al_escribir(self, event):
+        if event.keysym in self.TECLAS_SIN_CAMBIOS:
+            return
+        if self.pendiente is not None:
+            self.root.after_cancel(self.pendiente)
+        self.pendiente = self.root.after(self.espera, self.actualizar)
+    
+    def actualizar(self):
+        self.pendiente = None
+        prefijo = self.leer().strip()
+        sugerencias = self.buscar(prefijo) if prefijo else []
+        if not sugerencias:
+            self.ocultar()
+            return
         
-        return lista_traducciones[:limite]
-    
-    def guardar_diccionario_binario(self, archivo):
-        try:
-            datos_serializables = {}
-            
-            for idioma_origen in self.diccionario:
-                datos_serializables[idioma_origen.value] = {}
-                
-                for idioma_destino in self.diccionario[idioma_origen]:
-                    datos_serializables[idioma_origen.value][idioma_destino.value] = {}
-                    
-                    for texto, traduccion in self.diccionario[idioma_origen][idioma_destino].items():
-                        datos_serializables[idioma_origen.value][idioma_destino.value][texto] = traduccion.to_dict()
-            
-            historial_serializable = []
-            for registro in self.historial_traducciones:
-                registro_copy = registro.copy()
-                registro_copy['fecha'] = registro_copy['fecha'].isoformat()
-                if 'origen' in registro_copy and isinstance(registro_copy['origen'], Idioma):
-                    registro_copy['origen'] = registro_copy['origen'].value
-                if 'destino' in registro_copy and isinstance(registro_copy['destino'], Idioma):
-                    registro_copy['destino'] = registro_copy['destino'].value
-                historial_serializable.append(registro_copy)
-            
-            datos_completos = {
-                'diccionario': datos_serializables,
-                'historial': historial_serializable,
-                'fecha_guardado': datetime.now().isoformat()
-            }
-            
-            with open(archivo, 'wb') as f:
-                pickle.dump(datos_completos, f)
-            
-            return True, f"Diccionario guardado exitosamente en {archivo}"
-            
-        except Exception as e:
-            return False, f"Error al guardar el diccionario: {str(e)}"
-    
-    def cargar_diccionario_binario(self, archivo, fusionar=True):
-        try:
-            with open(archivo, 'rb') as f:
-                datos_completos = pickle.load(f)
-            diccionario_nuevo = {}
-            historial_nuevo = []
-            
-            for idioma_origen_str, destinos in datos_completos['diccionario'].items():
-                idioma_origen = None
-                for idioma in Idioma:
-                    if idioma.value == idioma_origen_str:
-                        idioma_origen = idioma
-                        break
-                
-                if idioma_origen is None:
-                    continue
-                
-                diccionario_nuevo[idioma_origen] = {}
-                
-                for idioma_destino_str, traducciones in destinos.items():
-                    idioma_destino = None
-                    for idioma in Idioma:
-                        if idioma.value == idioma_destino_str:
-                            idioma_destino = idioma
-                            break
-                    
-                    if idioma_destino is None:
-                        continue
-                    
-                    diccionario_nuevo[idioma_origen][idioma_destino] = {}
-                    
-                    for texto, datos_traduccion in traducciones.items():
-                        diccionario_nuevo[idioma_origen][idioma_destino][texto] = Traduccion.from_dict(datos_traduccion)
-            
-            for registro in datos_completos.get('historial', []):
-                registro_copy = registro.copy()
-                registro_copy['fecha'] = datetime.fromisoformat(registro_copy['fecha'])
-                
-                if 'origen' in registro_copy and isinstance(registro_copy['origen'], str):
-                    for idioma in Idioma:
-                        if idioma.value == registro_copy['origen']:
-                            registro_copy['origen'] = idioma
-                            break
-                
-                if 'destino' in registro_copy and isinstance(registro_copy['destino'], str):
-                    for idioma in Idioma:
-                        if idioma.value == registro_copy['destino']:
-                            registro_copy['destino'] = idioma
-                            break
-                
-                historial_nuevo.append(registro_copy)
-            
-            if fusionar:
-                estadisticas = self.fusionar_diccionario_completo(diccionario_nuevo, historial_nuevo)
-                
-                mensaje = (f"Diccionario fusionado exitosamente desde {archivo}\n\n"
-                        f"Estadísticas de fusión:\n"
-                        f"• Traducciones antes: {estadisticas['total_traducciones_antes']}\n"
-                        f"• Traducciones agregadas: {estadisticas['traducciones_agregadas']}\n"
-                        f"• Traducciones actualizadas: {estadisticas['traducciones_actualizadas']}\n"
-                        f"• Traducciones después: {estadisticas['total_traducciones_despues']}\n"
-                        f"• Errores: {estadisticas['errores']}")
-                
-                return True, mensaje
-            else:
-                self.diccionario = diccionario_nuevo
-                self.historial_traducciones = historial_nuevo
-                return True, f"Diccionario reemplazado exitosamente desde {archivo}"
-            
-        except FileNotFoundError:
-            return False, f"Archivo no encontrado: {archivo}"
-        except Exception as e:
-            return False, f"Error al cargar el diccionario: {str(e)}"
-    
-    def guardar_diccionario_json(self, archivo):
-        try:
-            datos_serializables = {}
-            
-            for idioma_origen in self.diccionario:
-                datos_serializables[idioma_origen.value] = {}
-                
-                for idioma_destino in self.diccionario[idioma_origen]:
-                    datos_serializables[idioma_origen.value][idioma_destino.value] = {}
-                    
-                    for texto, traduccion in self.diccionario[idioma_origen][idioma_destino].items():
-                        datos_serializables[idioma_origen.value][idioma_destino.value][texto] = traduccion.to_dict()
-            
-            historial_serializable = []
-            for registro in self.historial_traducciones:
-                registro_copy = registro.copy()
-                registro_copy['fecha'] = registro_copy['fecha'].isoformat()
-                if 'origen' in registro_copy and isinstance(registro_copy['origen'], Idioma):
-                    registro_copy['origen'] = registro_copy['origen'].value
-                if 'destino' in registro_copy and isinstance(registro_copy['destino'], Idioma):
-                    registro_copy['destino'] = registro_copy['destino'].value
-                historial_serializable.append(registro_copy)
-            
-            datos_completos = {
-                'diccionario': datos_serializables,
-                'historial': historial_serializable,
-                'fecha_guardado': datetime.now().isoformat(),
-                'version': '1.0'
-            }
-            
-            with open(archivo, 'w', encoding='utf-8') as f:
-                json.dump(datos_completos, f, ensure_ascii=False, indent=2)
-            
-            return True, f"Diccionario guardado en formato JSON en {archivo}"
-            
-        except Exception as e:
-            return False, f"Error al guardar el diccionario JSON: {str(e)}"
-    
-    def cargar_diccionario_json(self, archivo, fusionar=True):
-        try:
-            with open(archivo, 'r', encoding='utf-8') as f:
-                datos_completos = json.load(f)
-            
-            diccionario_nuevo = {}
-            historial_nuevo = []
-            
-            for idioma_origen_str, destinos in datos_completos['diccionario'].items():
-                idioma_origen = None
-                for idioma in Idioma:
-                    if idioma.value == idioma_origen_str:
-                        idioma_origen = idioma
-                        break
-                
-                if idioma_origen is None:
-                    continue
-                
-                diccionario_nuevo[idioma_origen] = {}
-                
-                for idioma_destino_str, traducciones in destinos.items():
-                    idioma_destino = None
-                    for idioma in Idioma:
-                        if idioma.value == idioma_destino_str:
-                            idioma_destino = idioma
-                            break
-                    
-                    if idioma_destino is None:
-                        continue
-                    
-                    diccionario_nuevo[idioma_origen][idioma_destino] = {}
-                    
-                    for texto, datos_traduccion in traducciones.items():
-                        diccionario_nuevo[idioma_origen][idioma_destino][texto] = Traduccion.from_dict(datos_traduccion)
-            
-            if 'historial' in datos_completos:
-                for registro in datos_completos['historial']:
-                    registro_copy = registro.copy()
-                    registro_copy['fecha'] = datetime.fromisoformat(registro_copy['fecha'])
-                    
-                    if 'origen' in registro_copy and isinstance(registro_copy['origen'], str):
-                        for idioma in Idioma:
-                            if idioma.value == registro_copy['origen']:
-                                registro_copy['origen'] = idioma
-                                break
-                    
-                    if 'destino' in registro_copy and isinstance(registro_copy['destino'], str):
-                        for idioma in Idioma:
-                            if idioma.value == registro_copy['destino']:
-                                registro_copy['destino'] = idioma
-                                break
-                    
-                    historial_nuevo.append(registro_copy)
-            
-            if fusionar:
-                estadisticas = self.fusionar_diccionario_completo(diccionario_nuevo, historial_nuevo)
-                
-                mensaje = (f"Diccionario fusionado exitosamente desde JSON: {archivo}\n\n"
-                        f"Estadísticas de fusión:\n"
-                        f"• Traducciones antes: {estadisticas['total_traducciones_antes']}\n"
-                        f"• Traducciones agregadas: {estadisticas['traducciones_agregadas']}\n"
-                        f"• Traducciones actualizadas: {estadisticas['traducciones_actualizadas']}\n"
-                        f"• Traducciones después: {estadisticas['total_traducciones_despues']}\n"
-                        f"• Errores: {estadisticas['errores']}")
-                
-                return True, mensaje
-            else: 
-                self.diccionario = diccionario_nuevo
-                self.historial_traducciones = historial_nuevo
-                return True, f"Diccionario reemplazado desde JSON: {archivo}"
-            
-        except FileNotFoundError:
-            return False, f"Archivo no encontrado: {archivo}"
-        except json.JSONDecodeError:
-            return False, f"Error en el formato JSON del archivo: {archivo}"
-        except Exception as e:
-            return False, f"Error al cargar el diccionario JSON: {str(e)}"
-    
-    def exportar_traducciones_texto(self, archivo):
-        try:
-            estadisticas = self.obtener_estadisticas()
-            
-            with open(archivo, 'w', encoding='utf-8') as f:
-                f.write("=" * 60 + "\n")
-                f.write("DICCIONARIO DE TRADUCCIONES - TRADUCTOR CON APRENDIZAJE\n")
-                f.write("=" * 60 + "\n\n")
-                f.write(f"Fecha de exportación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total de traducciones: {estadisticas['total_traducciones']}\n")
-                f.write(f"Puntuación global promedio: {estadisticas['puntuacion_global']:.2f}/10\n\n")
-                
-                for idioma_origen in Idioma:
-                    for idioma_destino in Idioma:
-                        if idioma_origen != idioma_destino:
-                            traducciones = self.diccionario.get(idioma_origen, {}).get(idioma_destino, {})
-                            
-                            if traducciones:
-                                f.write(f"\n{idioma_origen.value.upper()} → {idioma_destino.value.upper()}:\n")
-                                f.write("-" * 40 + "\n")
-                                
-                                lista_traducciones = sorted(
-                                    traducciones.items(),
-                                    key=lambda x: x[1].puntuacion_promedio,
-                                    reverse=True
-                                )
-                                
-                                for texto_origen, traduccion in lista_traducciones:
-                                    f.write(f"  {texto_origen:20} → {traduccion.texto:20} ")
-                                    f.write(f"[{traduccion.puntuacion_promedio:.1f}/10, {traduccion.total_evaluaciones} eval.]\n")
-            
-            return True, f"Traducciones exportadas a {archivo}"
-            
-        except Exception as e:
-            return False, f"Error al exportar traducciones: {str(e)}"
+        self.textos = [texto for texto, _ in sugerencias]
+        self.lista.delete(0, tk.END)
+        self.lista.insert(tk.END, *[descripcion for _, descripcion in sugerencias])
+        if not self.lista.winfo_ismapped():
+            self.lista.pack(after=self.despues_de, fill=tk.X, pady=(5, 0))
+    
+    def ocultar(self, enfocar_campo=False):
+        if self.pendiente is not None:
+            self.root.after_cancel(self.pendiente)
+            self.pendiente = None
+        self.lista.pack_forget()
+        if enfocar_campo:
+            self.campo.focus_set()
+    
+    def bajar(self, event):
+        if not self.lista.winfo_ismapped():
+            return None
+        self.lista.focus_set()
+        self.lista.selection_clear(0, tk.END)
+        self.lista.selection_set(0)
+        self.lista.activate(0)
+        return 'break'
+    
+    def elegir(self, event=None):
+        seleccion = self.lista.curselection()
+        if not seleccion:
+            return
+        texto = self.textos[seleccion[0]]
+        self.ocultar(enfocar_campo=True)
+        self.escribir(texto)
 
-    def limpiar_diccionario(self):
-        """Limpia completamente el diccionario y el historial"""
-        self.diccionario = {}
-        self.historial_traducciones = []
-        self.inicializar_diccionario()
-        return True, "Diccionario limpiado exitosamente"
 
 class TraductorAprendizajeGUI:
     def __init__(self, root):
@@ -638,19 +195,32 @@ class TraductorAprendizajeGUI:
         self.root.state('zoomed')
         self.root.configure(bg="#f0f0f0")
         self.autosave_file = "autosave_traductor.json"
-        self.traductor = TraductorAprendizaje()
+        # Concurrente: cargar, guardar y exportar se ejecutan en un hilo aparte
+        self.traductor = TraductorAprendizajeConcurrente()
+        self.tarea = None
+        self.cola_tarea = queue.Queue()
+        self.cancelacion_tarea = threading.Event()
+        self.paneles_progreso = []
+        self.mensaje_estado = None
+        self.temporizador_estado = None
+        self.refresco_estado_pendiente = False
+        # Pares cuyos índices de autocompletado ya se han adelantado
+        self.pares_preparados = set()
         self.cargar_autoguardado()
         self.modo_fusion = tk.BooleanVar(value=True)
+        self.combos_idioma = []
+        self.combos_filtro_idioma = []
         self.setup_icons()
         self.setup_styles()
         self.setup_ui()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def cargar_autoguardado(self):
-        """Carga el estado guardado automáticamente"""
-        if os.path.exists(self.autosave_file):
+        """Carga el estado guardado automáticamente, o su copia anterior si está dañado"""
+        if os.path.exists(self.autosave_file) or os.path.exists(ruta_anterior(self.autosave_file)):
             try:
-                exito, mensaje = self.traductor.cargar_diccionario_json(self.autosave_file, fusionar=False)
+                exito, mensaje = self.traductor.cargar_diccionario_json(self.autosave_file, fusionar=False,
+                                                                        respaldo=True)
                 if exito:
                     print("Autoguardado cargado:", mensaje)
                 else:
@@ -661,7 +231,7 @@ class TraductorAprendizajeGUI:
     def guardar_autoguardado(self):
         """Guarda el estado actual en el archivo de autoguardado"""
         try:
-            exito, mensaje = self.traductor.guardar_diccionario_json(self.autosave_file)
+            exito, mensaje = self.traductor.guardar_diccionario_json(self.autosave_file, conservar_anterior=True)
             if exito:
                 print("Autoguardado realizado:", mensaje)
             else:
@@ -671,6 +241,7 @@ class TraductorAprendizajeGUI:
     
     def on_closing(self):
         """Maneja el cierre de la ventana"""
+        self.cancelacion_tarea.set()
         self.guardar_autoguardado()
         self.root.destroy()
     
@@ -780,6 +351,7 @@ class TraductorAprendizajeGUI:
         origen_combo = ttk.Combobox(origen_frame, textvariable=self.origen_var, 
                                 values=[idioma.value for idioma in Idioma], 
                                 state="readonly", width=15)
+        self.combos_idioma.append(origen_combo)
         origen_combo.pack(side=tk.LEFT)
         
         destino_frame = ttk.Frame(lang_frame)
@@ -790,6 +362,7 @@ class TraductorAprendizajeGUI:
         destino_combo = ttk.Combobox(destino_frame, textvariable=self.destino_var,
                                     values=[idioma.value for idioma in Idioma],
                                     state="readonly", width=15)
+        self.combos_idioma.append(destino_combo)
         destino_combo.pack(side=tk.LEFT)
         
         text_frame = ttk.LabelFrame(main_frame, text="Texto a Traducir", padding=10)
@@ -798,6 +371,13 @@ class TraductorAprendizajeGUI:
         self.texto_entrada = scrolledtext.ScrolledText(text_frame, height=4, font=('Arial', 10))
         self.texto_entrada.pack(fill=tk.BOTH, expand=True)
         
+        def escribir_entrada(texto):
+            self.texto_entrada.delete("1.0", tk.END)
+            self.texto_entrada.insert("1.0", texto)
+        
+        self.crear_autocompletado(self.texto_entrada, lambda: self.texto_entrada.get("1.0", "end-1c"),
+                                  escribir_entrada, self.origen_var, self.destino_var, text_frame)
+        
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(0, 20))
         
@@ -1019,6 +599,7 @@ class TraductorAprendizajeGUI:
         origen_combo = ttk.Combobox(origen_frame, textvariable=self.eval_origen_var,
                                 values=[idioma.value for idioma in Idioma],
                                 state="readonly", width=15)
+        self.combos_idioma.append(origen_combo)
         origen_combo.pack(side=tk.LEFT)
         
         destino_frame = ttk.Frame(select_frame)
@@ -1029,6 +610,7 @@ class TraductorAprendizajeGUI:
         destino_combo = ttk.Combobox(destino_frame, textvariable=self.eval_destino_var,
                                     values=[idioma.value for idioma in Idioma],
                                     state="readonly", width=15)
+        self.combos_idioma.append(destino_combo)
         destino_combo.pack(side=tk.LEFT)
         
         texto_frame = ttk.Frame(select_frame)
@@ -1039,6 +621,13 @@ class TraductorAprendizajeGUI:
         texto_entry = ttk.Entry(texto_frame, textvariable=self.eval_texto_var, width=40)
         texto_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
+        def escribir_texto(texto):
+            self.eval_texto_var.set(texto)
+            self.buscar_traduccion_evaluar()
+        
+        self.crear_autocompletado(texto_entry, self.eval_texto_var.get, escribir_texto,
+                                  self.eval_origen_var, self.eval_destino_var, texto_frame)
+        
         ttk.Button(select_frame, text="Buscar Traducción", 
                 command=self.buscar_traduccion_evaluar,
                 style='Primary.TButton').pack(pady=(10, 0))
@@ -1054,6 +643,33 @@ class TraductorAprendizajeGUI:
         
         ttk.Button(button_frame, text="Limpiar", command=self.limpiar_evaluar).pack(side=tk.LEFT)
     
+    def crear_autocompletado(self, campo, leer, escribir, origen_var, destino_var, despues_de):
+        """Sugerencias por prefijo para el par elegido en origen_var/destino_var"""
+        def par():
+            origen = self.string_to_idioma(origen_var.get())
+            destino = self.string_to_idioma(destino_var.get())
+            return (origen, destino) if origen != destino else None
+        
+        def buscar(prefijo):
+            idiomas = par()
+            if idiomas is None:
+                return []
+            return [(texto, f"{texto} → {traduccion.texto}  ({traduccion.puntuacion_promedio:.1f}/10)")
+                    for texto, traduccion in self.traductor.autocompletar(*idiomas, prefijo, SUGERENCIAS)]
+        
+        def preparar(event):
+            # Los índices del par se crean en la primera consulta; con
+            # diccionarios grandes se adelanta en otro hilo para no frenar la
+            # primera pulsación. Sólo una vez por par (ver pares_preparados)
+            idiomas = par()
+            if idiomas is not None and idiomas not in self.pares_preparados:
+                self.pares_preparados.add(idiomas)
+                threading.Thread(target=self.traductor.autocompletar, args=(*idiomas, "", 1),
+                                 daemon=True).start()
+        
+        campo.bind('<FocusIn>', preparar, add='+')
+        return Autocompletado(self.root, campo, leer, escribir, buscar, despues_de)
+    
     def buscar_traduccion_evaluar(self):
         """Buscar traducción para evaluar"""
         texto = self.eval_texto_var.get().strip()
@@ -1155,6 +771,7 @@ class TraductorAprendizajeGUI:
         origen_combo = ttk.Combobox(origen_frame, textvariable=self.add_origen_var,
                                 values=[idioma.value for idioma in Idioma],
                                 state="readonly", width=15)
+        self.combos_idioma.append(origen_combo)
         origen_combo.pack(side=tk.LEFT)
         
         destino_frame = ttk.Frame(data_frame)
@@ -1165,6 +782,7 @@ class TraductorAprendizajeGUI:
         destino_combo = ttk.Combobox(destino_frame, textvariable=self.add_destino_var,
                                     values=[idioma.value for idioma in Idioma],
                                     state="readonly", width=15)
+        self.combos_idioma.append(destino_combo)
         destino_combo.pack(side=tk.LEFT)
         
         texto_frame = ttk.Frame(data_frame)
@@ -1266,6 +884,7 @@ class TraductorAprendizajeGUI:
         origen_combo = ttk.Combobox(control_frame, textvariable=self.best_origen_var,
                                 values=[idioma.value for idioma in Idioma],
                                 state="readonly", width=15)
+        self.combos_idioma.append(origen_combo)
         origen_combo.pack(side=tk.LEFT, padx=(0, 20))
         
         ttk.Label(control_frame, text="Idioma Destino:").pack(side=tk.LEFT, padx=(0, 10))
@@ -1273,14 +892,9 @@ class TraductorAprendizajeGUI:
         destino_combo = ttk.Combobox(control_frame, textvariable=self.best_destino_var,
                                     values=[idioma.value for idioma in Idioma],
                                     state="readonly", width=15)
+        self.combos_idioma.append(destino_combo)
         destino_combo.pack(side=tk.LEFT, padx=(0, 20))
         
-        ttk.Label(control_frame, text="Mostrar:").pack(side=tk.LEFT, padx=(0, 10))
-        self.best_limit_var = tk.StringVar(value="10")
-        limit_spin = ttk.Spinbox(control_frame, from_=1, to=50, textvariable=self.best_limit_var,
-                                width=5)
-        limit_spin.pack(side=tk.LEFT)
-        
         ttk.Button(control_frame, text="Buscar Mejores", 
                 command=self.buscar_mejores,
                 style='Primary.TButton').pack(side=tk.LEFT, padx=(20, 0))
@@ -1288,24 +902,7 @@ class TraductorAprendizajeGUI:
         result_frame = ttk.LabelFrame(main_frame, text="Resultados", padding=10)
         result_frame.pack(fill=tk.BOTH, expand=True)
         
-        columns = ('#', 'Texto Original', 'Traducción', 'Puntuación', 'Evaluaciones')
-        self.best_tree = ttk.Treeview(result_frame, columns=columns, show='headings', height=15)
-        
-        for col in columns:
-            self.best_tree.heading(col, text=col)
-            self.best_tree.column(col, width=100, anchor='center')
-        
-        self.best_tree.column('#', width=50, anchor='center')
-        self.best_tree.column('Texto Original', width=200, anchor='w')
-        self.best_tree.column('Traducción', width=200, anchor='w')
-        self.best_tree.column('Puntuación', width=100, anchor='center')
-        self.best_tree.column('Evaluaciones', width=100, anchor='center')
-        
-        scrollbar = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.best_tree.yview)
-        self.best_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.best_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.best_lista = self.crear_lista_ranking(result_frame)
     
     def buscar_mejores(self):
         """Buscar las mejores traducciones"""
@@ -1315,26 +912,9 @@ class TraductorAprendizajeGUI:
         origen = self.string_to_idioma(origen_str)
         destino = self.string_to_idioma(destino_str)
         
-        try:
-            limite = int(self.best_limit_var.get())
-        except ValueError:
-            limite = 10
+        total = self.best_lista.mostrar(self.pagina_ranking(origen, destino, True))
         
-        mejores = self.traductor.obtener_mejores_traducciones(origen, destino, limite)
-        
-        for item in self.best_tree.get_children():
-            self.best_tree.delete(item)
-        
-        for i, (texto_origen, traduccion) in enumerate(mejores, 1):
-            self.best_tree.insert('', tk.END, values=(
-                i,
-                texto_origen,
-                traduccion.texto,
-                f"{traduccion.puntuacion_promedio:.1f}/10",
-                traduccion.total_evaluaciones
-            ))
-        
-        self.update_status(f"Mostrando {len(mejores)} mejores traducciones")
+        self.update_status(f"{total} mejores traducciones (desplázate para ver más)")
     
     def create_peores_tab(self):
         """Crear pestaña de peores traducciones"""
@@ -1356,6 +936,7 @@ class TraductorAprendizajeGUI:
         origen_combo = ttk.Combobox(control_frame, textvariable=self.worst_origen_var,
                                 values=[idioma.value for idioma in Idioma],
                                 state="readonly", width=15)
+        self.combos_idioma.append(origen_combo)
         origen_combo.pack(side=tk.LEFT, padx=(0, 20))
         
         ttk.Label(control_frame, text="Idioma Destino:").pack(side=tk.LEFT, padx=(0, 10))
@@ -1363,14 +944,9 @@ class TraductorAprendizajeGUI:
         destino_combo = ttk.Combobox(control_frame, textvariable=self.worst_destino_var,
                                     values=[idioma.value for idioma in Idioma],
                                     state="readonly", width=15)
+        self.combos_idioma.append(destino_combo)
         destino_combo.pack(side=tk.LEFT, padx=(0, 20))
         
-        ttk.Label(control_frame, text="Mostrar:").pack(side=tk.LEFT, padx=(0, 10))
-        self.worst_limit_var = tk.StringVar(value="10")
-        limit_spin = ttk.Spinbox(control_frame, from_=1, to=50, textvariable=self.worst_limit_var,
-                                width=5)
-        limit_spin.pack(side=tk.LEFT)
-        
         ttk.Button(control_frame, text="Buscar Peores", 
                 command=self.buscar_peores,
                 style='Warning.TButton').pack(side=tk.LEFT, padx=(20, 0))
@@ -1378,24 +954,7 @@ class TraductorAprendizajeGUI:
         result_frame = ttk.LabelFrame(main_frame, text="Resultados", padding=10)
         result_frame.pack(fill=tk.BOTH, expand=True)
         
-        columns = ('#', 'Texto Original', 'Traducción', 'Puntuación', 'Evaluaciones')
-        self.worst_tree = ttk.Treeview(result_frame, columns=columns, show='headings', height=15)
-        
-        for col in columns:
-            self.worst_tree.heading(col, text=col)
-            self.worst_tree.column(col, width=100, anchor='center')
-        
-        self.worst_tree.column('#', width=50, anchor='center')
-        self.worst_tree.column('Texto Original', width=200, anchor='w')
-        self.worst_tree.column('Traducción', width=200, anchor='w')
-        self.worst_tree.column('Puntuación', width=100, anchor='center')
-        self.worst_tree.column('Evaluaciones', width=100, anchor='center')
-        
-        scrollbar = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.worst_tree.yview)
-        self.worst_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.worst_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.worst_lista = self.crear_lista_ranking(result_frame)
     
     def buscar_peores(self):
         """Buscar las peores traducciones"""
@@ -1405,26 +964,23 @@ class TraductorAprendizajeGUI:
         origen = self.string_to_idioma(origen_str)
         destino = self.string_to_idioma(destino_str)
         
-        try:
-            limite = int(self.worst_limit_var.get())
-        except ValueError:
-            limite = 10
-        
-        peores = self.traductor.obtener_peores_traducciones(origen, destino, limite)
-        
-        for item in self.worst_tree.get_children():
-            self.worst_tree.delete(item)
-        
-        for i, (texto_origen, traduccion) in enumerate(peores, 1):
-            self.worst_tree.insert('', tk.END, values=(
-                i,
-                texto_origen,
-                traduccion.texto,
-                f"{traduccion.puntuacion_promedio:.1f}/10",
-                traduccion.total_evaluaciones
-            ))
+        total = self.worst_lista.mostrar(self.pagina_ranking(origen, destino, False))
         
-        self.update_status(f"Mostrando {len(peores)} traducciones que necesitan mejora")
+        self.update_status(f"{total} traducciones que necesitan mejora (desplázate para ver más)")
+    
+    def crear_lista_ranking(self, parent):
+        columnas = ('#', 'Texto Original', 'Traducción', 'Puntuación', 'Evaluaciones')
+        anchos = {'#': (70, 'center'), 'Texto Original': (200, 'w'), 'Traducción': (200, 'w')}
+        return ListaVirtual(parent, columnas, anchos)
+    
+    def pagina_ranking(self, origen, destino, mejores):
+        """obtener(inicio, cantidad) para ListaVirtual sobre el índice ordenado del par"""
+        def obtener(inicio, cantidad):
+            total, pagina = self.traductor.obtener_pagina_traducciones(origen, destino, inicio, cantidad, mejores)
+            return total, [(i, texto_origen, traduccion.texto,
+                            f"{traduccion.puntuacion_promedio:.1f}/10", traduccion.total_evaluaciones)
+                           for i, (texto_origen, traduccion) in enumerate(pagina, inicio + 1)]
+        return obtener
     
     def create_guardar_cargar_tab(self):
         """Crear pestaña para guardar y cargar diccionarios"""
@@ -1496,6 +1052,8 @@ class TraductorAprendizajeGUI:
         ttk.Button(options_frame, text="Limpiar Diccionario", 
                 command=self.limpiar_diccionario_gui,
                 style='Warning.TButton').pack(side=tk.LEFT)
+        
+        self.crear_panel_progreso(main_frame)
     
     def actualizar_modo_fusion(self):
         """Actualizar el modo de fusión en la barra de estado"""
@@ -1537,7 +1095,8 @@ class TraductorAprendizajeGUI:
         info_frame.pack(fill=tk.X, pady=(0, 20))
         
         info_text = "Exporte todas las traducciones a un archivo de texto legible.\n" \
-                "El archivo contendrá todas las traducciones organizadas por idiomas."
+                "El archivo contendrá todas las traducciones organizadas por idiomas.\n" \
+                "Con extensión .tsv, .csv, .jsonl o .tmx se exporta en ese formato."
         
         ttk.Label(info_frame, text=info_text, justify=tk.LEFT).pack()
         
@@ -1555,11 +1114,14 @@ class TraductorAprendizajeGUI:
         ttk.Button(main_frame, text="Exportar Traducciones", 
                 command=self.exportar_traducciones_gui,
                 style='Success.TButton').pack()
+        
+        self.crear_panel_progreso(main_frame)
     
     def create_historial_tab(self):
         """Crear pestaña de historial"""
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text=f"{self.icons['history']} Historial")
+        self.hist_tab = tab
         
         main_frame = ttk.Frame(tab)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -1568,64 +1130,194 @@ class TraductorAprendizajeGUI:
                             style='Title.TLabel')
         title_label.pack(pady=(0, 20))
         
-        ttk.Button(main_frame, text="Actualizar Historial", 
-                command=self.actualizar_historial,
-                style='Primary.TButton').pack(pady=(0, 20))
-        
-        hist_frame = ttk.LabelFrame(main_frame, text="Últimas Acciones", padding=10)
+        filter_frame = ttk.Frame(main_frame)
+        filter_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(filter_frame, text="Acción:").pack(side=tk.LEFT, padx=(0, 10))
+        self.hist_accion_var = tk.StringVar(value=TODOS)
+        ttk.Combobox(filter_frame, textvariable=self.hist_accion_var,
+                    values=[TODOS, 'traducir', 'evaluar', 'agregar'],
+                    state="readonly", width=10).pack(side=tk.LEFT, padx=(0, 20))
+        
+        ttk.Label(filter_frame, text="Par:").pack(side=tk.LEFT, padx=(0, 10))
+        self.hist_origen_var = tk.StringVar(value=TODOS)
+        self.hist_destino_var = tk.StringVar(value=TODOS)
+        for variable in (self.hist_origen_var, self.hist_destino_var):
+            combo = ttk.Combobox(filter_frame, textvariable=variable,
+                                values=[TODOS] + [idioma.value for idioma in Idioma],
+                                state="readonly", width=12)
+            self.combos_filtro_idioma.append(combo)
+            combo.pack(side=tk.LEFT, padx=(0, 5))
+        
+        ttk.Label(filter_frame, text="Texto:").pack(side=tk.LEFT, padx=(15, 10))
+        self.hist_texto_var = tk.StringVar()
+        texto_entry = ttk.Entry(filter_frame, textvariable=self.hist_texto_var, width=25)
+        texto_entry.pack(side=tk.LEFT)
+        texto_entry.bind('<Return>', lambda e: self.actualizar_historial(0))
+        
+        ttk.Button(filter_frame, text="Filtrar", 
+                command=lambda: self.actualizar_historial(0),
+                style='Primary.TButton').pack(side=tk.LEFT, padx=(20, 0))
+        ttk.Button(filter_frame, text="Actualizar Historial", 
+                command=self.actualizar_historial).pack(side=tk.LEFT, padx=(10, 0))
+        
+        nav_frame = ttk.Frame(main_frame)
+        nav_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Button(nav_frame, text="⏮ Más recientes",
+                command=lambda: self.actualizar_historial(0)).pack(side=tk.LEFT)
+        ttk.Button(nav_frame, text="◀ Anterior",
+                command=lambda: self.actualizar_historial(self.hist_pagina - 1)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(nav_frame, text="Siguiente ▶",
+                command=lambda: self.actualizar_historial(self.hist_pagina + 1)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(nav_frame, text="Más antiguos ⏭",
+                command=lambda: self.actualizar_historial(self.hist_paginas - 1)).pack(side=tk.LEFT, padx=(5, 20))
+        
+        ttk.Label(nav_frame, text="Página:").pack(side=tk.LEFT, padx=(0, 5))
+        self.hist_pagina_var = tk.StringVar(value="1")
+        pagina_spin = ttk.Spinbox(nav_frame, from_=1, to=1, textvariable=self.hist_pagina_var, width=7,
+                                command=self.ir_a_pagina_historial)
+        pagina_spin.pack(side=tk.LEFT)
+        pagina_spin.bind('<Return>', lambda e: self.ir_a_pagina_historial())
+        self.hist_pagina_spin = pagina_spin
+        
+        self.hist_info = ttk.Label(nav_frame, text="")
+        self.hist_info.pack(side=tk.LEFT, padx=(20, 0))
+        
+        hist_frame = ttk.LabelFrame(main_frame, text="Acciones (de la más reciente a la más antigua)", padding=10)
         hist_frame.pack(fill=tk.BOTH, expand=True)
         
         self.hist_text = scrolledtext.ScrolledText(hist_frame, height=20, font=('Arial', 10))
         self.hist_text.pack(fill=tk.BOTH, expand=True)
-    
-    def actualizar_historial(self):
-        """Actualizar y mostrar historial"""
-        if not self.traductor.historial_traducciones:
-            self.hist_text.delete("1.0", tk.END)
-            self.hist_text.insert("1.0", "No hay historial registrado.")
-            return
         
-        historial_reciente = self.traductor.historial_traducciones[-50:]
+        # Página y filtros con que se dibujó el texto, lista de historial de la
+        # que salió y líneas que ocupa cada registro (para recortar por el final)
+        self.hist_pagina = 0
+        self.hist_paginas = 1
+        self.hist_consulta = None
+        self.hist_registros = None
+        self.hist_ultima_posicion = -1
+        self.hist_lineas = []
         
-        self.hist_text.delete("1.0", tk.END)
-        self.hist_text.insert("1.0", f"Últimas {len(historial_reciente)} acciones:\n")
-        self.hist_text.insert(tk.END, "=" * 60 + "\n\n")
+        self.notebook.bind('<<NotebookTabChanged>>', self.al_cambiar_pestana, add='+')
+    
+    def al_cambiar_pestana(self, event):
+        if self.notebook.select() == str(self.hist_tab):
+            self.actualizar_historial()
+    
+    def ir_a_pagina_historial(self):
+        try:
+            pagina = int(self.hist_pagina_var.get()) - 1
+        except ValueError:
+            pagina = self.hist_pagina
+        self.actualizar_historial(pagina)
+    
+    def filtros_historial(self):
+        origen = IDIOMAS_POR_VALOR.get(self.hist_origen_var.get())
+        destino = IDIOMAS_POR_VALOR.get(self.hist_destino_var.get())
+        accion = self.hist_accion_var.get()
+        return {
+            'accion': None if accion == TODOS else accion,
+            # El par sólo filtra con los dos idiomas elegidos
+            'origen': origen if destino else None,
+            'destino': destino if origen else None,
+            'texto': self.hist_texto_var.get().strip() or None,
+        }
+    
+    def formatear_registro(self, posicion, registro):
+        """Texto de un registro del historial; posicion + 1 es su número, que no cambia"""
+        fecha_str = registro['fecha'].strftime("%Y-%m-%d %H:%M:%S")
+        accion = registro['accion']
+        
+        if accion == 'traducir':
+            lineas = [f"{posicion + 1}. [{fecha_str}] 📝 Traducir",
+                      f"     {registro['origen'].value} → {registro['destino'].value}",
+                      f"     \"{registro['texto_origen']}\" → \"{registro['texto_traduccion']}\""]
+            if 'puntuacion' in registro:
+                lineas.append(f"     Puntuación: {registro['puntuacion']:.1f}/10")
+        
+        elif accion == 'evaluar':
+            lineas = [f"{posicion + 1}. [{fecha_str}] ⭐ Evaluar",
+                      f"     {registro['origen'].value} → {registro['destino'].value}",
+                      f"     \"{registro['texto_origen']}\"",
+                      f"     Nueva puntuación: {registro['puntuacion']}/10",
+                      f"     Anterior: {registro['puntuacion_anterior']:.1f}/10"]
+        
+        elif accion == 'agregar':
+            lineas = [f"{posicion + 1}. [{fecha_str}] ➕ Agregar",
+                      f"     {registro['origen'].value} → {registro['destino'].value}",
+                      f"     \"{registro['texto_origen']}\" → \"{registro['texto_traduccion']}\""]
         
-        for i, registro in enumerate(reversed(historial_reciente), 1):
-            fecha_str = registro['fecha'].strftime("%Y-%m-%d %H:%M:%S")
-            accion = registro['accion']
-            
-            if accion == 'traducir':
-                self.hist_text.insert(tk.END, f"{i:2}. [{fecha_str}] 📝 Traducir\n")
-                self.hist_text.insert(tk.END, f"     {registro['origen'].value} → {registro['destino'].value}\n")
-                self.hist_text.insert(tk.END, f"     \"{registro['texto_origen']}\" → \"{registro['texto_traduccion']}\"\n")
-                if 'puntuacion' in registro:
-                    self.hist_text.insert(tk.END, f"     Puntuación: {registro['puntuacion']:.1f}/10\n")
-                self.hist_text.insert(tk.END, "\n")
-            
-            elif accion == 'evaluar':
-                self.hist_text.insert(tk.END, f"{i:2}. [{fecha_str}] ⭐ Evaluar\n")
-                self.hist_text.insert(tk.END, f"     {registro['origen'].value} → {registro['destino'].value}\n")
-                self.hist_text.insert(tk.END, f"     \"{registro['texto_origen']}\"\n")
-                self.hist_text.insert(tk.END, f"     Nueva puntuación: {registro['puntuacion']}/10\n")
-                self.hist_text.insert(tk.END, f"     Anterior: {registro['puntuacion_anterior']:.1f}/10\n")
-                self.hist_text.insert(tk.END, "\n")
-            
-            elif accion == 'agregar':
-                self.hist_text.insert(tk.END, f"{i:2}. [{fecha_str}] ➕ Agregar\n")
-                self.hist_text.insert(tk.END, f"     {registro['origen'].value} → {registro['destino'].value}\n")
-                self.hist_text.insert(tk.END, f"     \"{registro['texto_origen']}\" → \"{registro['texto_traduccion']}\"\n")
-                self.hist_text.insert(tk.END, "\n")
+        else:
+            return ""
         
-        self.hist_text.insert(tk.END, f"\nTotal en historial: {len(self.traductor.historial_traducciones)} acciones")
+        return "\n".join(lineas) + "\n\n"
+    
+    def actualizar_historial(self, pagina=None):
+        """
+        Muestra una página del historial (por defecto la actual). Si es la más
+        reciente y ni los filtros ni el historial han cambiado desde la última
+        vez, sólo inserta los registros nuevos por arriba y recorta los que
+        salen por abajo; si no, la vuelve a escribir entera. En ambos casos el
+        texto se inserta de una sola vez.
+        """
+        if pagina is not None:
+            self.hist_pagina = max(pagina, 0)
+        filtros = self.filtros_historial()
+        registros = self.traductor.historial_traducciones
+        
+        total, seleccion = self.traductor.consultar_historial(self.hist_pagina * HISTORIAL_POR_PAGINA,
+                                                              HISTORIAL_POR_PAGINA, **filtros)
+        self.hist_paginas = max((total + HISTORIAL_POR_PAGINA - 1) // HISTORIAL_POR_PAGINA, 1)
+        if self.hist_pagina >= self.hist_paginas:
+            self.hist_pagina = self.hist_paginas - 1
+            total, seleccion = self.traductor.consultar_historial(self.hist_pagina * HISTORIAL_POR_PAGINA,
+                                                                  HISTORIAL_POR_PAGINA, **filtros)
+        
+        consulta = (self.hist_pagina, filtros)
+        incremental = (self.hist_pagina == 0 and self.hist_lineas and consulta == self.hist_consulta
+                       and registros is self.hist_registros)
+        
+        if incremental:
+            nuevos = [(posicion, registro) for posicion, registro in seleccion
+                      if posicion > self.hist_ultima_posicion]
+            if nuevos:
+                bloques = [self.formatear_registro(posicion, registro) for posicion, registro in nuevos]
+                self.hist_text.insert("1.0", "".join(bloques))
+                self.hist_lineas[:0] = [bloque.count("\n") for bloque in bloques]
+                if len(self.hist_lineas) > HISTORIAL_POR_PAGINA:
+                    lineas = sum(self.hist_lineas[:HISTORIAL_POR_PAGINA])
+                    self.hist_text.delete(f"{lineas + 1}.0", tk.END)
+                    del self.hist_lineas[HISTORIAL_POR_PAGINA:]
+        else:
+            bloques = [self.formatear_registro(posicion, registro) for posicion, registro in seleccion]
+            self.hist_text.delete("1.0", tk.END)
+            if bloques:
+                self.hist_text.insert("1.0", "".join(bloques))
+            elif any(filtros.values()):
+                self.hist_text.insert("1.0", "Ningún registro coincide con el filtro.")
+            else:
+                self.hist_text.insert("1.0", "No hay historial registrado.")
+            self.hist_lineas = [bloque.count("\n") for bloque in bloques]
+            self.hist_text.yview_moveto(0)
+        
+        if self.hist_pagina == 0 and seleccion:
+            self.hist_ultima_posicion = seleccion[0][0]
+        self.hist_consulta = consulta
+        self.hist_registros = registros
+        
+        desde = self.hist_pagina * HISTORIAL_POR_PAGINA
+        self.hist_pagina_spin.configure(to=self.hist_paginas)
+        self.hist_pagina_var.set(str(self.hist_pagina + 1))
+        self.hist_info.configure(
+            text=f"Registros {min(desde + 1, total)}–{desde + len(seleccion)} de {total} "
+                 f"(página {self.hist_pagina + 1} de {self.hist_paginas}; "
+                 f"{len(registros)} acciones en total)")
         self.update_status("Historial actualizado")
     
     def string_to_idioma(self, idioma_str):
-        """Convertir string a enum Idioma"""
-        for idioma in Idioma:
-            if idioma.value == idioma_str:
-                return idioma
-        return Idioma.ESPANOL  
+        """Convertir string a Idioma"""
+        return IDIOMAS_POR_VALOR.get(idioma_str, Idioma.ESPANOL)
     
     def evaluar_traduccion_gui(self, origen, destino, texto, puntuacion, frame):
         """Evaluar traducción desde la GUI y limpiar la pestaña"""
@@ -1718,6 +1410,10 @@ class TraductorAprendizajeGUI:
             defaultextension=".txt",
             filetypes=[
                 ("Archivo de texto", "*.txt"),
+                ("Valores separados por tabuladores", "*.tsv"),
+                ("CSV", "*.csv"),
+                ("JSON Lines", "*.jsonl"),
+                ("Memoria de traducción TMX", "*.tmx"),
                 ("Todos los archivos", "*.*")
             ]
         )
@@ -1735,14 +1431,12 @@ class TraductorAprendizajeGUI:
             return
         
         if formato == "binario":
-            exito, mensaje = self.traductor.guardar_diccionario_binario(archivo)
+            guardar = self.traductor.guardar_diccionario_binario
         else:
-            exito, mensaje = self.traductor.guardar_diccionario_json(archivo)
+            guardar = self.traductor.guardar_diccionario_json
         
-        if exito:
-            messagebox.showinfo("Éxito", mensaje)
-        else:
-            messagebox.showerror("Error", mensaje)
+        self.ejecutar_en_segundo_plano("Guardando", lambda progreso: guardar(archivo, progreso=progreso),
+                                       self.mostrar_resultado_tarea)
     
     def cargar_diccionario_gui(self):
         """Cargar diccionario desde la GUI"""
@@ -1754,16 +1448,28 @@ class TraductorAprendizajeGUI:
         
         fusionar = self.modo_fusion.get()
         
-        if archivo.endswith('.json'):
-            exito, mensaje = self.traductor.cargar_diccionario_json(archivo, fusionar)
+        if es_json(archivo):
+            cargar = self.traductor.cargar_diccionario_json
         else:
-            exito, mensaje = self.traductor.cargar_diccionario_binario(archivo, fusionar)
+            cargar = self.traductor.cargar_diccionario_binario
         
-        if exito:
-            messagebox.showinfo("Éxito", mensaje)
-            self.actualizar_estadisticas()
-        else:
-            messagebox.showerror("Error", mensaje)
+        def al_terminar(exito, mensaje):
+            if exito:
+                self.actualizar_idiomas()
+            self.mostrar_resultado_tarea(exito, mensaje)
+            if exito:
+                self.actualizar_estadisticas()
+        
+        self.ejecutar_en_segundo_plano("Cargando", lambda progreso: cargar(archivo, fusionar, progreso=progreso),
+                                       al_terminar)
+    
+    def actualizar_idiomas(self):
+        """Añadir a los selectores los idiomas registrados al cargar un diccionario"""
+        valores = [idioma.value for idioma in Idioma]
+        for combo in self.combos_idioma:
+            combo.configure(values=valores)
+        for combo in self.combos_filtro_idioma:
+            combo.configure(values=[TODOS] + valores)
     
     def exportar_traducciones_gui(self):
         """Exportar traducciones desde la GUI"""
@@ -1773,25 +1479,154 @@ class TraductorAprendizajeGUI:
             messagebox.showwarning("Advertencia", "Por favor, especifique un archivo.")
             return
         
-        exito, mensaje = self.traductor.exportar_traducciones_texto(archivo)
+        self.ejecutar_en_segundo_plano(
+            "Exportando", lambda progreso: self.traductor.exportar_traducciones(archivo, progreso=progreso),
+            self.mostrar_resultado_tarea)
+    
+    def crear_panel_progreso(self, parent):
+        """Barra de progreso, texto y botón de cancelar de las operaciones en segundo plano"""
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.X, pady=(20, 0))
+        
+        barra = ttk.Progressbar(frame, orient=tk.HORIZONTAL, mode='determinate', maximum=100)
+        barra.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        boton = ttk.Button(frame, text="Cancelar", command=self.cancelar_tarea, state=tk.DISABLED)
+        boton.pack(side=tk.LEFT, padx=(10, 0))
+        
+        etiqueta = ttk.Label(parent, text="")
+        etiqueta.pack(fill=tk.X, pady=(5, 0))
+        
+        self.paneles_progreso.append((barra, etiqueta, boton))
+    
+    def ejecutar_en_segundo_plano(self, descripcion, operacion, al_terminar):
+        """
+        Ejecuta operacion(progreso) -> (exito, mensaje) en un hilo aparte. El
+        hilo deja sus avisos en una cola que revisar_tarea lee desde el bucle
+        de Tk (con after), que es el único que toca la interfaz; al acabar
+        llama a al_terminar(exito, mensaje) también desde el bucle de Tk.
+        """
+        if self.tarea is not None and self.tarea.is_alive():
+            messagebox.showwarning("Advertencia", "Ya hay una operación en curso.")
+            return
+        
+        self.cancelacion_tarea.clear()
         
+        def progreso(fase, hecho, total):
+            if self.cancelacion_tarea.is_set():
+                raise OperacionCancelada()
+            self.cola_tarea.put(('progreso', fase, hecho, total))
+        
+        def trabajo():
+            try:
+                resultado = operacion(progreso)
+            except Exception as e:
+                resultado = (False, f"Error inesperado: {e}")
+            self.cola_tarea.put(('fin',) + tuple(resultado))
+        
+        self.al_terminar_tarea = al_terminar
+        self.tarea = threading.Thread(target=trabajo, name=descripcion, daemon=True)
+        for barra, etiqueta, boton in self.paneles_progreso:
+            barra.configure(mode='determinate', value=0)
+            etiqueta.configure(text=f"{descripcion}...")
+            boton.configure(state=tk.NORMAL)
+        self.update_status(f"{descripcion}...")
+        self.tarea.start()
+        self.root.after(100, self.revisar_tarea)
+    
+    def revisar_tarea(self):
+        """Aplica el último aviso de progreso de la tarea y, si ha terminado, su resultado"""
+        ultimo = None
+        fin = None
+        try:
+            while True:
+                aviso = self.cola_tarea.get_nowait()
+                if aviso[0] == 'fin':
+                    fin = aviso
+                else:
+                    ultimo = aviso
+        except queue.Empty:
+            pass
+        
+        if ultimo is not None:
+            self.mostrar_progreso(*ultimo[1:])
+        
+        if fin is None:
+            self.root.after(100, self.revisar_tarea)
+            return
+        
+        _, exito, mensaje = fin
+        # Una carga o importación sustituye los índices de autocompletado
+        self.pares_preparados.clear()
+        for barra, etiqueta, boton in self.paneles_progreso:
+            barra.stop()
+            barra.configure(mode='determinate', value=100 if exito else 0)
+            etiqueta.configure(text="")
+            boton.configure(state=tk.DISABLED)
+        self.al_terminar_tarea(exito, mensaje)
+    
+    def mostrar_progreso(self, fase, hecho, total):
+        # Leyendo y Escribiendo cuentan bytes; el resto, entradas
+        if fase in ('Leyendo', 'Escribiendo'):
+            cantidad = lambda n: f"{n / 2 ** 20:.1f} MB"
+        else:
+            cantidad = lambda n: f"{n:,} entradas"
+        
+        for barra, etiqueta, boton in self.paneles_progreso:
+            if total:
+                barra.stop()
+                barra.configure(mode='determinate', value=min(100, 100 * hecho / total))
+                etiqueta.configure(text=f"{fase}: {cantidad(hecho)} de {cantidad(total)}")
+            else:
+                if str(barra.cget('mode')) != 'indeterminate':
+                    barra.configure(mode='indeterminate')
+                    barra.start(20)
+                etiqueta.configure(text=f"{fase}: {cantidad(hecho)}" if hecho else f"{fase}...")
+    
+    def cancelar_tarea(self):
+        self.cancelacion_tarea.set()
+        for barra, etiqueta, boton in self.paneles_progreso:
+            etiqueta.configure(text="Cancelando...")
+            boton.configure(state=tk.DISABLED)
+    
+    def mostrar_resultado_tarea(self, exito, mensaje):
         if exito:
             messagebox.showinfo("Éxito", mensaje)
+        elif self.cancelacion_tarea.is_set():
+            self.update_status(mensaje)
         else:
             messagebox.showerror("Error", mensaje)
     
     def update_status(self, message):
         """Actualizar mensaje en la barra de estado"""
-        modo = "Fusión" if self.modo_fusion.get() else "Reemplazo"
-        total_traducciones = self.traductor.obtener_total_traducciones()
-        self.status_bar.config(text=f"Estado: {message} | Modo: {modo} | Traducciones: {total_traducciones}")
-        self.root.after(5000, lambda: self.actualizar_barra_estado())
+        self.mensaje_estado = message
+        self.refrescar_barra_estado()
+        # Un único temporizador: cada mensaje nuevo aplaza la vuelta a "Listo"
+        if self.temporizador_estado is not None:
+            self.root.after_cancel(self.temporizador_estado)
+        self.temporizador_estado = self.root.after(5000, self.actualizar_barra_estado)
     
     def actualizar_barra_estado(self):
         """Actualizar la barra de estado con el modo actual"""
+        self.temporizador_estado = None
+        self.mensaje_estado = None
+        self.refrescar_barra_estado()
+    
+    def refrescar_barra_estado(self):
+        """Agrupa en un solo redibujado los cambios de estado de una misma vuelta del bucle de Tk"""
+        if not self.refresco_estado_pendiente:
+            self.refresco_estado_pendiente = True
+            self.root.after_idle(self.dibujar_barra_estado)
+    
+    def dibujar_barra_estado(self):
+        self.refresco_estado_pendiente = False
         modo = "Fusión" if self.modo_fusion.get() else "Reemplazo"
         total_traducciones = self.traductor.obtener_total_traducciones()
-        self.status_bar.config(text=f"Listo | Modo: {modo} | Traducciones: {total_traducciones}")
+        if self.mensaje_estado is None:
+            self.status_bar.config(text=f"Listo | Modo: {modo} | Traducciones: {total_traducciones}")
+        else:
+            self.status_bar.config(text=f"Estado: {self.mensaje_estado} | Modo: {modo} | "
+                                        f"Traducciones: {total_traducciones}")
 
 def main():
     """Función principal para ejecutar la aplicación"""
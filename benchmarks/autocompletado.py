@@ -0,0 +1,83 @@
+"""
+Tiempo de autocompletar() por longitud de prefijo en un par grande.
+
+Mide la creación de los índices del par (primera consulta) y después la
+mediana por consulta de prefijos de 1 a 4 letras, comprobando cada resultado
+contra una ordenación completa del par (las cinco primeras de cada longitud).
+
+Uso:
+    python benchmarks/autocompletado.py [--entradas 1000000] [--limite 10] [--consultas 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, TraductorAprendizaje  # noqa: E402
+from motor_traduccion.modelos import Traduccion  # noqa: E402
+
+ORIGEN, DESTINO = Idioma.ESPANOL, Idioma.INGLES
+
+
+def preparar(entradas):
+    rng = random.Random(1)
+    tabla = {}
+    for i in range(entradas):
+        traduccion = Traduccion(f"text {i}")
+        puntuaciones = [rng.randint(1, 10) for _ in range(rng.randint(1, 4))]
+        traduccion.historial_puntuaciones = puntuaciones
+        traduccion.total_evaluaciones = len(puntuaciones)
+        traduccion.suma_puntuaciones = sum(puntuaciones)
+        traduccion.puntuacion_promedio = traduccion.suma_puntuaciones / len(puntuaciones)
+        tabla[''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12)))] = traduccion
+    traductor = TraductorAprendizaje()
+    traductor.aplicar_carga({ORIGEN: {DESTINO: tabla}}, [], fusionar=False)
+    return traductor
+
+
+def esperado(traductor, prefijo, limite):
+    tabla = traductor._matriz.tabla(ORIGEN, DESTINO)
+    clave = traductor.ranking.clave
+    # Ordenación estable: a igualdad de clave, en el orden de la tabla
+    return sorted((texto for texto in tabla if texto.startswith(prefijo)),
+                  key=lambda texto: clave(tabla[texto]), reverse=True)[:limite]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de autocompletar por longitud de prefijo")
+    parser.add_argument('--entradas', type=int, default=1000000)
+    parser.add_argument('--limite', type=int, default=10)
+    parser.add_argument('--consultas', type=int, default=200)
+    args = parser.parse_args()
+
+    traductor = preparar(args.entradas)
+    print(f"{traductor.obtener_total_traducciones()} traducciones en {ORIGEN.value} → {DESTINO.value}\n")
+
+    inicio = time.perf_counter()
+    traductor.autocompletar(ORIGEN, DESTINO, "a", args.limite)
+    print(f"Primera consulta (crea los índices): {(time.perf_counter() - inicio) * 1000:.0f} ms\n")
+
+    rng = random.Random(2)
+    errores = 0
+    print(f"{'Prefijo':>8} {'Mediana':>10} {'Máximo':>10}")
+    for longitud in range(1, 5):
+        tiempos = []
+        for _ in range(args.consultas):
+            prefijo = ''.join(rng.choice(string.ascii_lowercase) for _ in range(longitud))
+            inicio = time.perf_counter()
+            resultado = traductor.autocompletar(ORIGEN, DESTINO, prefijo, args.limite)
+            tiempos.append(time.perf_counter() - inicio)
+            if len(tiempos) <= 5:
+                errores += [texto for texto, _ in resultado] != esperado(traductor, prefijo, args.limite)
+        print(f"{longitud:>8} {statistics.median(tiempos) * 1000:7.3f} ms {max(tiempos) * 1000:7.3f} ms")
+    print("\nOK: resultados verificados" if not errores else f"\n{errores} resultados distintos")
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Prueba de carga del servidor HTTP del traductor.
+
+Cada trabajador mantiene una conexión persistente (keep-alive) y envía
+peticiones en bucle. Al final se informa de peticiones por segundo y de las
+latencias p50/p99.
+
+Sin --url se arranca un servidor en este mismo proceso sobre un puerto libre;
+para medir sin que el cliente compita por el GIL con el servidor, arranque
+el servidor aparte (python -m motor_traduccion -D dic.json servir) y use --url.
+Con --asincrono el servidor en proceso es el de asyncio.
+
+Uso:
+    python benchmarks/carga_http.py --concurrencia 16 --peticiones 20000
+    python benchmarks/carga_http.py --url 127.0.0.1:8765 --operacion lote --tamano-lote 100
+    python benchmarks/carga_http.py --asincrono --concurrencia 64
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import TraductorAprendizaje  # noqa: E402
+from motor_traduccion.servidor import crear_servidor  # noqa: E402
+from motor_traduccion.servidor_async import ServidorAsincrono  # noqa: E402
+
+TEXTOS = ["hello", "goodbye", "thank you", "please", "water", "food", "house", "inexistente"]
+
+
+def construir_peticion(operacion, tamano_lote, i):
+    if operacion == 'traducir':
+        return '/traducir', {'origen': 'inglés', 'destino': 'español', 'texto': TEXTOS[i % len(TEXTOS)]}
+    if operacion == 'lote':
+        textos = [TEXTOS[(i + k) % len(TEXTOS)] for k in range(tamano_lote)]
+        return '/traducir/lote', {'origen': 'inglés', 'destino': 'español', 'textos': textos}
+    return '/evaluar', {'origen': 'inglés', 'destino': 'español', 'texto': TEXTOS[i % 7], 'puntuacion': 1 + i % 10}
+
+
+def trabajador(host, puerto, operacion, tamano_lote, cantidad, latencias, errores):
+    conexion = http.client.HTTPConnection(host, puerto)
+    propias = []
+    fallos = 0
+    for i in range(cantidad):
+        ruta, datos = construir_peticion(operacion, tamano_lote, i)
+        cuerpo = json.dumps(datos).encode('utf-8')
+        inicio = time.perf_counter()
+        try:
+            conexion.request('POST', ruta, cuerpo, {'Content-Type': 'application/json'})
+            respuesta = conexion.getresponse()
+            respuesta.read()
+            if respuesta.status != 200:
+                fallos += 1
+        except (OSError, http.client.HTTPException):
+            fallos += 1
+            conexion.close()
+            conexion = http.client.HTTPConnection(host, puerto)
+        propias.append(time.perf_counter() - inicio)
+    conexion.close()
+    latencias.extend(propias)
+    errores.append(fallos)
+
+
+def arrancar_servidor_asincrono(traductor):
+    """Arranca el servidor asyncio en un hilo propio; devuelve (host, puerto, función de parada)"""
+    servidor = ServidorAsincrono(traductor)
+    bucle = asyncio.new_event_loop()
+    threading.Thread(target=bucle.run_forever, daemon=True).start()
+    host, puerto = asyncio.run_coroutine_threadsafe(servidor.iniciar(puerto=0), bucle).result()
+
+    def parar():
+        asyncio.run_coroutine_threadsafe(servidor.cerrar(), bucle).result()
+        bucle.call_soon_threadsafe(bucle.stop)
+
+    return host, puerto, parar
+
+
+def percentil(ordenadas, p):
+    if not ordenadas:
+        return 0.0
+    indice = min(len(ordenadas) - 1, int(round(p / 100 * (len(ordenadas) - 1))))
+    return ordenadas[indice]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor HTTP del traductor")
+    parser.add_argument('--url', help="host:puerto de un servidor ya arrancado")
+    parser.add_argument('--diccionario', help="Diccionario para el servidor en proceso")
+    parser.add_argument('--asincrono', action='store_true', help="Servidor en proceso con asyncio")
+    parser.add_argument('--concurrencia', type=int, default=8)
+    parser.add_argument('--peticiones', type=int, default=10000, help="Total de peticiones")
+    parser.add_argument('--operacion', choices=('traducir', 'lote', 'evaluar'), default='traducir')
+    parser.add_argument('--tamano-lote', type=int, default=50)
+    args = parser.parse_args()
+
+    parar = None
+    if args.url:
+        host, _, puerto = args.url.rpartition(':')
+        puerto = int(puerto)
+    else:
+        traductor = TraductorAprendizaje()
+        if args.diccionario:
+            traductor.cargar_diccionario_json(args.diccionario, fusionar=False)
+        if args.asincrono:
+            host, puerto, parar = arrancar_servidor_asincrono(traductor)
+        else:
+            servidor = crear_servidor(traductor, puerto=0)
+            host, puerto = servidor.server_address[:2]
+            threading.Thread(target=servidor.serve_forever, daemon=True).start()
+
+            def parar():
+                servidor.shutdown()
+                servidor.server_close()
+
+    por_trabajador = max(1, args.peticiones // args.concurrencia)
+    latencias = []
+    errores = []
+    hilos = [
+        threading.Thread(target=trabajador,
+                         args=(host, puerto, args.operacion, args.tamano_lote, por_trabajador, latencias, errores))
+        for _ in range(args.concurrencia)
+    ]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    duracion = time.perf_counter() - inicio
+
+    if parar is not None:
+        parar()
+
+    latencias.sort()
+    total = len(latencias)
+    elementos = total * (args.tamano_lote if args.operacion == 'lote' else 1)
+    print(f"Operación: {args.operacion} | Concurrencia: {args.concurrencia} | Peticiones: {total}")
+    print(f"Duración: {duracion:.2f} s | Peticiones/s: {total / duracion:.0f} | Elementos/s: {elementos / duracion:.0f}")
+    print(f"Latencia p50: {percentil(latencias, 50) * 1000:.2f} ms | p99: {percentil(latencias, 99) * 1000:.2f} ms")
+    print(f"Errores: {sum(errores)}")
+    return 1 if sum(errores) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
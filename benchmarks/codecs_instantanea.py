@@ -0,0 +1,114 @@
+"""
+Tamaño y tiempos de guardado/carga del diccionario por codificación y códec.
+
+Para cada combinación (JSON clásico con sangría o por filas; sin comprimir,
+gzip, lzma o bz2; y el binario) guarda el mismo diccionario, lo
+vuelve a cargar en un traductor vacío y comprueba que el contenido coincide.
+
+Uso:
+    python benchmarks/codecs_instantanea.py [--entradas 20000] [--evaluaciones 5] [--historial 50000]
+    python benchmarks/codecs_instantanea.py --archivo Traductor/dicc/traducciones.json
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, TraductorAprendizaje  # noqa: E402
+
+PARES = [(Idioma.ESPANOL, Idioma.INGLES), (Idioma.INGLES, Idioma.ESPANOL),
+         (Idioma.ESPANOL, Idioma.FRANCES), (Idioma.FRANCES, Idioma.ESPANOL)]
+
+COMBINACIONES = [
+    ('JSON clásico', 'dic.json', {}),
+    ('JSON clásico + gzip', 'dic.json.gz', {}),
+    ('JSON por filas', 'dic.json', {'compacto': True}),
+    ('JSON por filas + gzip', 'dic.json.gz', {'compacto': True}),
+    ('JSON por filas + lzma', 'dic.json.xz', {'compacto': True}),
+    ('JSON por filas + bz2', 'dic.json.bz2', {'compacto': True}),
+    ('Binario', 'dic.bin', None),
+]
+
+
+def preparar(entradas, evaluaciones, historial):
+    traductor = TraductorAprendizaje()
+    rng = random.Random(1)
+    for i in range(entradas):
+        origen, destino = PARES[i % len(PARES)]
+        traductor.agregar_traduccion(origen, destino, f"texto {i}", f"text {i}")
+    filas = [(origen, destino, f"texto {i}", rng.randint(1, 10))
+             for i in range(entradas) for origen, destino in [PARES[i % len(PARES)]]
+             for _ in range(rng.randint(0, 2 * evaluaciones))]
+    traductor.evaluar_lote(filas)
+    for _ in range(historial):
+        i = rng.randrange(entradas)
+        origen, destino = PARES[i % len(PARES)]
+        traductor.traducir(origen, destino, f"texto {i}")
+    return traductor
+
+
+def huella(traductor):
+    return (sorted((o.value, d.value, clave, t.texto, t.total_evaluaciones, t.fecha_ultima_modificacion)
+                   for o, d, tabla in traductor._matriz.pares() for clave, t in tabla.items()),
+            len(traductor.historial_traducciones))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tamaño y tiempos por codificación y códec")
+    parser.add_argument('--archivo', help="Diccionario JSON a usar en lugar del sintético")
+    parser.add_argument('--entradas', type=int, default=20000)
+    parser.add_argument('--evaluaciones', type=int, default=5)
+    parser.add_argument('--historial', type=int, default=50000)
+    args = parser.parse_args()
+
+    if args.archivo:
+        traductor = TraductorAprendizaje()
+        exito, mensaje = traductor.cargar_diccionario_json(args.archivo, fusionar=False)
+        if not exito:
+            raise SystemExit(mensaje)
+    else:
+        traductor = preparar(args.entradas, args.evaluaciones, args.historial)
+    referencia = huella(traductor)
+    print(f"{traductor.obtener_total_traducciones()} traducciones, "
+          f"{len(traductor.historial_traducciones)} registros de historial\n")
+    print(f"{'Formato':24} {'Tamaño':>10} {'Guardar':>10} {'Cargar':>10}")
+
+    directorio = tempfile.mkdtemp()
+    errores = 0
+    try:
+        for nombre, archivo, opciones in COMBINACIONES:
+            ruta = os.path.join(directorio, archivo)
+            inicio = time.perf_counter()
+            if opciones is None:
+                exito, mensaje = traductor.guardar_diccionario_binario(ruta)
+            else:
+                exito, mensaje = traductor.guardar_diccionario_json(ruta, **opciones)
+            guardar = time.perf_counter() - inicio
+            if not exito:
+                raise SystemExit(mensaje)
+
+            cargado = TraductorAprendizaje()
+            inicio = time.perf_counter()
+            if opciones is None:
+                exito, mensaje = cargado.cargar_diccionario_binario(ruta, fusionar=False)
+            else:
+                exito, mensaje = cargado.cargar_diccionario_json(ruta, fusionar=False)
+            cargar = time.perf_counter() - inicio
+            correcto = exito and huella(cargado) == referencia
+            errores += not correcto
+
+            print(f"{nombre:24} {os.path.getsize(ruta) / 2 ** 20:8.2f} MiB {guardar * 1000:7.0f} ms "
+                  f"{cargar * 1000:7.0f} ms{'' if correcto else '  DIFERENCIAS'}")
+            os.unlink(ruta)
+    finally:
+        shutil.rmtree(directorio)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Prueba de estrés del modo concurrente (TraductorAprendizajeConcurrente).
+
+Lanza muchos hilos lectores (traducir / existe_traduccion / estadísticas) y
+algunos escritores (evaluar / agregar / fusionar) durante unos segundos y
+al final comprueba invariantes:
+
+- ninguna operación lanzó excepciones;
+- cada traducción tiene total_evaluaciones == len(historial_puntuaciones)
+  y puntuacion_promedio coherente con su historial;
+- el número de evaluaciones aceptadas coincide con el aumento de
+  evaluaciones de las entradas evaluadas;
+- los lectores nunca vieron una traducción a medio escribir;
+- una instantánea no cambia mientras los escritores siguen trabajando.
+
+Uso:
+    python benchmarks/estres_concurrencia.py [--lectores 16] [--escritores 4] [--segundos 5] [--cache-fallos 0]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, Traduccion  # noqa: E402
+from motor_traduccion.concurrencia import TraductorAprendizajeConcurrente  # noqa: E402
+
+PALABRAS = [f"palabra{i}" for i in range(500)]
+PARES = [(Idioma.ESPANOL, Idioma.INGLES), (Idioma.INGLES, Idioma.FRANCES), (Idioma.FRANCES, Idioma.PORTUGUES)]
+
+
+def preparar(capacidad_fallos=0):
+    traductor = TraductorAprendizajeConcurrente(capacidad_fallos)
+    for origen, destino in PARES:
+        for palabra in PALABRAS:
+            traductor.agregar_traduccion(origen, destino, palabra, palabra.upper())
+    return traductor
+
+
+def lector(traductor, fin, contadores, errores):
+    rng = random.Random()
+    operaciones = 0
+    try:
+        while not fin.is_set():
+            origen, destino = rng.choice(PARES)
+            palabra = rng.choice(PALABRAS)
+            traduccion = traductor.traducir(origen, destino, palabra, registrar=rng.random() < 0.1)
+            if traduccion is not None and traduccion.lower() != palabra:
+                errores.append(f"Traducción inesperada {palabra!r} -> {traduccion!r}")
+            traductor.existe_traduccion(origen, destino, palabra)
+            if operaciones % 500 == 0:
+                traductor.obtener_estadisticas()
+                traductor.obtener_mejores_traducciones(origen, destino, 5)
+            operaciones += 1
+    except Exception as e:
+        errores.append(f"Lector: {e!r}")
+    contadores.append(('lecturas', operaciones))
+
+
+def escritor(traductor, fin, contadores, errores, evaluadas):
+    rng = random.Random()
+    aceptadas = 0
+    operaciones = 0
+    try:
+        while not fin.is_set():
+            origen, destino = rng.choice(PARES)
+            palabra = rng.choice(PALABRAS)
+            eleccion = rng.random()
+            if eleccion < 0.8:
+                exito, _ = traductor.evaluar_traduccion(origen, destino, palabra, rng.randint(1, 10))
+                if exito:
+                    aceptadas += 1
+                    evaluadas.append((origen, destino, palabra))
+            elif eleccion < 0.95:
+                nueva = f"nueva{rng.randint(0, 10 ** 6)}"
+                traductor.agregar_traduccion(origen, destino, nueva, nueva.upper())
+            else:
+                lote = {origen: {destino: {f"fusion{rng.randint(0, 50)}": Traduccion("FUSION")}}}
+                traductor.fusionar_diccionario_completo(lote, [])
+            operaciones += 1
+    except Exception as e:
+        errores.append(f"Escritor: {e!r}")
+    contadores.append(('escrituras', operaciones))
+    contadores.append(('evaluaciones', aceptadas))
+
+
+def huella(instantanea):
+    return sum(trad.total_evaluaciones
+               for destinos in instantanea.diccionario.values()
+               for traducciones in destinos.values()
+               for trad in traducciones.values())
+
+
+def observador(traductor, fin, contadores, errores):
+    """Toma instantáneas y comprueba que no cambian mientras se modifica el original"""
+    comprobadas = 0
+    try:
+        while not fin.is_set():
+            instantanea = traductor.instantanea()
+            antes = (huella(instantanea), len(instantanea.historial_traducciones))
+            time.sleep(0.005)
+            if (huella(instantanea), len(instantanea.historial_traducciones)) != antes:
+                errores.append("Una instantánea cambió después de crearse")
+            comprobadas += 1
+    except Exception as e:
+        errores.append(f"Observador: {e!r}")
+    contadores.append(('instantaneas', comprobadas))
+
+
+def comprobar_invariantes(traductor, evaluaciones_iniciales, evaluadas, errores):
+    for origen, destinos in traductor.diccionario.items():
+        for destino, traducciones in destinos.items():
+            for texto, trad in traducciones.items():
+                if trad.total_evaluaciones != len(trad.historial_puntuaciones):
+                    errores.append(f"{texto}: total_evaluaciones desincronizado")
+                elif abs(trad.puntuacion_promedio - sum(trad.historial_puntuaciones) / trad.total_evaluaciones) > 1e-9:
+                    errores.append(f"{texto}: promedio incoherente")
+
+    esperadas = {}
+    for clave in evaluadas:
+        esperadas[clave] = esperadas.get(clave, 0) + 1
+    for (origen, destino, palabra), cantidad in esperadas.items():
+        trad = traductor.diccionario[origen][destino][palabra]
+        if trad.total_evaluaciones - evaluaciones_iniciales[(origen, destino, palabra)] != cantidad:
+            errores.append(f"{palabra}: se perdieron evaluaciones")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estrés del traductor concurrente")
+    parser.add_argument('--lectores', type=int, default=16)
+    parser.add_argument('--escritores', type=int, default=4)
+    parser.add_argument('--segundos', type=float, default=5.0)
+    parser.add_argument('--cache-fallos', type=int, default=0, help="Capacidad de la caché de fallos de traducir")
+    args = parser.parse_args()
+
+    traductor = preparar(args.cache_fallos)
+    evaluaciones_iniciales = {
+        (origen, destino, palabra): traductor.diccionario[origen][destino][palabra].total_evaluaciones
+        for origen, destino in PARES for palabra in PALABRAS
+    }
+
+    fin = threading.Event()
+    contadores = []
+    errores = []
+    evaluadas = []
+    hilos = [threading.Thread(target=lector, args=(traductor, fin, contadores, errores))
+             for _ in range(args.lectores)]
+    hilos += [threading.Thread(target=escritor, args=(traductor, fin, contadores, errores, evaluadas))
+              for _ in range(args.escritores)]
+    hilos.append(threading.Thread(target=observador, args=(traductor, fin, contadores, errores)))
+    for hilo in hilos:
+        hilo.start()
+    time.sleep(args.segundos)
+    fin.set()
+    for hilo in hilos:
+        hilo.join()
+
+    comprobar_invariantes(traductor, evaluaciones_iniciales, evaluadas, errores)
+
+    totales = {}
+    for nombre, valor in contadores:
+        totales[nombre] = totales.get(nombre, 0) + valor
+    print(f"Lecturas: {totales.get('lecturas', 0)} ({totales.get('lecturas', 0) / args.segundos:.0f}/s) | "
+          f"Escrituras: {totales.get('escrituras', 0)} ({totales.get('escrituras', 0) / args.segundos:.0f}/s) | "
+          f"Evaluaciones aceptadas: {totales.get('evaluaciones', 0)} | "
+          f"Instantáneas comprobadas: {totales.get('instantaneas', 0)}")
+    if errores:
+        print(f"FALLO: {len(errores)} violaciones de invariantes")
+        for error in errores[:20]:
+            print(" ", error)
+        return 1
+    print("OK: invariantes verificados")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
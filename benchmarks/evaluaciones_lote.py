@@ -0,0 +1,78 @@
+"""
+Compara aplicar evaluaciones una a una (evaluar_traduccion) con evaluar_lote.
+
+Genera un registro de evaluaciones sobre un diccionario sintético, con una
+parte de filas rechazables (puntuación fuera de rango o texto inexistente),
+lo aplica por los dos caminos sobre traductores idénticos y comprueba que las
+puntuaciones e historiales resultantes coinciden.
+
+Uso:
+    python benchmarks/evaluaciones_lote.py [--entradas 20000] [--evaluaciones 300000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, TraductorAprendizaje  # noqa: E402
+
+ORIGEN, DESTINO = Idioma.ESPANOL, Idioma.INGLES
+
+
+def preparar(entradas):
+    traductor = TraductorAprendizaje()
+    for i in range(entradas):
+        traductor.agregar_traduccion(ORIGEN, DESTINO, f"palabra{i}", f"word{i}")
+    return traductor
+
+
+def generar(entradas, evaluaciones):
+    """Filas (origen, destino, texto, puntuacion); ~5% de textos inexistentes y ~10% fuera de rango"""
+    rng = random.Random(1)
+    filas = []
+    for _ in range(evaluaciones):
+        texto = f"Palabra{rng.randrange(int(entradas * 1.05))}"
+        puntuacion = rng.choice((0, 11)) if rng.random() < 0.1 else rng.randint(1, 10)
+        filas.append((ORIGEN, DESTINO, texto, puntuacion))
+    return filas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluaciones una a una frente a evaluar_lote")
+    parser.add_argument('--entradas', type=int, default=20000)
+    parser.add_argument('--evaluaciones', type=int, default=300000)
+    args = parser.parse_args()
+
+    filas = generar(args.entradas, args.evaluaciones)
+    uno_a_uno = preparar(args.entradas)
+    en_lote = preparar(args.entradas)
+
+    inicio = time.perf_counter()
+    aceptadas_uno = sum(uno_a_uno.evaluar_traduccion(*fila)[0] for fila in filas)
+    tiempo_uno = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    aceptadas_lote, rechazos = en_lote.evaluar_lote(filas)
+    tiempo_lote = time.perf_counter() - inicio
+
+    tabla_uno = uno_a_uno.diccionario[ORIGEN][DESTINO]
+    tabla_lote = en_lote.diccionario[ORIGEN][DESTINO]
+    coinciden = aceptadas_uno == aceptadas_lote and all(
+        tabla_uno[clave].historial_puntuaciones == tabla_lote[clave].historial_puntuaciones
+        and abs(tabla_uno[clave].puntuacion_promedio - tabla_lote[clave].puntuacion_promedio) < 1e-9
+        for clave in tabla_uno
+    )
+
+    print(f"{len(filas)} evaluaciones sobre {args.entradas} entradas: "
+          f"{aceptadas_lote} aceptadas, {len(rechazos)} rechazadas")
+    print(f"Una a una:   {tiempo_uno * 1000:8.1f} ms ({len(filas) / tiempo_uno:,.0f} filas/s)")
+    print(f"evaluar_lote:{tiempo_lote * 1000:8.1f} ms ({len(filas) / tiempo_lote:,.0f} filas/s, "
+          f"{tiempo_uno / tiempo_lote:.1f}x) {'OK' if coinciden else 'DIFERENCIAS'}")
+    return 0 if coinciden else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
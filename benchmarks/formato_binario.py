@@ -0,0 +1,88 @@
+"""
+Guardado y carga con el formato binario propio frente a JSON y al pickle
+que usaba antes guardar_diccionario_binario.
+
+El pickle antiguo se escribe como antes (datos clásicos + pickle.dump) y se
+carga con cargar_diccionario_binario, que aún lo acepta. Cada carga se
+comprueba contra el diccionario original.
+
+Uso:
+    python benchmarks/formato_binario.py [--entradas 100000] [--evaluaciones 5] [--historial 200000] [--repeticiones 3]
+"""
+import argparse
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import TraductorAprendizaje  # noqa: E402
+from motor_traduccion.serializacion import datos_clasicos  # noqa: E402
+from codecs_instantanea import huella, preparar  # noqa: E402
+
+
+def guardar_pickle(traductor, ruta):
+    with open(ruta, 'wb') as f:
+        pickle.dump(datos_clasicos(traductor.instantanea()), f)
+    return True, ""
+
+
+VARIANTES = [
+    ('JSON clásico', 'dic.json', lambda t, r: t.guardar_diccionario_json(r), 'json'),
+    ('JSON por filas', 'dic.json', lambda t, r: t.guardar_diccionario_json(r, compacto=True), 'json'),
+    ('pickle (anterior)', 'dic.pkl', guardar_pickle, 'binario'),
+    ('Binario', 'dic.bin', lambda t, r: t.guardar_diccionario_binario(r), 'binario'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Formato binario frente a JSON y pickle")
+    parser.add_argument('--entradas', type=int, default=100000)
+    parser.add_argument('--evaluaciones', type=int, default=5)
+    parser.add_argument('--historial', type=int, default=200000)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    traductor = preparar(args.entradas, args.evaluaciones, args.historial)
+    referencia = huella(traductor)
+    print(f"{traductor.obtener_total_traducciones()} traducciones, "
+          f"{len(traductor.historial_traducciones)} registros de historial "
+          f"(mejor de {args.repeticiones})\n")
+    print(f"{'Formato':20} {'Tamaño':>10} {'Guardar':>10} {'Cargar':>10}")
+
+    directorio = tempfile.mkdtemp()
+    errores = 0
+    try:
+        for nombre, archivo, guardar, tipo in VARIANTES:
+            ruta = os.path.join(directorio, archivo)
+            tiempos_guardar, tiempos_cargar = [], []
+            for _ in range(args.repeticiones):
+                inicio = time.perf_counter()
+                exito, mensaje = guardar(traductor, ruta)
+                tiempos_guardar.append(time.perf_counter() - inicio)
+                if not exito:
+                    raise SystemExit(mensaje)
+
+                cargado = TraductorAprendizaje()
+                inicio = time.perf_counter()
+                if tipo == 'json':
+                    exito, mensaje = cargado.cargar_diccionario_json(ruta, fusionar=False)
+                else:
+                    exito, mensaje = cargado.cargar_diccionario_binario(ruta, fusionar=False)
+                tiempos_cargar.append(time.perf_counter() - inicio)
+            correcto = exito and huella(cargado) == referencia
+            errores += not correcto
+
+            print(f"{nombre:20} {os.path.getsize(ruta) / 2 ** 20:8.2f} MiB {min(tiempos_guardar) * 1000:7.0f} ms "
+                  f"{min(tiempos_cargar) * 1000:7.0f} ms{'' if correcto else '  DIFERENCIAS'}")
+            os.unlink(ruta)
+    finally:
+        shutil.rmtree(directorio)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
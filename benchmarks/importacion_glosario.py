@@ -0,0 +1,100 @@
+"""
+Rendimiento de importar_archivo con glosarios grandes en TSV y TMX.
+
+Genera un glosario sintético de varios millones de líneas (o usa el que se
+indique), lo importa en streaming por lotes y mide filas por segundo y el
+pico de memoria del proceso (ru_maxrss), que debe depender del tamaño del
+diccionario resultante y no del archivo.
+
+Uso:
+    python benchmarks/importacion_glosario.py [--lineas 2000000] [--formato tsv|tmx] [--inversas]
+    python benchmarks/importacion_glosario.py --archivo glosario.tmx -o español -d inglés
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, TraductorAprendizaje  # noqa: E402
+from motor_traduccion.cli import idioma_desde_texto  # noqa: E402
+from motor_traduccion.importacion import formato_de_archivo  # noqa: E402
+
+BLOQUE = 10000
+
+
+def generar(archivo, formato, lineas):
+    """Glosario español -> inglés; una de cada diez filas repite una entrada anterior"""
+    with open(archivo, 'w', encoding='utf-8') as f:
+        if formato == 'tmx':
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n<tmx version="1.4">'
+                    '<header srclang="es" datatype="plaintext"/><body>\n')
+        bloque = []
+        for i in range(lineas):
+            n = i // 2 if i % 10 == 9 else i
+            origen, destino = f"término {n}", f"term {n}"
+            if formato == 'tmx':
+                bloque.append(f'<tu><tuv xml:lang="es"><seg>{escape(origen)}</seg></tuv>'
+                              f'<tuv xml:lang="en"><seg>{escape(destino)}</seg></tuv></tu>\n')
+            else:
+                bloque.append(f"{origen}\t{destino}\n")
+            if len(bloque) >= BLOQUE:
+                f.writelines(bloque)
+                bloque.clear()
+        f.writelines(bloque)
+        if formato == 'tmx':
+            f.write('</body></tmx>\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rendimiento de la importación de glosarios")
+    parser.add_argument('--archivo', help="Glosario a importar; sin él se genera uno sintético")
+    parser.add_argument('--lineas', type=int, default=2000000)
+    parser.add_argument('--formato', choices=('tsv', 'tmx'), default='tsv')
+    parser.add_argument('-o', '--origen', type=idioma_desde_texto, default=Idioma.ESPANOL)
+    parser.add_argument('-d', '--destino', type=idioma_desde_texto, default=Idioma.INGLES)
+    parser.add_argument('--inversas', action='store_true')
+    parser.add_argument('--lote', type=int, default=10000)
+    args = parser.parse_args()
+
+    temporal = None
+    archivo = args.archivo
+    if archivo is None:
+        temporal = tempfile.NamedTemporaryFile(suffix='.' + args.formato, delete=False)
+        temporal.close()
+        archivo = temporal.name
+        inicio = time.perf_counter()
+        generar(archivo, args.formato, args.lineas)
+        print(f"Generado {archivo} ({os.path.getsize(archivo) / 2 ** 20:.0f} MiB) "
+              f"en {time.perf_counter() - inicio:.1f} s")
+
+    try:
+        traductor = TraductorAprendizaje()
+        traductor.limpiar_diccionario()
+        memoria_antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        inicio = time.perf_counter()
+        exito, mensaje = traductor.importar_archivo(archivo, args.origen, args.destino,
+                                                    formato=formato_de_archivo(archivo), inversas=args.inversas,
+                                                    tamano_lote=args.lote)
+        duracion = time.perf_counter() - inicio
+        memoria_despues = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    finally:
+        if temporal is not None:
+            os.unlink(temporal.name)
+
+    print(mensaje)
+    if not exito:
+        return 1
+    lineas = args.lineas if args.archivo is None else None
+    print(f"\nTiempo: {duracion:.2f} s" + (f" ({lineas / duracion:,.0f} líneas/s)" if lineas else ""))
+    print(f"Traducciones en el diccionario: {traductor.obtener_total_traducciones()}")
+    print(f"Pico de memoria: {memoria_despues / 1024:.0f} MiB (antes de importar: {memoria_antes / 1024:.0f} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
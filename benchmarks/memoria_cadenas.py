@@ -0,0 +1,117 @@
+"""
+Informe de memoria de las cadenas del diccionario.
+
+Carga un diccionario (o genera uno sintético con traducciones inversas e
+historial) y cuenta las referencias a cadenas desde las claves de cada par,
+los textos de las traducciones y los registros del historial. Compara los
+bytes reales, con las cadenas internadas compartidas, con los que ocuparían
+si cada referencia tuviera su propia copia, como ocurría al cargar un JSON
+antes de internarlas.
+
+Uso:
+    python benchmarks/memoria_cadenas.py [diccionario.json|diccionario.pkl]
+    python benchmarks/memoria_cadenas.py --palabras 50000 --historial 200000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, TraductorAprendizaje  # noqa: E402
+
+CAMPOS_HISTORIAL = ('accion', 'texto_origen', 'texto_traduccion')
+
+
+def generar(archivo, palabras, historial):
+    """Diccionario español<->inglés con inversas e historial de consultas, guardado en JSON"""
+    traductor = TraductorAprendizaje()
+    rng = random.Random(1)
+    pares = [(f"palabra{i}", f"word{i}") for i in range(palabras)]
+    for espanol, ingles in pares:
+        traductor.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, espanol, ingles)
+        traductor.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, ingles, espanol)
+    for _ in range(historial):
+        espanol, _ = rng.choice(pares)
+        traductor.traducir(Idioma.ESPANOL, Idioma.INGLES, espanol)
+    exito, mensaje = traductor.guardar_diccionario_json(archivo)
+    if not exito:
+        raise SystemExit(mensaje)
+
+
+def cargar(archivo):
+    traductor = TraductorAprendizaje()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    if archivo.endswith('.json'):
+        exito, mensaje = traductor.cargar_diccionario_json(archivo, fusionar=False)
+    else:
+        exito, mensaje = traductor.cargar_diccionario_binario(archivo, fusionar=False)
+    retenida = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    if not exito:
+        raise SystemExit(mensaje)
+    return traductor, retenida
+
+
+def referencias(traductor):
+    """Todas las referencias a cadenas del diccionario y del historial"""
+    for _, _, tabla in traductor._matriz.pares():
+        for clave, traduccion in tabla.items():
+            yield clave
+            yield traduccion.texto
+    for registro in traductor.historial_traducciones:
+        for campo in CAMPOS_HISTORIAL:
+            valor = registro.get(campo)
+            if isinstance(valor, str):
+                yield valor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria ocupada por las cadenas del diccionario")
+    parser.add_argument('archivo', nargs='?', help="Diccionario a medir; sin él se genera uno sintético")
+    parser.add_argument('--palabras', type=int, default=20000)
+    parser.add_argument('--historial', type=int, default=50000)
+    args = parser.parse_args()
+
+    temporal = None
+    archivo = args.archivo
+    if archivo is None:
+        temporal = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
+        temporal.close()
+        archivo = temporal.name
+        generar(archivo, args.palabras, args.historial)
+
+    try:
+        traductor, retenida = cargar(archivo)
+    finally:
+        if temporal is not None:
+            os.unlink(temporal.name)
+
+    total_referencias = 0
+    bytes_sin_compartir = 0
+    distintas = {}
+    for cadena in referencias(traductor):
+        total_referencias += 1
+        tamano = sys.getsizeof(cadena)
+        bytes_sin_compartir += tamano
+        distintas[id(cadena)] = tamano
+    bytes_compartidos = sum(distintas.values())
+
+    print(f"Diccionario: {traductor.obtener_total_traducciones()} traducciones, "
+          f"{len(traductor.historial_traducciones)} registros de historial")
+    print(f"Referencias a cadenas: {total_referencias} | objetos distintos: {len(distintas)}")
+    print(f"Bytes en cadenas: {bytes_compartidos / 2 ** 20:.1f} MiB compartidas, "
+          f"{bytes_sin_compartir / 2 ** 20:.1f} MiB con una copia por referencia")
+    if bytes_sin_compartir:
+        print(f"Ahorro: {(bytes_sin_compartir - bytes_compartidos) / 2 ** 20:.1f} MiB "
+              f"({100 * (1 - bytes_compartidos / bytes_sin_compartir):.0f}%)")
+    print(f"Memoria retenida tras la carga (tracemalloc): {retenida / 2 ** 20:.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
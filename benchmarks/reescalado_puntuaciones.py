@@ -0,0 +1,100 @@
+"""
+Compara dos formas de recalcular todas las puntuaciones del diccionario.
+
+- Por objeto: recorrer cada Traduccion y promediar su historial como hace
+  actualizar_puntuacion, aplicar el decaimiento temporal y ordenar cada par.
+- Columnar: AlmacenPuntuaciones (con NumPy si está instalado y con la
+  implementación en listas) calculando lo mismo sobre columnas.
+
+Se informa aparte del coste de extraer las columnas, que se paga una vez por
+cada foto del diccionario.
+
+Uso:
+    python benchmarks/reescalado_puntuaciones.py [--entradas 200000] [--evaluaciones 20] [--vida-media 30]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_traduccion import Idioma, TraductorAprendizaje  # noqa: E402
+from motor_traduccion.puntuaciones import SEGUNDOS_POR_DIA, AlmacenPuntuaciones, np  # noqa: E402
+
+PARES = [(Idioma.ESPANOL, Idioma.INGLES), (Idioma.INGLES, Idioma.ESPANOL),
+         (Idioma.ESPANOL, Idioma.FRANCES), (Idioma.FRANCES, Idioma.ESPANOL)]
+
+
+def preparar(entradas, evaluaciones):
+    traductor = TraductorAprendizaje()
+    traductor.limpiar_diccionario()
+    rng = random.Random(1)
+    ahora = datetime.now()
+    for i in range(entradas):
+        origen, destino = PARES[i % len(PARES)]
+        traductor.agregar_traduccion(origen, destino, f"texto{i}", f"text{i}")
+        traduccion = traductor.diccionario[origen][destino][f"texto{i}"]
+        traduccion.historial_puntuaciones = [rng.randint(1, 10) for _ in range(rng.randint(1, 2 * evaluaciones))]
+        traduccion.total_evaluaciones = len(traduccion.historial_puntuaciones)
+        traduccion.suma_puntuaciones = sum(traduccion.historial_puntuaciones)
+        traduccion.fecha_ultima_modificacion = ahora - timedelta(days=rng.uniform(0, 365))
+    return traductor
+
+
+def por_objeto(traductor, vida_media_dias, ahora):
+    """Lo que hoy exige un cambio de política: un bucle Python por traducción"""
+    vida_media = vida_media_dias * SEGUNDOS_POR_DIA
+    ranking = {}
+    for origen, destino, tabla in traductor._matriz.pares():
+        puntuadas = []
+        for clave, traduccion in tabla.items():
+            promedio = sum(traduccion.historial_puntuaciones) / len(traduccion.historial_puntuaciones)
+            edad = max(ahora - traduccion.fecha_ultima_modificacion.timestamp(), 0.0)
+            puntuadas.append((5.0 + (promedio - 5.0) * 2.0 ** (-edad / vida_media), clave))
+        puntuadas.sort(key=lambda x: x[0], reverse=True)
+        ranking[(origen, destino)] = [clave for _, clave in puntuadas]
+    return ranking
+
+
+def columnar(almacen, vida_media_dias, ahora):
+    return almacen.ranking(almacen.con_decaimiento(vida_media_dias, ahora))
+
+
+def cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recalcular puntuaciones: por objeto frente a columnar")
+    parser.add_argument('--entradas', type=int, default=200000)
+    parser.add_argument('--evaluaciones', type=int, default=20, help="Evaluaciones medias por entrada")
+    parser.add_argument('--vida-media', type=float, default=30.0, help="Vida media del decaimiento en días")
+    args = parser.parse_args()
+
+    traductor = preparar(args.entradas, args.evaluaciones)
+    ahora = time.time()
+    print(f"{args.entradas} traducciones, ~{args.evaluaciones} evaluaciones cada una, "
+          f"NumPy {'disponible' if np is not None else 'no instalado'}")
+
+    t_objeto, esperado = cronometrar(por_objeto, traductor, args.vida_media, ahora)
+    print(f"Por objeto:             {t_objeto * 1000:8.1f} ms")
+
+    variantes = [('listas', False)] + ([('NumPy', True)] if np is not None else [])
+    for nombre, usar_numpy in variantes:
+        t_extraer, almacen = cronometrar(AlmacenPuntuaciones.desde_traductor, traductor, usar_numpy)
+        t_calculo, ranking = cronometrar(columnar, almacen, args.vida_media, ahora)
+        # Con puntuaciones iguales el orden puede variar; se compara el mejor de cada par
+        coincide = all(ranking[par][0] == esperado[par][0] for par in esperado)
+        print(f"Columnar ({nombre}):{' ' * (10 - len(nombre))}{t_calculo * 1000:8.1f} ms "
+              f"(extracción {t_extraer * 1000:.1f} ms, {t_objeto / t_calculo:.1f}x) "
+              f"{'OK' if coincide else 'DIFERENTE'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
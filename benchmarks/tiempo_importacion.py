@@ -0,0 +1,63 @@
+"""
+Mide el tiempo de importación del paquete motor_traduccion.
+
+Lanza intérpretes nuevos con ``-X importtime`` y comprueba que la importación
+del motor no arrastre tkinter y se mantenga dentro del presupuesto.
+
+Uso:
+    python benchmarks/tiempo_importacion.py [--presupuesto-ms 40] [--repeticiones 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRESUPUESTO_MS = 40.0
+MODULOS_PROHIBIDOS = ('tkinter', '_tkinter')
+
+
+def medir_importacion(modulo):
+    """Devuelve (microsegundos acumulados, módulos importados) de una importación en frío"""
+    codigo = f"import sys, {modulo}; print('\\n'.join(sys.modules))"
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    acumulado = 0
+    for linea in resultado.stderr.splitlines():
+        # Formato: "import time: self [us] | cumulative | imported package"
+        partes = linea.split('|')
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            acumulado = int(partes[1].strip())
+    return acumulado, set(resultado.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Presupuesto de tiempo de importación del motor")
+    parser.add_argument('--presupuesto-ms', type=float, default=PRESUPUESTO_MS)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    args = parser.parse_args()
+
+    tiempos = []
+    modulos = set()
+    for _ in range(args.repeticiones):
+        microsegundos, modulos = medir_importacion('motor_traduccion')
+        tiempos.append(microsegundos / 1000)
+
+    mejor = min(tiempos)
+    print(f"motor_traduccion: mejor {mejor:.1f} ms, mediana {sorted(tiempos)[len(tiempos) // 2]:.1f} ms "
+          f"(presupuesto {args.presupuesto_ms:.1f} ms)")
+
+    prohibidos = [m for m in MODULOS_PROHIBIDOS if m in modulos]
+    if prohibidos:
+        print(f"ERROR: la importación del motor cargó módulos de interfaz: {', '.join(prohibidos)}")
+        return 1
+    if mejor > args.presupuesto_ms:
+        print("ERROR: se superó el presupuesto de importación")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""
+Motor del traductor con aprendizaje.
+
+Este paquete no importa tkinter ni ningún otro módulo de interfaz, de modo
+que puede usarse desde servidores, trabajos por lotes o máquinas sin pantalla.
+La interfaz gráfica (Traductor.py) se construye encima de él.
+"""
+from .modelos import Idioma, Traduccion, idioma_desde_texto, registrar_idioma
+from .traductor import TraductorAprendizaje
+from .concurrencia import TraductorAprendizajeConcurrente
+
+__all__ = ['Idioma', 'Traduccion', 'TraductorAprendizaje', 'TraductorAprendizajeConcurrente',
+           'idioma_desde_texto', 'registrar_idioma']
@@ -0,0 +1,73 @@
+"""
+Autocompletado por prefijo.
+
+IndicePrefijos guarda ordenadas las claves de un par (textos en minúsculas):
+las que empiezan por un prefijo forman un tramo contiguo que se localiza con
+dos búsquedas binarias. Para quedarse con las mejores del tramo según el
+índice de puntuaciones del par (ver ranking.IndicePuntuaciones):
+
+- si el tramo es corto, se puntúan todas sus claves;
+- si es largo, se recorre el índice de puntuaciones de mejor a peor y se
+  toman las que empiezan por el prefijo: como abundan, se reúnen tras pocas
+  entradas. Si tras EXAMINADAS_MAXIMAS entradas no se han reunido, se
+  puntúa el tramo entero.
+
+En ambos casos el orden es el del índice de puntuaciones, empates incluidos.
+"""
+from bisect import bisect_left, insort
+from heapq import nlargest
+from itertools import islice
+
+TRAMO_MAXIMO = 4096
+EXAMINADAS_MAXIMAS = 65536
+
+# Mayor que cualquier carácter que pueda seguir al prefijo
+_ULTIMO_CARACTER = '\U0010ffff'
+
+
+class IndicePrefijos:
+    """Claves de un par ordenadas alfabéticamente"""
+
+    def __init__(self, tabla):
+        self.claves = sorted(tabla)
+
+    def __len__(self):
+        return len(self.claves)
+
+    def agregar(self, clave):
+        insort(self.claves, clave)
+
+    def tramo(self, prefijo):
+        """(inicio, fin) de las claves que empiezan por prefijo"""
+        claves = self.claves
+        return bisect_left(claves, prefijo), bisect_left(claves, prefijo + _ULTIMO_CARACTER)
+
+    def completar(self, prefijo, limite, puntuaciones):
+        """Hasta `limite` claves que empiezan por prefijo, de mejor a peor"""
+        if limite <= 0:
+            return []
+        inicio, fin = self.tramo(prefijo)
+        if fin - inicio > TRAMO_MAXIMO:
+            encontradas = self._mejores_recorriendo(prefijo, limite, puntuaciones)
+            if encontradas is not None:
+                return encontradas
+        # Mismo orden que el índice de puntuaciones: mayor clave de ranking y,
+        # a igualdad, la que llegó antes al par
+        entradas = puntuaciones.entradas
+
+        def orden(clave):
+            clave_ranking, llegada, _ = entradas[clave]
+            return clave_ranking, -llegada
+
+        return nlargest(limite, self.claves[inicio:fin], key=orden)
+
+    @staticmethod
+    def _mejores_recorriendo(prefijo, limite, puntuaciones):
+        """Las primeras del prefijo en el índice de puntuaciones; None si se agota el presupuesto"""
+        encontradas = []
+        for _, _, texto in islice(puntuaciones.recorrer_mejores(), EXAMINADAS_MAXIMAS):
+            if texto.startswith(prefijo):
+                encontradas.append(texto)
+                if len(encontradas) == limite:
+                    return encontradas
+        return encontradas if len(puntuaciones) <= EXAMINADAS_MAXIMAS else None
@@ -0,0 +1,386 @@
+"""
+Formato binario propio del diccionario (sustituye a pickle).
+
+Se escribe con array/struct y se lee sin ejecutar nada del archivo: un
+archivo manipulado puede como mucho fallar al cargarse. Los datos van por
+columnas dentro de cada par, así que cada columna se empaqueta y se
+desempaqueta de una vez en lugar de valor a valor.
+
+Disposición (todos los enteros y reales en little-endian):
+
+    Cabecera                struct '<4sHH': b'MTRB', versión (1), reservado (0)
+
+    Cadenas                 u32 n, u32 bytes
+                            u32[n] longitud de cada cadena en caracteres
+                            bytes del texto UTF-8 (surrogatepass) de todas,
+                            una tras otra
+        El resto del archivo se refiere a las cadenas por su posición
+        (u32; 0xFFFFFFFF = ninguna). Cada cadena aparece una vez aunque la
+        usen varias traducciones y registros de historial.
+
+    Idiomas                 u16 n; n x (u32 valor, u32 nombre)
+        Los pares y el historial se refieren a los idiomas por su posición
+        (u16; 0xFFFF = ninguno).
+
+    Pares                   u32 n; por cada par:
+                            u16 origen, u16 destino, u32 filas, u32 puntuaciones
+                            u32[filas] clave, u32[filas] texto
+                            f64[filas] puntuacion_promedio
+                            i64[filas] total_evaluaciones
+                            fecha[filas] fecha_creacion
+                            fecha[filas] fecha_ultima_modificacion
+                            u32[filas] longitud de historial_puntuaciones
+                            f64[puntuaciones] historial_puntuaciones de todas
+                            las filas, una tras otra
+
+    Historial               u32 m
+                            fecha[m] fecha, u32[m] accion
+                            u16[m] origen, u16[m] destino
+                            u32[m] texto_origen, u32[m] texto_traduccion
+                            u8[m] tipo y f64[m] valor de puntuacion
+                            u8[m] tipo y f64[m] valor de puntuacion_anterior
+                            (tipo: 0 ninguno, 1 entero, 2 real)
+                            u32 e; e x (u32 registro, u32 cadena JSON con
+                            los demás campos del registro)
+        Un campo fijo cuyo valor no cabe en su columna (por ejemplo una
+        puntuación que no es un número) va también en el JSON del registro,
+        igual que uno presente con valor None (ninguno equivale a ausente).
+
+Cada fecha ocupa 11 bytes, struct '<HBBBBBI': año, mes, día, hora, minuto,
+segundo y microsegundo, sin zona horaria (como las que crea el motor), y se
+reconstruye con datetime(*campos). Las puntuaciones del historial de cada
+traducción se guardan como f64 y se leen como float.
+
+Tras el contenido va la suma de control de serializacion.escribir_binario.
+"""
+import json
+import struct
+import sys
+from array import array
+from datetime import datetime
+from itertools import accumulate
+from sys import intern
+
+from .modelos import Idioma, Traduccion, registrar_idioma
+from .progreso import Contador
+
+FIRMA = b'MTRB'
+VERSION = 1
+
+_CABECERA = struct.Struct('<4sHH')
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_DOS_U32 = struct.Struct('<II')
+_PAR = struct.Struct('<HHII')
+_FECHA = struct.Struct('<HBBBBBI')
+
+_U32_CODIGO = 'I' if array('I').itemsize == 4 else 'L'
+NINGUNA = 0xFFFFFFFF
+NINGUNO = 0xFFFF
+
+_CAMPOS_FIJOS = frozenset(('fecha', 'accion', 'origen', 'destino', 'texto_origen', 'texto_traduccion',
+                           'puntuacion', 'puntuacion_anterior'))
+_TIPOS_NUMERO = {type(None): 0, int: 1, float: 2}
+
+
+def _columna(codigo, valores):
+    columna = array(codigo, valores)
+    if sys.byteorder == 'big':
+        columna.byteswap()
+    return columna.tobytes()
+
+
+def _totales(tabla, traducciones):
+    """Columna i64 de total_evaluaciones; un real sin decimales se guarda como entero"""
+    totales = [t.total_evaluaciones for t in traducciones]
+    try:
+        return _columna('q', totales)
+    except TypeError:
+        pass
+    for posicion, (clave, total) in enumerate(zip(tabla, totales)):
+        if isinstance(total, float) and total.is_integer():
+            totales[posicion] = int(total)
+        elif not isinstance(total, int):
+            raise ValueError(f"total_evaluaciones de {clave!r} no es un número entero: {total!r}")
+    return _columna('q', totales)
+
+
+def _fechas(fechas):
+    empaquetar = _FECHA.pack
+    return b''.join([empaquetar(f.year, f.month, f.day, f.hour, f.minute, f.second, f.microsecond)
+                     for f in fechas])
+
+
+class _Codificador:
+    """Tabla de cadenas e idiomas que se va llenando al codificar las columnas"""
+
+    def __init__(self):
+        self.cadenas = {}
+        self.posiciones_idioma = {}
+        self.idiomas = []
+        self.extras = {}
+
+    def cadena(self, texto):
+        cadenas = self.cadenas
+        posicion = cadenas.get(texto)
+        if posicion is None:
+            posicion = cadenas[texto] = len(cadenas)
+        return posicion
+
+    def idioma(self, idioma):
+        posicion = self.posiciones_idioma.get(idioma)
+        if posicion is None:
+            posicion = self.posiciones_idioma[idioma] = len(self.idiomas)
+            self.idiomas.append(idioma)
+        return posicion
+
+    def _extra(self, posicion, campo, valor):
+        self.extras.setdefault(posicion, {})[campo] = valor
+
+    def _validos(self, valores, campo, tipo):
+        """`valores` con los que no son `tipo` ni None pasados a los extras"""
+        raros = [posicion for posicion, valor in enumerate(valores)
+                 if valor is not None and not isinstance(valor, tipo)]
+        if raros:
+            valores = list(valores)
+            for posicion in raros:
+                self._extra(posicion, campo, valores[posicion])
+                valores[posicion] = None
+        return valores
+
+    def columna_cadenas(self, valores, campo):
+        """Posiciones en la tabla de cadenas (NINGUNA para None)"""
+        valores = self._validos(valores, campo, str)
+        cadenas = self.cadenas
+        for valor in dict.fromkeys(valores):
+            if valor is not None and valor not in cadenas:
+                cadenas[valor] = len(cadenas)
+        return [cadenas[valor] if valor is not None else NINGUNA for valor in valores]
+
+    def columna_idiomas(self, valores, campo):
+        valores = self._validos(valores, campo, Idioma)
+        for valor in dict.fromkeys(valores):
+            if valor is not None:
+                self.idioma(valor)
+        posiciones = self.posiciones_idioma
+        return [posiciones[valor] if valor is not None else NINGUNO for valor in valores]
+
+    def columna_numeros(self, valores, campo):
+        """(tipos, valores en f64); lo que no es int, float ni None va a los extras"""
+        tipos = [_TIPOS_NUMERO.get(type(valor)) for valor in valores]
+        for posicion, tipo in enumerate(tipos):
+            if tipo is None:
+                self._extra(posicion, campo, valores[posicion])
+        return ([tipo or 0 for tipo in tipos],
+                [valor if tipo else 0.0 for tipo, valor in zip(tipos, valores)])
+
+
+def codificar(vista, progreso=None):
+    """Bloques de bytes del formato binario a partir de un traductor o una instantánea"""
+    codificador = _Codificador()
+    cadenas = codificador.cadenas
+    historial = vista.historial_traducciones
+    contador = Contador(progreso, 'Preparando',
+                        progreso and sum(len(tabla) for _, _, tabla in vista._matriz.pares()) + len(historial))
+
+    bloques_pares = []
+    for origen, destino, tabla in vista._matriz.pares():
+        if not tabla:
+            continue
+        traducciones = list(tabla.values())
+        longitudes = [len(t.historial_puntuaciones) for t in traducciones]
+        puntuaciones = [p for t in traducciones for p in t.historial_puntuaciones]
+        bloques_pares += [
+            _PAR.pack(codificador.idioma(origen), codificador.idioma(destino), len(traducciones), len(puntuaciones)),
+            _columna(_U32_CODIGO, [cadenas.setdefault(clave, len(cadenas)) for clave in tabla]),
+            _columna(_U32_CODIGO, [cadenas.setdefault(t.texto, len(cadenas)) for t in traducciones]),
+            _columna('d', [t.puntuacion_promedio for t in traducciones]),
+            _totales(tabla, traducciones),
+            _fechas([t.fecha_creacion for t in traducciones]),
+            _fechas([t.fecha_ultima_modificacion for t in traducciones]),
+            _columna(_U32_CODIGO, longitudes),
+            _columna('d', puntuaciones),
+        ]
+        contador.sumar(len(traducciones))
+
+    tipos_puntuacion, puntuaciones = codificador.columna_numeros([r.get('puntuacion') for r in historial],
+                                                                  'puntuacion')
+    tipos_anterior, anteriores = codificador.columna_numeros([r.get('puntuacion_anterior') for r in historial],
+                                                             'puntuacion_anterior')
+    bloques_historial = [
+        _U32.pack(len(historial)),
+        _fechas([r['fecha'] for r in historial]),
+        _columna(_U32_CODIGO, codificador.columna_cadenas([r.get('accion') for r in historial], 'accion')),
+        _columna('H', codificador.columna_idiomas([r.get('origen') for r in historial], 'origen')),
+        _columna('H', codificador.columna_idiomas([r.get('destino') for r in historial], 'destino')),
+        _columna(_U32_CODIGO, codificador.columna_cadenas([r.get('texto_origen') for r in historial],
+                                                          'texto_origen')),
+        _columna(_U32_CODIGO, codificador.columna_cadenas([r.get('texto_traduccion') for r in historial],
+                                                          'texto_traduccion')),
+        _columna('B', tipos_puntuacion), _columna('d', puntuaciones),
+        _columna('B', tipos_anterior), _columna('d', anteriores),
+    ]
+    extras = codificador.extras
+    for posicion, registro in enumerate(historial):
+        # Un campo fijo ausente se lee como ausente; si estaba con None, el
+        # None va en los extras para que el registro se lea igual
+        if not _CAMPOS_FIJOS.issuperset(registro) or None in registro.values():
+            extras.setdefault(posicion, {}).update(
+                (campo, valor) for campo, valor in registro.items()
+                if campo not in _CAMPOS_FIJOS or valor is None)
+    contador.sumar(len(historial))
+    bloques_historial.append(_U32.pack(len(extras)))
+    bloques_historial += [_DOS_U32.pack(posicion, codificador.cadena(json.dumps(extra, ensure_ascii=False)))
+                          for posicion, extra in sorted(extras.items())]
+
+    # Los valores y nombres de idioma van al final de la tabla de cadenas
+    nombres_idiomas = [_DOS_U32.pack(codificador.cadena(idioma.value), codificador.cadena(idioma.name))
+                       for idioma in codificador.idiomas]
+    texto = ''.join(cadenas).encode('utf-8', 'surrogatepass')
+    return [
+        _CABECERA.pack(FIRMA, VERSION, 0),
+        _DOS_U32.pack(len(cadenas), len(texto)),
+        _columna(_U32_CODIGO, [len(cadena) for cadena in cadenas]),
+        texto,
+        _U16.pack(len(codificador.idiomas)),
+        *nombres_idiomas,
+        _U32.pack(len(bloques_pares) // 9),
+        *bloques_pares,
+        *bloques_historial,
+    ]
+
+
+class _Lector:
+    """Recorre el contenido de un archivo binario, con comprobación de límites"""
+
+    def __init__(self, contenido):
+        self.contenido = memoryview(contenido)
+        self.posicion = 0
+
+    def _trozo(self, tamano):
+        inicio = self.posicion
+        if inicio + tamano > len(self.contenido):
+            raise ValueError("Archivo binario truncado")
+        self.posicion = inicio + tamano
+        return self.contenido[inicio:inicio + tamano]
+
+    def struct(self, formato):
+        return formato.unpack(self._trozo(formato.size))
+
+    def columna(self, codigo, n):
+        columna = array(codigo)
+        columna.frombytes(self._trozo(n * columna.itemsize))
+        if sys.byteorder == 'big':
+            columna.byteswap()
+        return columna.tolist()
+
+    def fechas(self, n):
+        return [datetime(*campos) for campos in _FECHA.iter_unpack(self._trozo(n * _FECHA.size))]
+
+    def bytes(self, n):
+        return self._trozo(n)
+
+
+def es_binario(contenido):
+    return bytes(contenido[:len(FIRMA)]) == FIRMA
+
+
+def decodificar(contenido, progreso=None):
+    """(diccionario_nuevo, historial_nuevo) a partir del contenido de un archivo binario"""
+    lector = _Lector(contenido)
+    contador = Contador(progreso, 'Procesando')
+    firma, version, _ = lector.struct(_CABECERA)
+    if firma != FIRMA:
+        raise ValueError("No es un archivo binario del traductor")
+    if version > VERSION:
+        raise ValueError(f"Versión de archivo binario no soportada: {version}")
+
+    n_cadenas, n_bytes = lector.struct(_DOS_U32)
+    longitudes = lector.columna(_U32_CODIGO, n_cadenas)
+    texto = str(lector.bytes(n_bytes), 'utf-8', 'surrogatepass')
+    limites = list(accumulate(longitudes, initial=0))
+    if limites[-1] != len(texto):
+        raise ValueError("Tabla de cadenas inconsistente")
+    cadenas = [intern(texto[inicio:fin]) for inicio, fin in zip(limites, limites[1:])]
+    del texto
+
+    (n_idiomas,) = lector.struct(_U16)
+    idiomas = []
+    for _ in range(n_idiomas):
+        valor, nombre = lector.struct(_DOS_U32)
+        idiomas.append(registrar_idioma(cadenas[valor], cadenas[nombre]))
+
+    diccionario_nuevo = {}
+    (n_pares,) = lector.struct(_U32)
+    nueva = Traduccion.__new__
+    for _ in range(n_pares):
+        origen, destino, filas, n_puntuaciones = lector.struct(_PAR)
+        claves = lector.columna(_U32_CODIGO, filas)
+        textos = lector.columna(_U32_CODIGO, filas)
+        promedios = lector.columna('d', filas)
+        totales = lector.columna('q', filas)
+        creaciones = lector.fechas(filas)
+        modificaciones = lector.fechas(filas)
+        longitudes_historial = lector.columna(_U32_CODIGO, filas)
+        puntuaciones = lector.columna('d', n_puntuaciones)
+        if sum(longitudes_historial) != n_puntuaciones:
+            raise ValueError("Puntuaciones inconsistentes en el archivo binario")
+
+        tabla = diccionario_nuevo.setdefault(idiomas[origen], {}).setdefault(idiomas[destino], {})
+        inicio = 0
+        for clave, texto, promedio, total, creacion, modificacion, longitud in zip(
+                claves, textos, promedios, totales, creaciones, modificaciones, longitudes_historial):
+            fin = inicio + longitud
+            traduccion = nueva(Traduccion)
+            traduccion.texto = cadenas[texto]
+            traduccion.puntuacion_promedio = promedio
+            traduccion.total_evaluaciones = total
+            historial = traduccion.historial_puntuaciones = puntuaciones[inicio:fin]
+            traduccion.suma_puntuaciones = sum(historial)
+            traduccion.fecha_creacion = creacion
+            traduccion.fecha_ultima_modificacion = modificacion
+            traduccion._generacion = 0
+            tabla[cadenas[clave]] = traduccion
+            inicio = fin
+        contador.sumar(filas)
+
+    (m,) = lector.struct(_U32)
+    por_posicion = dict(enumerate(idiomas))
+    por_posicion[NINGUNO] = None
+    fechas = lector.fechas(m)
+    acciones = [cadenas[i] if i != NINGUNA else None for i in lector.columna(_U32_CODIGO, m)]
+    origenes = [por_posicion[i] for i in lector.columna('H', m)]
+    destinos = [por_posicion[i] for i in lector.columna('H', m)]
+    textos_origen = [cadenas[i] if i != NINGUNA else None for i in lector.columna(_U32_CODIGO, m)]
+    textos_traduccion = [cadenas[i] if i != NINGUNA else None for i in lector.columna(_U32_CODIGO, m)]
+    puntuaciones = [None if tipo == 0 else int(valor) if tipo == 1 else valor
+                    for tipo, valor in zip(lector.columna('B', m), lector.columna('d', m))]
+    anteriores = [None if tipo == 0 else int(valor) if tipo == 1 else valor
+                  for tipo, valor in zip(lector.columna('B', m), lector.columna('d', m))]
+
+    historial_nuevo = []
+    for fecha, accion, origen, destino, texto_origen, texto_traduccion, puntuacion, anterior in zip(
+            fechas, acciones, origenes, destinos, textos_origen, textos_traduccion, puntuaciones, anteriores):
+        registro = {'fecha': fecha}
+        if accion is not None:
+            registro['accion'] = accion
+        if origen is not None:
+            registro['origen'] = origen
+        if destino is not None:
+            registro['destino'] = destino
+        if texto_origen is not None:
+            registro['texto_origen'] = texto_origen
+        if texto_traduccion is not None:
+            registro['texto_traduccion'] = texto_traduccion
+        if puntuacion is not None:
+            registro['puntuacion'] = puntuacion
+        if anterior is not None:
+            registro['puntuacion_anterior'] = anterior
+        historial_nuevo.append(registro)
+    contador.sumar(m)
+
+    (e,) = lector.struct(_U32)
+    for _ in range(e):
+        posicion, extra = lector.struct(_DOS_U32)
+        historial_nuevo[posicion].update(json.loads(cadenas[extra]))
+    return diccionario_nuevo, historial_nuevo
@@ -0,0 +1,73 @@
+"""Filtro de Bloom para descartar consultas que seguro no están en un par"""
+import math
+
+
+class FiltroBloom:
+    """
+    Conjunto probabilístico de textos: si un texto no está, lo asegura; si
+    dice que está, puede equivocarse con probabilidad tasa_falsos_positivos
+    mientras no se superen `capacidad` elementos.
+
+    Usa el hash de Python de las cadenas (que la propia cadena cachea), así
+    que no sirve para guardarse en disco: se reconstruye en cada proceso.
+    """
+
+    def __init__(self, capacidad, tasa_falsos_positivos=0.01):
+        if not 0 < tasa_falsos_positivos < 1:
+            raise ValueError("La tasa de falsos positivos debe estar entre 0 y 1")
+        capacidad = max(capacidad, 64)
+        self.capacidad = capacidad
+        self.tasa_falsos_positivos = tasa_falsos_positivos
+        self.bits = max(64, int(-capacidad * math.log(tasa_falsos_positivos) / math.log(2) ** 2))
+        self.funciones = max(1, round(self.bits / capacidad * math.log(2)))
+        self.elementos = 0
+        self.descartes = 0
+        self.falsos_positivos = 0
+        self._tabla = bytearray((self.bits + 7) // 8)
+
+    @classmethod
+    def desde_claves(cls, claves, tasa_falsos_positivos=0.01):
+        """Filtro con holgura para el doble de las claves dadas"""
+        filtro = cls(2 * len(claves), tasa_falsos_positivos)
+        for clave in claves:
+            filtro.agregar(clave)
+        return filtro
+
+    def _posiciones(self, texto):
+        # Doble hash (Kirsch-Mitzenmacher) a partir de un único hash de 64 bits
+        valor = hash(texto)
+        h1 = valor & 0xFFFFFFFF
+        h2 = ((valor >> 32) & 0xFFFFFFFF) | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.funciones)]
+
+    def agregar(self, texto):
+        tabla = self._tabla
+        nuevo = False
+        for posicion in self._posiciones(texto):
+            byte, bit = posicion >> 3, 1 << (posicion & 7)
+            if not tabla[byte] & bit:
+                tabla[byte] |= bit
+                nuevo = True
+        if nuevo:
+            self.elementos += 1
+
+    def __contains__(self, texto):
+        # Igual que _posiciones, pero sale en la primera posición vacía
+        valor = hash(texto)
+        h1 = valor & 0xFFFFFFFF
+        h2 = ((valor >> 32) & 0xFFFFFFFF) | 1
+        bits = self.bits
+        tabla = self._tabla
+        for i in range(self.funciones):
+            posicion = (h1 + i * h2) % bits
+            if not tabla[posicion >> 3] & (1 << (posicion & 7)):
+                return False
+        return True
+
+    def saturado(self):
+        return self.elementos > self.capacidad
+
+    def tasa_estimada(self):
+        """Probabilidad teórica de falso positivo con los elementos actuales"""
+        return (1 - math.exp(-self.funciones * self.elementos / self.bits)) ** self.funciones
@@ -0,0 +1,92 @@
+"""Caché LRU de los textos que traducir() no encontró"""
+import threading
+from collections import OrderedDict
+
+
+class CacheTraducciones:
+    """
+    Caché LRU acotada de (origen, destino, texto tal cual llega) -> valor
+    (True para los textos sin traducción).
+
+    Varias formas de un mismo texto ("Hola", "HOLA") ocupan entradas distintas
+    pero comparten la clave normalizada; invalidar esa clave, al crearla,
+    elimina todas.
+    """
+
+    def __init__(self, capacidad=10000):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser positiva")
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+        self._por_clave = {}
+        self._cerrojo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self.expulsiones = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obtener(self, origen, destino, texto):
+        # Sin cerrojo: get y move_to_end son atómicos con el GIL y las
+        # invalidaciones llegan con el diccionario bloqueado para escritura.
+        # Con varios hilos los contadores son aproximados.
+        clave = (origen, destino, texto)
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+        try:
+            self._entradas.move_to_end(clave)
+        except KeyError:
+            pass  # expulsada por otro hilo entre get y move_to_end
+        self.aciertos += 1
+        return entrada[0]
+
+    def guardar(self, origen, destino, texto, texto_normalizado, traduccion):
+        clave = (origen, destino, texto)
+        normalizada = (origen, destino, texto_normalizado)
+        with self._cerrojo:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+            elif len(self._entradas) >= self.capacidad:
+                viejo, (_, viejo_normalizada) = self._entradas.popitem(last=False)
+                self._quitar_de_indice(viejo_normalizada, viejo)
+                self.expulsiones += 1
+            self._entradas[clave] = (traduccion, normalizada)
+            self._por_clave.setdefault(normalizada, set()).add(clave)
+
+    def invalidar(self, origen, destino, texto_normalizado):
+        """Elimina todas las entradas cuyo texto normaliza a texto_normalizado"""
+        with self._cerrojo:
+            claves = self._por_clave.pop((origen, destino, texto_normalizado), None)
+            if claves:
+                for clave in claves:
+                    del self._entradas[clave]
+                self.invalidaciones += len(claves)
+
+    def vaciar(self):
+        with self._cerrojo:
+            self.invalidaciones += len(self._entradas)
+            self._entradas.clear()
+            self._por_clave.clear()
+
+    def _quitar_de_indice(self, normalizada, clave):
+        claves = self._por_clave.get(normalizada)
+        if claves is not None:
+            claves.discard(clave)
+            if not claves:
+                del self._por_clave[normalizada]
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'capacidad': self.capacidad,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'invalidaciones': self.invalidaciones,
+            'expulsiones': self.expulsiones,
+        }
@@ -0,0 +1,378 @@
+"""
+Interfaz de línea de comandos del traductor.
+
+Pensada para trabajos por lotes: el diccionario se carga una sola vez por
+proceso, la entrada se procesa en streaming y la salida se escribe con búfer.
+
+Ejemplos:
+    python -m motor_traduccion -D dic.json traducir -o español -d inglés textos.txt
+    python -m motor_traduccion -D dic.json evaluar puntuaciones.csv
+    python -m motor_traduccion -D dic.json fusionar otro.json otro.bin
+    python -m motor_traduccion -D dic.json importar glosario.tsv -o español -d inglés --inversas
+    python -m motor_traduccion -D dic.json exportar traducciones.txt
+    python -m motor_traduccion -D dic.json exportar pares/ --por-pares --formato tmx
+    python -m motor_traduccion -D dic.json exportar cambios.jsonl --marca ultima_exportacion.txt
+    python -m motor_traduccion -D dic.json estadisticas
+    python -m motor_traduccion -D dic.json servir --puerto 8765
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+
+from .modelos import Idioma, idioma_desde_texto as _idioma_desde_texto
+from .modificaciones import FiltroExportacion
+from .serializacion import es_json, ruta_anterior
+from .traductor import TAMANO_LOTE_IMPORTACION, TraductorAprendizaje
+
+TAMANO_BLOQUE_SALIDA = 4096
+TAMANO_LOTE_EVALUACIONES = 50000
+
+
+def idioma_desde_texto(texto):
+    """Convierte 'inglés', 'ingles' o 'INGLES' en un Idioma (argparse type)"""
+    idioma = _idioma_desde_texto(texto)
+    if idioma is None:
+        opciones = ", ".join(i.value for i in Idioma)
+        raise argparse.ArgumentTypeError(f"idioma desconocido '{texto}' (opciones: {opciones})")
+    return idioma
+
+
+def tasa_falsos_positivos(texto):
+    """Probabilidad entre 0 y 1, exclusivos (argparse type)"""
+    try:
+        tasa = float(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tasa inválida '{texto}'")
+    if not 0 < tasa < 1:
+        raise argparse.ArgumentTypeError("la tasa debe estar entre 0 y 1")
+    return tasa
+
+
+def cargar_traductor(archivo, capacidad_fallos=0, tasa_falsos_positivos=None):
+    """
+    Crea el traductor y reemplaza su contenido con el archivo, si existe, o
+    con su copia anterior (la que deja el servicio al guardar) si el archivo
+    no se puede leer
+    """
+    traductor = TraductorAprendizaje(capacidad_fallos, tasa_falsos_positivos)
+    if archivo and (os.path.exists(archivo) or os.path.exists(ruta_anterior(archivo))):
+        if es_json(archivo):
+            exito, mensaje = traductor.cargar_diccionario_json(archivo, fusionar=False, respaldo=True)
+        else:
+            exito, mensaje = traductor.cargar_diccionario_binario(archivo, fusionar=False, respaldo=True)
+        if not exito:
+            raise SystemExit(mensaje)
+    return traductor
+
+
+def guardar_traductor(traductor, archivo, compacto=False):
+    if es_json(archivo):
+        exito, mensaje = traductor.guardar_diccionario_json(archivo, compacto=compacto)
+    else:
+        exito, mensaje = traductor.guardar_diccionario_binario(archivo)
+    if not exito:
+        raise SystemExit(mensaje)
+    print(mensaje, file=sys.stderr)
+
+
+def abrir_entrada(ruta):
+    if ruta in (None, '-'):
+        return sys.stdin
+    return open(ruta, 'r', encoding='utf-8', newline='')
+
+
+def abrir_salida(ruta):
+    if ruta in (None, '-'):
+        return sys.stdout
+    return open(ruta, 'w', encoding='utf-8', newline='')
+
+
+def comando_traducir(traductor, args):
+    """Traduce una línea por texto y escribe 'texto<TAB>traducción' (vacía si no existe)"""
+    traducidas = 0
+    no_encontradas = 0
+    bloque = []
+    entrada = abrir_entrada(args.entrada)
+    salida = abrir_salida(args.salida)
+    try:
+        for linea in entrada:
+            texto = linea.rstrip('\r\n')
+            if not texto:
+                continue
+            traduccion = traductor.traducir(args.origen, args.destino, texto, registrar=args.registrar)
+            if traduccion is None:
+                no_encontradas += 1
+                traduccion = ''
+            else:
+                traducidas += 1
+            bloque.append(f"{texto}\t{traduccion}\n")
+            if len(bloque) >= TAMANO_BLOQUE_SALIDA:
+                salida.writelines(bloque)
+                bloque.clear()
+        salida.writelines(bloque)
+        salida.flush()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"Traducidas: {traducidas} | Sin traducción: {no_encontradas}", file=sys.stderr)
+    return args.registrar
+
+
+def comando_evaluar(traductor, args):
+    """
+    Aplica las puntuaciones de un CSV con columnas origen,destino,texto,puntuacion.
+    Las filas se aplican en lotes con evaluar_lote, que agrupa las de una
+    misma entrada y la actualiza una sola vez por lote.
+    """
+    aceptadas = 0
+    rechazadas = 0
+    lote = []
+    lineas = []
+
+    def aplicar_lote():
+        nonlocal aceptadas, rechazadas
+        aceptadas_lote, rechazos = traductor.evaluar_lote(lote)
+        aceptadas += aceptadas_lote
+        rechazadas += len(rechazos)
+        if args.detalle:
+            for posicion, mensaje in rechazos:
+                print(f"Línea {lineas[posicion]}: {mensaje}", file=sys.stderr)
+        lote.clear()
+        lineas.clear()
+
+    entrada = abrir_entrada(args.csv)
+    try:
+        lector = csv.DictReader(entrada)
+        for numero, fila in enumerate(lector, 2):
+            try:
+                origen = idioma_desde_texto(fila['origen'])
+                destino = idioma_desde_texto(fila['destino'])
+                puntuacion = float(fila['puntuacion'])
+                texto = fila['texto']
+                if texto is None:
+                    raise ValueError("falta el texto")
+            except (AttributeError, KeyError, TypeError, ValueError, argparse.ArgumentTypeError) as e:
+                rechazadas += 1
+                if args.detalle:
+                    print(f"Línea {numero}: fila inválida ({e})", file=sys.stderr)
+                continue
+            lote.append((origen, destino, texto, puntuacion))
+            lineas.append(numero)
+            if len(lote) >= TAMANO_LOTE_EVALUACIONES:
+                aplicar_lote()
+        aplicar_lote()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+
+    print(f"Evaluaciones aceptadas: {aceptadas} | Rechazadas: {rechazadas}", file=sys.stderr)
+    return aceptadas > 0
+
+
+def comando_fusionar(traductor, args):
+    """Fusiona uno o varios diccionarios con el cargado"""
+    for archivo in args.archivos:
+        if es_json(archivo):
+            exito, mensaje = traductor.cargar_diccionario_json(archivo, fusionar=True)
+        else:
+            exito, mensaje = traductor.cargar_diccionario_binario(archivo, fusionar=True)
+        print(mensaje, file=sys.stderr)
+        if not exito:
+            raise SystemExit(1)
+    return True
+
+
+def comando_importar(traductor, args):
+    """Importa glosarios TSV/CSV/TMX en streaming"""
+    for archivo in args.archivos:
+        exito, mensaje = traductor.importar_archivo(
+            archivo, args.origen, args.destino, formato=args.formato, inversas=args.inversas,
+            codigo_origen=args.codigo_origen, codigo_destino=args.codigo_destino, tamano_lote=args.lote)
+        print(mensaje, file=sys.stderr)
+        if not exito:
+            raise SystemExit(1)
+    return True
+
+
+def par_de_idiomas(texto):
+    """'español:inglés' -> (Idioma.ESPANOL, Idioma.INGLES) (argparse type)"""
+    origen, separador, destino = texto.partition(':')
+    if not separador:
+        raise argparse.ArgumentTypeError(f"par inválido '{texto}' (use origen:destino)")
+    return idioma_desde_texto(origen), idioma_desde_texto(destino)
+
+
+def fecha_iso(texto):
+    """Fecha ISO 8601, p. ej. 2024-05-01 o 2024-05-01T12:30 (argparse type)"""
+    try:
+        return datetime.fromisoformat(texto.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"fecha inválida '{texto}'")
+
+
+def comando_exportar(traductor, args):
+    """
+    Exporta todo o, con filtros, sólo parte. Con --marca, la fecha guardada
+    en ese archivo hace de --desde y al terminar se guarda la de esta
+    exportación, para que cada ejecución exporte sólo lo cambiado desde la
+    anterior.
+    """
+    desde = args.desde
+    if desde is None and args.marca and os.path.exists(args.marca):
+        with open(args.marca, 'r', encoding='utf-8') as f:
+            desde = fecha_iso(f.read())
+    filtro = None
+    if args.par or desde or args.puntuacion_minima is not None or args.puntuacion_maxima is not None \
+            or args.evaluaciones_minimas is not None:
+        filtro = FiltroExportacion(args.par or None, args.puntuacion_minima, args.puntuacion_maxima,
+                                   args.evaluaciones_minimas, desde)
+    inicio = datetime.now()
+    if args.por_pares:
+        exito, mensaje = traductor.exportar_por_pares(args.archivo, args.formato or 'tsv', args.hilos, filtro)
+    else:
+        exito, mensaje = traductor.exportar_traducciones(args.archivo, args.formato,
+                                                         estadisticas=not args.sin_estadisticas, filtro=filtro)
+    if exito and args.marca:
+        with open(args.marca, 'w', encoding='utf-8') as f:
+            f.write(inicio.isoformat() + "\n")
+    print(mensaje, file=sys.stderr)
+    if not exito:
+        raise SystemExit(1)
+    return False
+
+
+def comando_estadisticas(traductor, args):
+    estadisticas = traductor.obtener_estadisticas()
+    if args.json:
+        json.dump(estadisticas, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return False
+
+    print(f"Total de traducciones: {estadisticas['total_traducciones']}")
+    print(f"Total de evaluaciones: {estadisticas['total_evaluaciones']}")
+    print(f"Puntuación global promedio: {estadisticas['puntuacion_global']:.2f}/10")
+    print(f"Acciones en historial: {estadisticas['historial_traducciones']}")
+    for idioma_str, stats in estadisticas['estadisticas_idiomas'].items():
+        print(f"{idioma_str}: {stats['como_origen']} como origen, {stats['como_destino']} como destino")
+    if 'cache_fallos' in estadisticas:
+        cache = estadisticas['cache_fallos']
+        print(f"Caché de fallos: {cache['entradas']}/{cache['capacidad']} entradas, "
+              f"{cache['aciertos']} aciertos, {cache['fallos']} fallos")
+    if 'filtro_bloom' in estadisticas:
+        filtro = estadisticas['filtro_bloom']
+        print(f"Filtro de Bloom: tasa configurada {filtro['tasa_configurada']:.4f}, "
+              f"estimada {filtro['tasa_estimada']:.4f}, observada {filtro['tasa_observada']:.4f}")
+    return False
+
+
+def comando_servir(traductor, args):
+    if args.asincrono:
+        from .servidor_async import servir_asincrono
+
+        return servir_asincrono(traductor, args.host, args.puerto, args.diccionario, args.intervalo_guardado)
+
+    from .servidor import servir
+
+    return servir(traductor, args.host, args.puerto, args.diccionario, args.verboso)
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m motor_traduccion",
+        description="Traductor con aprendizaje en modo por lotes"
+    )
+    parser.add_argument('-D', '--diccionario', required=True,
+                        help="Archivo del diccionario (.json o binario); se crea si no existe")
+    parser.add_argument('--salida-diccionario',
+                        help="Guardar el diccionario modificado aquí en lugar de sobrescribir --diccionario")
+    parser.add_argument('--sin-guardar', action='store_true',
+                        help="No guardar el diccionario al terminar")
+    parser.add_argument('--compacto', action='store_true',
+                        help="Guardar el JSON por filas y sin espacios (se comprime si el nombre acaba en .gz, .xz o .bz2)")
+    parser.add_argument('--cache-fallos', type=int, default=0, metavar='N',
+                        help="Recordar hasta N textos sin traducción (0 = no recordar)")
+    parser.add_argument('--tasa-bloom', type=tasa_falsos_positivos, metavar='P',
+                        help="Descartar fallos con un filtro de Bloom por par con esta tasa de falsos positivos")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    p = subparsers.add_parser('traducir', help="Traducir textos línea a línea")
+    p.add_argument('entrada', nargs='?', default='-', help="Archivo de entrada ('-' para stdin)")
+    p.add_argument('-o', '--origen', type=idioma_desde_texto, required=True)
+    p.add_argument('-d', '--destino', type=idioma_desde_texto, required=True)
+    p.add_argument('-s', '--salida', default='-', help="Archivo de salida ('-' para stdout)")
+    p.add_argument('--registrar', action='store_true',
+                   help="Anotar cada traducción en el historial (y guardar al terminar)")
+    p.set_defaults(funcion=comando_traducir)
+
+    p = subparsers.add_parser('evaluar', help="Aplicar evaluaciones desde un CSV")
+    p.add_argument('csv', help="CSV con cabecera origen,destino,texto,puntuacion ('-' para stdin)")
+    p.add_argument('--detalle', action='store_true', help="Mostrar cada fila rechazada")
+    p.set_defaults(funcion=comando_evaluar)
+
+    p = subparsers.add_parser('fusionar', help="Fusionar otros diccionarios con el cargado")
+    p.add_argument('archivos', nargs='+')
+    p.set_defaults(funcion=comando_fusionar)
+
+    p = subparsers.add_parser('importar', help="Importar glosarios TSV, CSV o TMX")
+    p.add_argument('archivos', nargs='+')
+    p.add_argument('-o', '--origen', type=idioma_desde_texto, required=True)
+    p.add_argument('-d', '--destino', type=idioma_desde_texto, required=True)
+    p.add_argument('--formato', choices=('tsv', 'csv', 'tmx'),
+                   help="Formato de los archivos (por defecto, según la extensión)")
+    p.add_argument('--inversas', action='store_true', help="Agregar también la traducción inversa")
+    p.add_argument('--codigo-origen', help="Código xml:lang del origen en TMX (p. ej. 'es')")
+    p.add_argument('--codigo-destino', help="Código xml:lang del destino en TMX (p. ej. 'en')")
+    p.add_argument('--lote', type=int, default=TAMANO_LOTE_IMPORTACION, metavar='N',
+                   help="Filas fusionadas por lote")
+    p.set_defaults(funcion=comando_importar)
+
+    p = subparsers.add_parser('exportar', help="Exportar las traducciones a texto, TSV, CSV, JSONL o TMX")
+    p.add_argument('archivo', help="Archivo de salida (o directorio con --por-pares)")
+    p.add_argument('--formato', choices=('texto', 'tsv', 'csv', 'jsonl', 'tmx'),
+                   help="Formato de salida (por defecto, según la extensión)")
+    p.add_argument('--sin-estadisticas', action='store_true',
+                   help="No calcular las estadísticas de la cabecera del listado de texto")
+    p.add_argument('--por-pares', action='store_true',
+                   help="Escribir un archivo por par de idiomas en el directorio indicado")
+    p.add_argument('--hilos', type=int, default=4, help="Hilos para --por-pares")
+    p.add_argument('--par', type=par_de_idiomas, action='append', metavar='ORIGEN:DESTINO',
+                   help="Exportar sólo este par (se puede repetir)")
+    p.add_argument('--puntuacion-minima', type=float, metavar='P')
+    p.add_argument('--puntuacion-maxima', type=float, metavar='P')
+    p.add_argument('--evaluaciones-minimas', type=int, metavar='N')
+    p.add_argument('--desde', type=fecha_iso, metavar='FECHA',
+                   help="Sólo traducciones modificadas desde esta fecha ISO")
+    p.add_argument('--marca', metavar='ARCHIVO',
+                   help="Exportación incremental: leer --desde de este archivo y guardar en él la fecha actual")
+    p.set_defaults(funcion=comando_exportar)
+
+    p = subparsers.add_parser('estadisticas', help="Mostrar estadísticas del diccionario")
+    p.add_argument('--json', action='store_true', help="Salida en JSON")
+    p.set_defaults(funcion=comando_estadisticas)
+
+    p = subparsers.add_parser('servir', help="Servir el diccionario por HTTP local")
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--puerto', type=int, default=8765)
+    p.add_argument('--verboso', action='store_true', help="Registrar cada petición")
+    p.add_argument('--asincrono', action='store_true',
+                   help="Usar el servidor asyncio (consultas agrupadas, evaluaciones por lotes)")
+    p.add_argument('--intervalo-guardado', type=float, default=5.0,
+                   help="Segundos entre guardados automáticos en modo asíncrono")
+    p.set_defaults(funcion=comando_servir)
+
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    traductor = cargar_traductor(args.diccionario, args.cache_fallos, args.tasa_bloom)
+    modificado = args.funcion(traductor, args)
+    if modificado and not args.sin_guardar:
+        guardar_traductor(traductor, args.salida_diccionario or args.diccionario, args.compacto)
+    return 0
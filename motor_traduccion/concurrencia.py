@@ -0,0 +1,180 @@
+"""
+Modo concurrente del traductor.
+
+TraductorAprendizajeConcurrente protege el diccionario con un cerrojo de
+lectores/escritor: las consultas (traducir, existe_traduccion, mejores y
+peores) se ejecutan en paralelo entre sí y sólo esperan a las operaciones que
+modifican el diccionario (agregar, evaluar, fusionar, cargar y limpiar), que
+se ejecutan de una en una. Estadísticas, guardado y exportación leen una
+instantánea y no retienen el cerrojo mientras recorren el diccionario.
+
+traducir() sigue anotando en el historial bajo el cerrojo de lectura: la
+única mutación es un list.append, que es atómico en CPython, y ninguna
+operación de lectura depende de que el historial no crezca mientras tanto.
+"""
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+from .traductor import TraductorAprendizaje
+
+
+class CerrojoLecturaEscritura:
+    """
+    Cerrojo de múltiples lectores y un escritor que alterna turnos.
+
+    Un escritor que espera impide la entrada de lectores nuevos, y al
+    liberar la escritura pasan primero todos los lectores que estaban
+    esperando: así ni un flujo continuo de consultas deja sin turno a las
+    evaluaciones ni un flujo de evaluaciones deja sin turno a las consultas.
+
+    Es reentrante: un hilo puede volver a tomar la lectura que ya tiene, y el
+    escritor puede tomar tanto lectura como escritura de nuevo. Pasar de
+    lectura a escritura no está permitido (provocaría un interbloqueo).
+    """
+
+    def __init__(self):
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escritor = None
+        self._profundidad_escritura = 0
+        self._escritores_esperando = 0
+        self._lectores_esperando = 0
+        self._lectores_con_turno = 0
+        self._local = threading.local()
+
+    def adquirir_lectura(self):
+        if self._escritor == threading.get_ident():
+            self._profundidad_escritura += 1
+            return
+        lecturas = getattr(self._local, 'lecturas', 0)
+        if lecturas:
+            self._local.lecturas = lecturas + 1
+            return
+        with self._condicion:
+            self._lectores_esperando += 1
+            try:
+                while self._escritor is not None or (self._escritores_esperando and not self._lectores_con_turno):
+                    self._condicion.wait()
+            finally:
+                self._lectores_esperando -= 1
+            self._lectores += 1
+            if self._lectores_con_turno:
+                self._lectores_con_turno -= 1
+        self._local.lecturas = 1
+
+    def liberar_lectura(self):
+        if self._escritor == threading.get_ident():
+            self._profundidad_escritura -= 1
+            return
+        self._local.lecturas -= 1
+        if self._local.lecturas:
+            return
+        with self._condicion:
+            self._lectores -= 1
+            if not self._lectores:
+                self._condicion.notify_all()
+
+    def adquirir_escritura(self):
+        yo = threading.get_ident()
+        if self._escritor == yo:
+            self._profundidad_escritura += 1
+            return
+        if getattr(self._local, 'lecturas', 0):
+            raise RuntimeError("No se puede pasar de lectura a escritura")
+        with self._condicion:
+            self._escritores_esperando += 1
+            try:
+                while self._escritor is not None or self._lectores or self._lectores_con_turno:
+                    self._condicion.wait()
+            finally:
+                self._escritores_esperando -= 1
+            self._escritor = yo
+            self._profundidad_escritura = 1
+
+    def liberar_escritura(self):
+        self._profundidad_escritura -= 1
+        if self._profundidad_escritura:
+            return
+        with self._condicion:
+            self._escritor = None
+            # Sólo los lectores que ya esperaban tienen turno; los que lleguen
+            # después esperan al siguiente escritor
+            self._lectores_con_turno = self._lectores_esperando
+            self._condicion.notify_all()
+
+    @contextmanager
+    def lectura(self):
+        self.adquirir_lectura()
+        try:
+            yield
+        finally:
+            self.liberar_lectura()
+
+    @contextmanager
+    def escritura(self):
+        self.adquirir_escritura()
+        try:
+            yield
+        finally:
+            self.liberar_escritura()
+
+
+def _con_lectura(metodo):
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        self.cerrojo.adquirir_lectura()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self.cerrojo.liberar_lectura()
+    return envoltura
+
+
+def _con_escritura(metodo):
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        self.cerrojo.adquirir_escritura()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            self.cerrojo.liberar_escritura()
+    return envoltura
+
+
+class TraductorAprendizajeConcurrente(TraductorAprendizaje):
+    """TraductorAprendizaje seguro para usar desde varios hilos a la vez"""
+
+    def __init__(self, capacidad_fallos=0, tasa_falsos_positivos=None, ranking=None):
+        self.cerrojo = CerrojoLecturaEscritura()
+        super().__init__(capacidad_fallos, tasa_falsos_positivos, ranking)
+
+    traducir = _con_lectura(TraductorAprendizaje.traducir)
+    existe_traduccion = _con_lectura(TraductorAprendizaje.existe_traduccion)
+    obtener_mejores_traducciones = _con_lectura(TraductorAprendizaje.obtener_mejores_traducciones)
+    obtener_peores_traducciones = _con_lectura(TraductorAprendizaje.obtener_peores_traducciones)
+    obtener_pagina_traducciones = _con_lectura(TraductorAprendizaje.obtener_pagina_traducciones)
+    autocompletar = _con_lectura(TraductorAprendizaje.autocompletar)
+    consultar_historial = _con_lectura(TraductorAprendizaje.consultar_historial)
+    usar_ranking = _con_escritura(TraductorAprendizaje.usar_ranking)
+
+    # obtener_total_traducciones sólo lee un entero: no toma el cerrojo, así que
+    # la interfaz puede consultarlo sin esperar a una carga en curso
+
+    # Estadísticas, guardado y exportación trabajan sobre una instantánea: sólo
+    # crearla necesita excluir a los escritores, el recorrido no bloquea a nadie
+    instantanea = _con_lectura(TraductorAprendizaje.instantanea)
+    instantanea_ordenada = _con_lectura(TraductorAprendizaje.instantanea_ordenada)
+    modificadas_desde = _con_lectura(TraductorAprendizaje.modificadas_desde)
+
+    agregar_traduccion_con_puntuacion = _con_escritura(TraductorAprendizaje.agregar_traduccion_con_puntuacion)
+    evaluar_traduccion = _con_escritura(TraductorAprendizaje.evaluar_traduccion)
+    evaluar_lote = _con_escritura(TraductorAprendizaje.evaluar_lote)
+    fusionar_traduccion = _con_escritura(TraductorAprendizaje.fusionar_traduccion)
+    fusionar_diccionario_completo = _con_escritura(TraductorAprendizaje.fusionar_diccionario_completo)
+    fijar_puntuaciones = _con_escritura(TraductorAprendizaje.fijar_puntuaciones)
+    # importar_archivo no se envuelve: lee el archivo sin cerrojo y sólo cada lote lo toma
+    importar_lote = _con_escritura(TraductorAprendizaje.importar_lote)
+    # Las cargas leen y convierten el archivo sin cerrojo; sólo aplicar lo leído excluye a los lectores
+    aplicar_carga = _con_escritura(TraductorAprendizaje.aplicar_carga)
+    limpiar_diccionario = _con_escritura(TraductorAprendizaje.limpiar_diccionario)
@@ -0,0 +1,191 @@
+"""Operaciones de sólo lectura comunes al traductor y a sus instantáneas"""
+from . import serializacion
+from .modelos import Idioma
+from .pares import VistaDiccionario
+from .progreso import OperacionCancelada
+
+class ConsultasDiccionario:
+    """
+    Consultas, estadísticas, guardado y exportación.
+
+    Sólo leen self._matriz (MatrizPares), self.historial_traducciones y
+    self.ranking, de modo que funcionan igual sobre el traductor vivo que
+    sobre una instantánea.
+    """
+    @property
+    def diccionario(self):
+        """Vista {origen: {destino: {texto: Traduccion}}} de las tablas de pares"""
+        return VistaDiccionario(self._matriz)
+    
+    def existe_traduccion(self, idioma_origen, idioma_destino, texto):
+        tabla = self._matriz.tabla(idioma_origen, idioma_destino)
+        return tabla is not None and texto.lower() in tabla
+    
+    def obtener_total_traducciones(self):
+        """Obtiene el número total de traducciones en el diccionario"""
+        total = 0
+        for _, _, traducciones in self._matriz.pares():
+            total += len(traducciones)
+        return total
+    
+    def obtener_estadisticas(self):
+        total_traducciones = 0
+        total_evaluaciones = 0
+        puntuacion_global = 0
+        combinaciones_con_traducciones = 0
+        
+        estadisticas_idiomas = {}
+        
+        for idioma in Idioma:
+            estadisticas_idiomas[idioma.value] = {
+                'como_origen': 0,
+                'como_destino': 0,
+                'mejor_puntuacion': 0,
+                'peor_puntuacion': 10
+            }
+        
+        for idioma_origen, idioma_destino, traducciones in self._matriz.pares():
+            if traducciones:
+                total_combinacion = len(traducciones)
+                total_traducciones += total_combinacion
+                
+                estadisticas_idiomas[idioma_origen.value]['como_origen'] += total_combinacion
+                estadisticas_idiomas[idioma_destino.value]['como_destino'] += total_combinacion
+                
+                suma_puntuaciones = 0
+                for trad in traducciones.values():
+                    suma_puntuaciones += trad.puntuacion_promedio
+                    total_evaluaciones += trad.total_evaluaciones
+                    
+                    if trad.puntuacion_promedio > estadisticas_idiomas[idioma_origen.value]['mejor_puntuacion']:
+                        estadisticas_idiomas[idioma_origen.value]['mejor_puntuacion'] = trad.puntuacion_promedio
+                    if trad.puntuacion_promedio < estadisticas_idiomas[idioma_origen.value]['peor_puntuacion']:
+                        estadisticas_idiomas[idioma_origen.value]['peor_puntuacion'] = trad.puntuacion_promedio
+                
+                promedio_combinacion = suma_puntuaciones / len(traducciones) if traducciones else 0
+                puntuacion_global += promedio_combinacion
+                combinaciones_con_traducciones += 1
+        
+        puntuacion_global_promedio = puntuacion_global / combinaciones_con_traducciones if combinaciones_con_traducciones > 0 else 0
+        
+        return {
+            'total_traducciones': total_traducciones,
+            'total_evaluaciones': total_evaluaciones,
+            'puntuacion_global': puntuacion_global_promedio,
+            'combinaciones_con_traducciones': combinaciones_con_traducciones,
+            'estadisticas_idiomas': estadisticas_idiomas,
+            'historial_traducciones': len(self.historial_traducciones)
+        }
+    
+    def obtener_mejores_traducciones(self, idioma_origen, idioma_destino, limite=10):
+        traducciones = self._matriz.tabla(idioma_origen, idioma_destino)
+        if traducciones is None:
+            return []
+        
+        lista_traducciones = [
+            (texto_origen, trad) 
+            for texto_origen, trad in traducciones.items()
+        ]
+        
+        clave = self.ranking.clave
+        lista_traducciones.sort(key=lambda x: clave(x[1]), reverse=True)
+        
+        return lista_traducciones[:limite]
+    
+    def obtener_peores_traducciones(self, idioma_origen, idioma_destino, limite=10):
+        traducciones = self._matriz.tabla(idioma_origen, idioma_destino)
+        if traducciones is None:
+            return []
+        
+        lista_traducciones = [
+            (texto_origen, trad) 
+            for texto_origen, trad in traducciones.items()
+        ]
+        
+        clave = self.ranking.clave
+        lista_traducciones.sort(key=lambda x: clave(x[1]))
+        
+        return lista_traducciones[:limite]
+    
+    def obtener_pagina_traducciones(self, idioma_origen, idioma_destino, inicio, cantidad, mejores=True):
+        """
+        (total, [(texto_origen, traduccion)]) de las posiciones [inicio,
+        inicio + cantidad) del par, contando desde la mejor o desde la peor.
+        """
+        traducciones = self._matriz.tabla(idioma_origen, idioma_destino)
+        if traducciones is None:
+            return 0, []
+        if cantidad <= 0 or inicio < 0:
+            return len(traducciones), []
+        
+        clave = self.ranking.clave
+        lista_traducciones = sorted(traducciones.items(), key=lambda x: clave(x[1]), reverse=mejores)
+        
+        return len(traducciones), lista_traducciones[inicio:inicio + cantidad]
+    
+    def guardar_diccionario_binario(self, archivo, conservar_anterior=False, progreso=None):
+        try:
+            serializacion.escribir_binario(self, archivo, conservar_anterior, progreso)
+            
+            return True, f"Diccionario guardado exitosamente en {archivo}"
+            
+        except OperacionCancelada:
+            return False, "Guardado cancelado"
+        except Exception as e:
+            return False, f"Error al guardar el diccionario: {str(e)}"
+    
+    def guardar_diccionario_json(self, archivo, codec=None, compacto=False, conservar_anterior=False,
+                                 progreso=None):
+        """
+        JSON clásico con sangría o, con compacto=True, por filas y sin
+        espacios. codec ('gzip', 'lzma', 'bz2' o 'ninguno') se deduce de la
+        extensión si no se indica: 'dic.json.gz' se comprime con gzip. Con
+        conservar_anterior=True el archivo sustituido pasa a
+        serializacion.ruta_anterior(archivo). Ver motor_traduccion.progreso
+        para progreso.
+        """
+        try:
+            codec = codec or serializacion.codec_de_archivo(archivo)
+            if compacto:
+                datos_completos = serializacion.datos_por_filas(self, progreso)
+            else:
+                datos_completos = serializacion.datos_clasicos(self, progreso)
+            
+            serializacion.escribir_json(datos_completos, archivo, codec, compacto, conservar_anterior, progreso)
+            
+            return True, f"Diccionario guardado en formato JSON en {archivo}"
+            
+        except OperacionCancelada:
+            return False, "Guardado cancelado"
+        except Exception as e:
+            return False, f"Error al guardar el diccionario JSON: {str(e)}"
+    
+    def exportar_traducciones_texto(self, archivo):
+        return self.exportar_traducciones(archivo, 'texto')
+    
+    def exportar_traducciones(self, archivo, formato=None, estadisticas=True, ordenes=None, filtro=None,
+                              cambios=None, progreso=None):
+        """
+        Exporta en streaming a texto, TSV, CSV, JSONL o TMX (formato según la
+        extensión si no se indica), sólo lo que acepte filtro si se indica;
+        ver motor_traduccion.exportacion.
+        """
+        from . import exportacion
+        
+        try:
+            total = exportacion.exportar(self, archivo, formato, estadisticas, ordenes, filtro, cambios, progreso)
+            return True, f"Traducciones exportadas a {archivo} ({total} traducciones)"
+        except OperacionCancelada:
+            return False, "Exportación cancelada"
+        except Exception as e:
+            return False, f"Error al exportar traducciones: {str(e)}"
+    
+    def exportar_por_pares(self, directorio, formato='tsv', hilos=4, ordenes=None, filtro=None, cambios=None):
+        """Un archivo por par de idiomas en directorio, escritos en paralelo"""
+        from . import exportacion
+        
+        try:
+            archivos = exportacion.exportar_por_pares(self, directorio, formato, hilos, ordenes, filtro, cambios)
+            return True, f"{len(archivos)} pares exportados a {directorio}"
+        except Exception as e:
+            return False, f"Error al exportar traducciones: {str(e)}"
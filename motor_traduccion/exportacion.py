@@ -0,0 +1,267 @@
+"""
+Exportación en streaming del diccionario a texto, TSV, CSV, JSONL o TMX.
+
+Cada formato convierte una traducción en una línea (o unas pocas) y el
+exportador las escribe en bloques de TAMANO_BLOQUE filas con writelines, par
+a par, sin construir el archivo en memoria. El orden dentro de cada par es
+el del ranking (mejor primero): si el traductor tiene el índice ordenado del
+par se recorre tal cual y, si no, se ordena la tabla del par.
+
+La exportación a un solo archivo acepta una función de progreso (ver
+motor_traduccion.progreso) y escribe en un temporal que sustituye al
+archivo al terminar.
+
+Un FiltroExportacion (ver motor_traduccion.modificaciones) limita los pares
+y las traducciones exportadas. Para «lo modificado desde» el traductor pasa
+además `cambios`, los textos sacados de su índice por fecha de modificación:
+entonces sólo se visitan esos, en orden de modificación.
+"""
+import csv
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from xml.sax.saxutils import escape, quoteattr
+
+from .importacion import CODIGOS_IDIOMA
+from .ranking import recorrer_mejores
+from .serializacion import escritura_atomica
+
+TAMANO_BLOQUE = 4096
+
+
+class FormatoTexto:
+    """El listado legible de siempre, agrupado por par"""
+    nombre = 'texto'
+    extension = '.txt'
+    usa_estadisticas = True
+
+    def cabecera(self, estadisticas):
+        lineas = ["=" * 60 + "\n",
+                  "DICCIONARIO DE TRADUCCIONES - TRADUCTOR CON APRENDIZAJE\n",
+                  "=" * 60 + "\n\n",
+                  f"Fecha de exportación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"]
+        if estadisticas is not None:
+            lineas.append(f"Total de traducciones: {estadisticas['total_traducciones']}\n")
+            lineas.append(f"Puntuación global promedio: {estadisticas['puntuacion_global']:.2f}/10\n")
+        lineas.append("\n")
+        return lineas
+
+    def inicio_par(self, origen, destino):
+        return [f"\n{origen.value.upper()} → {destino.value.upper()}:\n", "-" * 40 + "\n"]
+
+    def fila(self, origen, destino, texto_origen, traduccion):
+        return (f"  {texto_origen:20} → {traduccion.texto:20} "
+                f"[{traduccion.puntuacion_promedio:.1f}/10, {traduccion.total_evaluaciones} eval.]\n")
+
+    def pie(self):
+        return []
+
+
+class FormatoTSV(FormatoTexto):
+    """
+    Una fila por traducción. Las tres primeras columnas son las que lee
+    LectorTabular, así que un archivo de un solo par se puede reimportar.
+    """
+    nombre = 'tsv'
+    extension = '.tsv'
+    usa_estadisticas = False
+    columnas = ('texto_origen', 'texto_traduccion', 'puntuacion', 'evaluaciones', 'origen', 'destino')
+
+    def cabecera(self, estadisticas):
+        return ["#" + "\t".join(self.columnas) + "\n"]
+
+    def inicio_par(self, origen, destino):
+        return []
+
+    def fila(self, origen, destino, texto_origen, traduccion):
+        # Sin comillas en TSV: tabuladores y saltos de línea del texto pasan a espacios
+        return (f"{_sin_separadores(texto_origen)}\t{_sin_separadores(traduccion.texto)}\t"
+                f"{traduccion.puntuacion_promedio:.4g}\t{traduccion.total_evaluaciones}\t"
+                f"{origen.value}\t{destino.value}\n")
+
+
+class FormatoCSV(FormatoTSV):
+    nombre = 'csv'
+    extension = '.csv'
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._escritor = csv.writer(self._buffer, lineterminator='\n')
+
+    def cabecera(self, estadisticas):
+        return [",".join(self.columnas) + "\n"]
+
+    def fila(self, origen, destino, texto_origen, traduccion):
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._escritor.writerow((texto_origen, traduccion.texto, f"{traduccion.puntuacion_promedio:.4g}",
+                                 traduccion.total_evaluaciones, origen.value, destino.value))
+        return self._buffer.getvalue()
+
+
+class FormatoJSONL(FormatoTSV):
+    """Un objeto JSON por línea"""
+    nombre = 'jsonl'
+    extension = '.jsonl'
+
+    def cabecera(self, estadisticas):
+        return []
+
+    def fila(self, origen, destino, texto_origen, traduccion):
+        # Equivale a json.dumps de un dict por fila, sin crear el dict ni el codificador cada vez
+        return (f'{{"origen": {_json(origen.value)}, "destino": {_json(destino.value)}, '
+                f'"texto_origen": {_json(texto_origen)}, "texto_traduccion": {_json(traduccion.texto)}, '
+                f'"puntuacion": {float(traduccion.puntuacion_promedio)!r}, '
+                f'"evaluaciones": {traduccion.total_evaluaciones}, '
+                f'"fecha_ultima_modificacion": "{traduccion.fecha_ultima_modificacion.isoformat()}"}}\n')
+
+
+class FormatoTMX(FormatoTSV):
+    """TMX 1.4 con un <tu> por traducción y la puntuación como <prop>"""
+    nombre = 'tmx'
+    extension = '.tmx'
+
+    def cabecera(self, estadisticas):
+        return ['<?xml version="1.0" encoding="UTF-8"?>\n<tmx version="1.4">\n',
+                '<header creationtool="motor_traduccion" creationtoolversion="1.0" datatype="plaintext" '
+                'segtype="phrase" adminlang="es" srclang="*all*" o-tmf="motor_traduccion"/>\n<body>\n']
+
+    def fila(self, origen, destino, texto_origen, traduccion):
+        return (f'<tu><prop type="x-puntuacion">{traduccion.puntuacion_promedio:.4g}</prop>'
+                f'<tuv xml:lang={quoteattr(_codigo(origen))}><seg>{escape(texto_origen)}</seg></tuv>'
+                f'<tuv xml:lang={quoteattr(_codigo(destino))}><seg>{escape(traduccion.texto)}</seg></tuv></tu>\n')
+
+    def pie(self):
+        return ['</body>\n</tmx>\n']
+
+
+FORMATOS = {formato.nombre: formato for formato in (FormatoTexto, FormatoTSV, FormatoCSV, FormatoJSONL, FormatoTMX)}
+
+
+_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _sin_separadores(texto):
+    if '\t' in texto or '\n' in texto or '\r' in texto:
+        return texto.replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+    return texto
+
+
+def _codigo(idioma):
+    return CODIGOS_IDIOMA.get(idioma.value, idioma.value)
+
+
+def formato_de_archivo(archivo):
+    """Nombre del formato según la extensión ('texto' si no se reconoce)"""
+    extension = os.path.splitext(archivo)[1].lower()
+    for formato in FORMATOS.values():
+        if formato.extension == extension and formato is not FormatoTexto:
+            return formato.nombre
+    return FormatoTexto.nombre
+
+
+def claves_ordenadas(vista, origen, destino, tabla, ordenes):
+    """Textos del par de mejor a peor: del índice copiado si lo hay, si no ordenando la tabla"""
+    orden = ordenes.get((origen, destino)) if ordenes else None
+    if orden is not None:
+        return (texto for _, _, texto in recorrer_mejores(orden))
+    clave = vista.ranking.clave
+    return sorted(tabla, key=lambda texto: clave(tabla[texto]), reverse=True)
+
+
+def escribir_pares(vista, f, formato, pares, estadisticas=None, ordenes=None, filtro=None, cambios=None,
+                   progreso=None, total=None):
+    """
+    Escribe los pares [(origen, destino, tabla)] en f; devuelve las
+    traducciones escritas. Con progreso, avisa de las filas escritas (de
+    `total`) en cada bloque.
+    """
+    filas = 0
+    bloque = formato.cabecera(estadisticas)
+    fila = formato.fila
+    for origen, destino, tabla in pares:
+        if not tabla or (filtro is not None and not filtro.incluye_par(origen, destino)):
+            continue
+        if cambios is not None:
+            textos = cambios.get((origen, destino))
+            if not textos:
+                continue
+        else:
+            textos = claves_ordenadas(vista, origen, destino, tabla, ordenes)
+        bloque.extend(formato.inicio_par(origen, destino))
+        for texto_origen in textos:
+            traduccion = tabla.get(texto_origen)
+            if traduccion is None or (filtro is not None and not filtro.acepta(traduccion)):
+                continue
+            bloque.append(fila(origen, destino, texto_origen, traduccion))
+            filas += 1
+            if len(bloque) >= TAMANO_BLOQUE:
+                f.writelines(bloque)
+                bloque = []
+                if progreso is not None:
+                    progreso('Exportando', filas, total)
+    bloque.extend(formato.pie())
+    f.writelines(bloque)
+    return filas
+
+
+@contextmanager
+def _texto_atomico(archivo):
+    """escritura_atomica en modo texto UTF-8"""
+    with escritura_atomica(archivo) as bruto:
+        f = io.TextIOWrapper(bruto, encoding='utf-8', newline='')
+        try:
+            yield f
+            f.flush()
+        finally:
+            f.detach()
+
+
+def exportar(vista, archivo, formato=None, estadisticas=True, ordenes=None, filtro=None, cambios=None,
+             progreso=None):
+    """
+    Exporta los pares de `vista` (traductor o instantánea) a un archivo;
+    devuelve las traducciones escritas. Sólo el listado de texto usa las
+    estadísticas, y se omiten con estadisticas=False o si hay filtro (son
+    del diccionario entero y exigirían recorrerlo). El archivo se sustituye
+    al terminar: una exportación fallida o cancelada no lo deja a medias.
+    """
+    formato = FORMATOS[formato or formato_de_archivo(archivo)]()
+    datos = None
+    if estadisticas and formato.usa_estadisticas and filtro is None:
+        datos = vista.obtener_estadisticas()
+    total = None
+    if progreso is not None:
+        if cambios is not None:
+            total = sum(len(textos) for textos in cambios.values())
+        else:
+            total = sum(len(tabla) for _, _, tabla in vista._matriz.pares())
+    with _texto_atomico(archivo) as f:
+        return escribir_pares(vista, f, formato, vista._matriz.pares(), datos, ordenes, filtro, cambios,
+                              progreso, total)
+
+
+def exportar_por_pares(vista, directorio, formato='tsv', hilos=4, ordenes=None, filtro=None, cambios=None):
+    """
+    Un archivo por par (<origen>-<destino><extensión>) en `directorio`,
+    escritos por un grupo de hilos. Devuelve la lista de archivos creados.
+    Como en exportar, cada archivo se sustituye al terminar de escribirlo.
+    """
+    clase = FORMATOS[formato]
+    os.makedirs(directorio, exist_ok=True)
+
+    def escribir(par):
+        origen, destino, tabla = par
+        archivo = os.path.join(directorio, f"{_codigo(origen)}-{_codigo(destino)}{clase.extension}")
+        with _texto_atomico(archivo) as f:
+            escribir_pares(vista, f, clase(), [par], None, ordenes, filtro, cambios)
+        return archivo
+
+    pares = [par for par in vista._matriz.pares()
+             if par[2] and (filtro is None or filtro.incluye_par(par[0], par[1]))
+             and (cambios is None or (par[0], par[1]) in cambios)]
+    with ThreadPoolExecutor(max_workers=max(1, hilos)) as grupo:
+        return list(grupo.map(escribir, pares))
@@ -0,0 +1,97 @@
+"""
+Índice del historial de acciones para consultarlo por páginas.
+
+El historial es una lista de registros que sólo crece por el final (cargar,
+fusionar o limpiar la sustituyen por otra). El índice guarda, para cada
+acción, cada par de idiomas, cada combinación de ambos y cada texto de
+origen, las posiciones de sus registros en orden; al consultarlo sólo
+procesa los registros añadidos desde la consulta anterior, y si la lista ha
+sido sustituida se reconstruye.
+"""
+import threading
+from array import array
+
+
+class IndiceHistorial:
+    """Posiciones del historial agrupadas por acción, par de idiomas y texto de origen"""
+
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self._registros = None
+        self._procesados = 0
+        self._grupos = {}
+        self._textos = {}
+        # Atajos para no recalcular claves en cada registro: (acción, origen,
+        # destino) -> sus tres grupos, y texto tal cual -> grupo de su minúscula
+        self._grupos_combinacion = {}
+        self._grupos_texto = {}
+
+    def _grupo(self, indice, clave):
+        grupo = indice.get(clave)
+        if grupo is None:
+            grupo = indice[clave] = array('q')
+        return grupo
+
+    def _actualizar(self, registros):
+        if registros is not self._registros or len(registros) < self._procesados:
+            self._registros = registros
+            self._procesados = 0
+            self._grupos = {}
+            self._textos = {}
+            self._grupos_combinacion = {}
+            self._grupos_texto = {}
+        grupos_combinacion = self._grupos_combinacion
+        grupos_texto = self._grupos_texto
+        nuevos = len(registros)
+        for posicion in range(self._procesados, nuevos):
+            obtener = registros[posicion].get
+            clave = (obtener('accion'), obtener('origen'), obtener('destino'))
+            destinos = grupos_combinacion.get(clave)
+            if destinos is None:
+                accion, origen, destino = clave
+                destinos = grupos_combinacion[clave] = [self._grupo(self._grupos, c) for c in (
+                    (accion, None, None), (None, origen, destino), clave)]
+            for grupo in destinos:
+                grupo.append(posicion)
+            texto = obtener('texto_origen')
+            if texto:
+                grupo = grupos_texto.get(texto)
+                if grupo is None:
+                    grupo = grupos_texto[texto] = self._grupo(self._textos, texto.lower())
+                grupo.append(posicion)
+        self._procesados = nuevos
+
+    def posiciones(self, registros, accion=None, origen=None, destino=None, texto=None):
+        """
+        Secuencia ordenada de las posiciones de `registros` que cumplen los
+        filtros (None no filtra; origen y destino se filtran juntos).
+        """
+        with self._cerrojo:
+            self._actualizar(registros)
+            total = self._procesados
+            if origen is None or destino is None:
+                origen = destino = None
+            if texto:
+                candidatas = self._textos.get(texto.lower(), ())
+                if accion is None and origen is None:
+                    return candidatas
+                return array('q', (posicion for posicion in candidatas
+                                   if (accion is None or registros[posicion].get('accion') == accion)
+                                   and (origen is None or (registros[posicion].get('origen') == origen
+                                                           and registros[posicion].get('destino') == destino))))
+            if accion is None and origen is None:
+                return range(total)
+            return self._grupos.get((accion, origen, destino), ())
+
+    def pagina(self, registros, inicio, cantidad, accion=None, origen=None, destino=None, texto=None):
+        """
+        (total, [(posicion, registro)]) de los registros que cumplen los
+        filtros, del más reciente al más antiguo, saltando los `inicio` más
+        recientes.
+        """
+        posiciones = self.posiciones(registros, accion, origen, destino, texto)
+        total = len(posiciones)
+        if cantidad <= 0 or inicio < 0:
+            return total, []
+        fin = max(total - inicio, 0)
+        return total, [(posicion, registros[posicion]) for posicion in reversed(posiciones[max(fin - cantidad, 0):fin])]
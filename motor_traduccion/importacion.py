@@ -0,0 +1,161 @@
+"""
+Lectores en streaming de glosarios externos (TSV/CSV y TMX).
+
+Cada lector recorre el archivo fila a fila y produce tuplas
+(texto_origen, texto_traduccion, puntuacion), con puntuacion None si el
+archivo no la trae; nunca construye el diccionario completo en memoria. Las
+filas que no se pueden usar se cuentan en `descartadas` (y las líneas de
+comentario de TSV/CSV, en `comentarios`).
+TraductorAprendizaje.importar_archivo los consume en lotes.
+"""
+import csv
+import os
+import xml.etree.ElementTree as ET
+
+# Código de idioma de TMX (xml:lang, sin región) para cada idioma incorporado
+CODIGOS_IDIOMA = {
+    'inglés': 'en',
+    'español': 'es',
+    'francés': 'fr',
+    'portugués': 'pt',
+}
+
+_ATRIBUTO_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+
+def formato_de_archivo(archivo):
+    """'tsv', 'csv' o 'tmx' según la extensión; None si no se reconoce"""
+    extension = os.path.splitext(archivo)[1].lower()
+    if extension in ('.tsv', '.tab', '.txt'):
+        return 'tsv'
+    if extension in ('.csv', '.tmx'):
+        return extension[1:]
+    return None
+
+
+def _puntuacion(texto):
+    """Puntuación opcional de la tercera columna; ValueError si no es válida"""
+    if texto is None or not texto.strip():
+        return None
+    puntuacion = float(texto)
+    if not 1 <= puntuacion <= 10:
+        raise ValueError(puntuacion)
+    return puntuacion
+
+
+class LectorTabular:
+    """
+    Filas texto_origen<sep>texto_traduccion[<sep>puntuacion]. Se ignoran las
+    líneas vacías y, como comentarios, las que empiezan por '#' en la propia
+    línea (un '#' entrecomillado o tras espacios es texto); los comentarios
+    se cuentan en `comentarios`. En CSV se admiten campos entrecomillados;
+    en TSV el separador es el tabulador y no hay comillas.
+    """
+
+    def __init__(self, archivo, delimitador='\t'):
+        self.archivo = archivo
+        self.delimitador = delimitador
+        self.descartadas = 0
+        self.comentarios = 0
+
+    def _filas(self, f):
+        if self.delimitador == '\t':
+            for linea in f:
+                if linea.startswith('#'):
+                    self.comentarios += 1
+                    continue
+                yield linea.rstrip('\r\n').split('\t')
+            return
+        # Sólo es comentario la línea con la que empieza un registro: la
+        # continuación de un campo entrecomillado de varias líneas es texto
+        registro_nuevo = True
+
+        def lineas():
+            nonlocal registro_nuevo
+            for linea in f:
+                if registro_nuevo and linea.startswith('#'):
+                    self.comentarios += 1
+                    continue
+                registro_nuevo = False
+                yield linea
+
+        for campos in csv.reader(lineas(), delimiter=self.delimitador):
+            registro_nuevo = True
+            yield campos
+
+    def __iter__(self):
+        with open(self.archivo, 'r', encoding='utf-8-sig', newline='') as f:
+            for campos in self._filas(f):
+                if not campos or campos == ['']:
+                    continue
+                try:
+                    texto_origen, texto_traduccion = campos[0].strip(), campos[1].strip()
+                    puntuacion = _puntuacion(campos[2]) if len(campos) > 2 else None
+                except (IndexError, ValueError):
+                    self.descartadas += 1
+                    continue
+                if not texto_origen or not texto_traduccion:
+                    self.descartadas += 1
+                    continue
+                yield texto_origen, texto_traduccion, puntuacion
+
+
+def _texto_segmento(seg):
+    """Texto de un <seg> sin los códigos de formato en línea (<bpt>, <ept>, <ph>...)"""
+    partes = [seg.text or '']
+    for hijo in seg:
+        if hijo.tag in ('hi', 'sub'):
+            partes.append(_texto_segmento(hijo))
+        partes.append(hijo.tail or '')
+    return ''.join(partes).strip()
+
+
+class LectorTMX:
+    """
+    Unidades <tu> de un archivo TMX con un <tuv> en cada idioma. Se parsea con
+    iterparse y cada unidad se descarta al procesarla, así que la memoria no
+    crece con el tamaño del archivo. Los códigos se comparan sin región
+    ('es-ES' cuenta como 'es').
+    """
+
+    def __init__(self, archivo, codigo_origen, codigo_destino):
+        self.archivo = archivo
+        self.codigo_origen = codigo_origen.lower()
+        self.codigo_destino = codigo_destino.lower()
+        self.descartadas = 0
+
+    def __iter__(self):
+        cuerpo = None
+        for evento, elemento in ET.iterparse(self.archivo, events=('start', 'end')):
+            if evento == 'start':
+                if elemento.tag == 'body':
+                    cuerpo = elemento
+                continue
+            if elemento.tag != 'tu':
+                continue
+            segmentos = {}
+            for tuv in elemento.iter('tuv'):
+                codigo = tuv.get(_ATRIBUTO_LANG) or tuv.get('lang') or ''
+                seg = tuv.find('seg')
+                if seg is not None:
+                    segmentos.setdefault(codigo.split('-')[0].lower(), _texto_segmento(seg))
+            texto_origen = segmentos.get(self.codigo_origen)
+            texto_traduccion = segmentos.get(self.codigo_destino)
+            if texto_origen and texto_traduccion:
+                yield texto_origen, texto_traduccion, None
+            else:
+                self.descartadas += 1
+            if cuerpo is not None:
+                cuerpo.clear()
+
+
+def crear_lector(archivo, formato, codigo_origen=None, codigo_destino=None):
+    if formato == 'tsv':
+        return LectorTabular(archivo, '\t')
+    if formato == 'csv':
+        return LectorTabular(archivo, ',')
+    if formato == 'tmx':
+        if not codigo_origen or not codigo_destino:
+            raise ValueError("TMX necesita el código de idioma de origen y de destino")
+        return LectorTMX(archivo, codigo_origen, codigo_destino)
+    raise ValueError(f"Formato de importación desconocido: {formato}")
@@ -0,0 +1,44 @@
+"""Instantáneas de sólo lectura del traductor (ver TraductorAprendizaje.instantanea)"""
+from datetime import datetime
+from itertools import islice
+
+from .consultas import ConsultasDiccionario
+
+
+class VistaHistorial:
+    """Los primeros n registros de una lista de historial que sólo crece por el final"""
+
+    def __init__(self, registros, longitud):
+        self._registros = registros
+        self._longitud = longitud
+
+    def __len__(self):
+        return self._longitud
+
+    def __iter__(self):
+        return islice(self._registros, self._longitud)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._registros[i] for i in range(*indice.indices(self._longitud))]
+        if indice < 0:
+            indice += self._longitud
+        if not 0 <= indice < self._longitud:
+            raise IndexError("índice de historial fuera de rango")
+        return self._registros[indice]
+
+
+class InstantaneaTraductor(ConsultasDiccionario):
+    """
+    Vista congelada del diccionario y del historial.
+
+    Sólo se copia la lista de pares; las tablas de cada par y las
+    traducciones se comparten con el traductor vivo, que las copia antes de
+    modificarlas mientras la instantánea exista. No debe modificarse.
+    """
+
+    def __init__(self, matriz, historial, ranking):
+        self.fecha = datetime.now()
+        self.ranking = ranking
+        self._matriz = matriz.copiar()
+        self.historial_traducciones = VistaHistorial(historial, len(historial))
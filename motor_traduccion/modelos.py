@@ -0,0 +1,182 @@
+"""Modelos de datos del traductor: idiomas soportados y traducciones puntuadas"""
+import threading
+from datetime import datetime
+from sys import intern
+
+class _RegistroIdiomas(type):
+    """Hace iterable la clase Idioma (en orden de id), como lo era el Enum"""
+    def __iter__(cls):
+        return iter(cls._registrados)
+    
+    def __len__(cls):
+        return len(cls._registrados)
+    
+    def __getitem__(cls, nombre):
+        return cls._por_nombre[nombre]
+
+    def __call__(cls, valor):
+        """Idioma('inglés') devuelve el idioma registrado, como Enum; no crea idiomas nuevos"""
+        idioma = IDIOMAS_POR_VALOR.get(valor)
+        if idioma is None:
+            raise ValueError(f"{valor!r} no es un Idioma registrado")
+        return idioma
+
+class Idioma(metaclass=_RegistroIdiomas):
+    """
+    Idioma registrado. Conserva .name y .value del antiguo Enum y añade .id,
+    un entero pequeño y consecutivo (orden de registro) que el traductor usa
+    para indexar su matriz de pares. Hay un único objeto por idioma, así que
+    se comparan y se hashean por identidad.
+    """
+    __slots__ = ('id', 'name', 'value')
+    _registrados = []
+    _por_nombre = {}
+    _cerrojo = threading.Lock()
+    
+    def __repr__(self):
+        return f"<Idioma.{self.name}: {self.value!r}>"
+    
+    def __reduce__(self):
+        return (registrar_idioma, (self.value, self.name))
+
+IDIOMAS_POR_VALOR = {}
+IDIOMAS_POR_NOMBRE = {}
+
+def _nombre_constante(valor):
+    """'portugués' -> 'PORTUGUES', 'chino mandarín' -> 'CHINO_MANDARIN'"""
+    # Sólo hace falta para idiomas nuevos: los incorporados traen su nombre
+    import re
+    import unicodedata
+    sin_acentos = unicodedata.normalize('NFKD', valor).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\W+', '_', sin_acentos.strip()).upper() or 'IDIOMA'
+
+def registrar_idioma(valor, nombre=None):
+    """
+    Registra un idioma (o devuelve el ya registrado con ese valor).
+    Los cargadores registran así los idiomas que aparecen en el archivo.
+    """
+    idioma = IDIOMAS_POR_VALOR.get(valor)
+    if idioma is not None:
+        return idioma
+    if not isinstance(valor, str) or not valor.strip():
+        raise ValueError(f"Nombre de idioma inválido: {valor!r}")
+    with Idioma._cerrojo:
+        idioma = IDIOMAS_POR_VALOR.get(valor)
+        if idioma is None:
+            nombre = nombre or _nombre_constante(valor)
+            if nombre in Idioma._por_nombre or hasattr(Idioma, nombre):
+                nombre = f"{nombre}_{len(Idioma._registrados)}"
+            idioma = object.__new__(Idioma)
+            idioma.id = len(Idioma._registrados)
+            idioma.name = nombre
+            idioma.value = valor
+            Idioma._por_nombre[idioma.name] = idioma
+            setattr(Idioma, idioma.name, idioma)
+            IDIOMAS_POR_NOMBRE.setdefault(idioma.name.lower(), idioma)
+            IDIOMAS_POR_NOMBRE[valor.lower()] = idioma
+            IDIOMAS_POR_VALOR[valor] = idioma
+            # Se publica al final: quien itere Idioma sólo ve idiomas completos
+            Idioma._registrados.append(idioma)
+    return idioma
+
+registrar_idioma("inglés", "INGLES")
+registrar_idioma("español", "ESPANOL")
+registrar_idioma("francés", "FRANCES")
+registrar_idioma("portugués", "PORTUGUES")
+
+def idioma_desde_texto(texto):
+    """Convierte 'inglés', 'ingles' o 'INGLES' en un Idioma; None si no se reconoce"""
+    return IDIOMAS_POR_NOMBRE.get(texto.strip().lower())
+
+class Traduccion:
+    # Orden de los valores en to_fila/from_fila (formato por filas de los archivos)
+    CAMPOS_FILA = ('clave', 'texto', 'puntuacion_promedio', 'total_evaluaciones',
+                   'historial_puntuaciones', 'fecha_creacion', 'fecha_ultima_modificacion')
+    # Puntuación fijada por una política (ver AlmacenPuntuaciones.aplicar).
+    # No se guarda en los archivos y la siguiente evaluación la descarta:
+    # puntuacion_promedio y suma_puntuaciones siguen siendo la media real
+    puntuacion_politica = None
+    
+    def __init__(self, texto_traduccion):
+        self.texto = texto_traduccion
+        self.puntuacion_promedio = 5.0
+        self.total_evaluaciones = 1
+        self.historial_puntuaciones = [5.0]
+        self.suma_puntuaciones = 5.0
+        self.fecha_creacion = datetime.now()
+        self.fecha_ultima_modificacion = datetime.now()
+        self._generacion = 0
+    
+    def copiar(self):
+        """Copia independiente (usada al modificar una traducción compartida con una instantánea)"""
+        copia = Traduccion.__new__(Traduccion)
+        copia.__dict__.update(self.__dict__)
+        copia.historial_puntuaciones = list(self.historial_puntuaciones)
+        return copia
+    
+    @property
+    def puntuacion(self):
+        """La puntuación fijada por la política vigente o, si no hay, la media"""
+        politica = self.puntuacion_politica
+        return self.puntuacion_promedio if politica is None else politica
+    
+    def actualizar_puntuacion(self, nueva_puntuacion):
+        # Suma acumulada: O(1) por evaluación en lugar de sumar todo el historial
+        if self.puntuacion_politica is not None:
+            self.puntuacion_politica = None
+        self.historial_puntuaciones.append(nueva_puntuacion)
+        self.total_evaluaciones += 1
+        self.suma_puntuaciones += nueva_puntuacion
+        self.puntuacion_promedio = self.suma_puntuaciones / self.total_evaluaciones
+        self.fecha_ultima_modificacion = datetime.now()
+    
+    def actualizar_puntuaciones(self, puntuaciones):
+        """Equivale a llamar a actualizar_puntuacion con cada una, en una sola actualización"""
+        if self.puntuacion_politica is not None:
+            self.puntuacion_politica = None
+        self.historial_puntuaciones.extend(puntuaciones)
+        self.total_evaluaciones += len(puntuaciones)
+        self.suma_puntuaciones += sum(puntuaciones)
+        self.puntuacion_promedio = self.suma_puntuaciones / self.total_evaluaciones
+        self.fecha_ultima_modificacion = datetime.now()
+    
+    def to_dict(self):
+        return {
+            'texto': self.texto,
+            'puntuacion_promedio': self.puntuacion_promedio,
+            'total_evaluaciones': self.total_evaluaciones,
+            'historial_puntuaciones': self.historial_puntuaciones,
+            'fecha_creacion': self.fecha_creacion.isoformat(),
+            'fecha_ultima_modificacion': self.fecha_ultima_modificacion.isoformat()
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        traduccion = cls(intern(data['texto']))
+        traduccion.puntuacion_promedio = data['puntuacion_promedio']
+        traduccion.total_evaluaciones = data['total_evaluaciones']
+        traduccion.historial_puntuaciones = data['historial_puntuaciones']
+        traduccion.suma_puntuaciones = sum(traduccion.historial_puntuaciones)
+        traduccion.fecha_creacion = datetime.fromisoformat(data['fecha_creacion'])
+        traduccion.fecha_ultima_modificacion = datetime.fromisoformat(data['fecha_ultima_modificacion'])
+        return traduccion
+    
+    def to_fila(self, clave):
+        return [clave, self.texto, self.puntuacion_promedio, self.total_evaluaciones,
+                self.historial_puntuaciones, self.fecha_creacion.isoformat(),
+                self.fecha_ultima_modificacion.isoformat()]
+    
+    @classmethod
+    def from_fila(cls, fila):
+        """(clave, Traduccion) a partir de una fila de to_fila, sin pasar por __init__"""
+        clave, texto, promedio, total, historial, creacion, modificacion = fila
+        traduccion = cls.__new__(cls)
+        traduccion.texto = intern(texto)
+        traduccion.puntuacion_promedio = promedio
+        traduccion.total_evaluaciones = total
+        traduccion.historial_puntuaciones = historial
+        traduccion.suma_puntuaciones = sum(historial)
+        traduccion.fecha_creacion = datetime.fromisoformat(creacion)
+        traduccion.fecha_ultima_modificacion = datetime.fromisoformat(modificacion)
+        traduccion._generacion = 0
+        return intern(clave), traduccion
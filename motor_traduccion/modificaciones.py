@@ -0,0 +1,95 @@
+"""
+Índice por fecha de modificación y filtros de exportación.
+
+IndiceModificaciones es un diario ordenado por fecha_ultima_modificacion:
+cada cambio de una traducción añade una entrada al final, así que encontrar
+lo modificado desde un instante es una búsqueda binaria más el recorrido de
+las entradas posteriores, sin visitar el resto del diccionario.
+"""
+from bisect import bisect_left
+
+
+class IndiceModificaciones:
+    """
+    Listas paralelas `fechas` (timestamps, ordenadas) y `entradas`
+    (origen, destino, texto). Una traducción modificada varias veces aparece
+    varias veces; las consultas devuelven cada una una vez y el diario se
+    reconstruye cuando las repeticiones lo hacen crecer demasiado.
+    """
+
+    def __init__(self, matriz):
+        self.reconstruir(matriz)
+
+    def __len__(self):
+        return len(self.fechas)
+
+    def reconstruir(self, matriz):
+        filas = sorted(
+            (traduccion.fecha_ultima_modificacion.timestamp(), origen.id, destino.id, texto, origen, destino)
+            for origen, destino, tabla in matriz.pares()
+            for texto, traduccion in tabla.items()
+        )
+        self.fechas = [fila[0] for fila in filas]
+        self.entradas = [(fila[4], fila[5], fila[3]) for fila in filas]
+
+    def anotar(self, origen, destino, texto, fecha):
+        """
+        Registra que la traducción tiene fecha_ultima_modificacion `fecha`.
+        Devuelve False si la fecha es anterior a la última anotada (una
+        traducción fusionada con su fecha original): insertarla en medio
+        costaría O(n) por entrada, así que el llamador descarta el índice y lo
+        reconstruye en la próxima consulta.
+        """
+        marca = fecha.timestamp()
+        if self.fechas and marca < self.fechas[-1]:
+            return False
+        self.fechas.append(marca)
+        self.entradas.append((origen, destino, texto))
+        return True
+
+    def necesita_compactar(self, total_traducciones):
+        return len(self.fechas) > 2 * total_traducciones + 1024
+
+    def desde(self, fecha):
+        """{(origen, destino): [textos]} modificados en o después de `fecha`, del más antiguo al más reciente"""
+        cambios = {}
+        vistos = set()
+        inicio = bisect_left(self.fechas, fecha.timestamp())
+        # Recorrido del final hacia atrás: cada texto se queda con su última aparición
+        for origen, destino, texto in reversed(self.entradas[inicio:]):
+            if (origen, destino, texto) not in vistos:
+                vistos.add((origen, destino, texto))
+                cambios.setdefault((origen, destino), []).append(texto)
+        for textos in cambios.values():
+            textos.reverse()
+        return cambios
+
+
+class FiltroExportacion:
+    """
+    Condiciones que debe cumplir una traducción para exportarse; None en un
+    campo significa sin restricción. `pares` es un conjunto de
+    (origen, destino).
+    """
+
+    def __init__(self, pares=None, puntuacion_minima=None, puntuacion_maxima=None,
+                 evaluaciones_minimas=None, modificadas_desde=None):
+        self.pares = set(pares) if pares is not None else None
+        self.puntuacion_minima = puntuacion_minima
+        self.puntuacion_maxima = puntuacion_maxima
+        self.evaluaciones_minimas = evaluaciones_minimas
+        self.modificadas_desde = modificadas_desde
+
+    def incluye_par(self, origen, destino):
+        return self.pares is None or (origen, destino) in self.pares
+
+    def acepta(self, traduccion):
+        if self.puntuacion_minima is not None and traduccion.puntuacion_promedio < self.puntuacion_minima:
+            return False
+        if self.puntuacion_maxima is not None and traduccion.puntuacion_promedio > self.puntuacion_maxima:
+            return False
+        if self.evaluaciones_minimas is not None and traduccion.total_evaluaciones < self.evaluaciones_minimas:
+            return False
+        if self.modificadas_desde is not None and traduccion.fecha_ultima_modificacion < self.modificadas_desde:
+            return False
+        return True
@@ -0,0 +1,109 @@
+"""Almacenamiento de las tablas de traducción por par de idiomas"""
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+
+from .modelos import Idioma
+
+
+class MatrizPares:
+    """
+    Tablas de cada par (texto en minúsculas -> Traduccion) en una lista plana
+    de ancho×ancho posiciones, indexada por origen.id * ancho + destino.id.
+    Una posición a None es un par sin tabla; `ocupadas` guarda, ordenadas,
+    las posiciones con tabla para que los recorridos no visiten las vacías.
+    Al registrarse idiomas con id mayor que el ancho, la matriz se amplía al
+    asignar.
+    """
+    __slots__ = ('tablas', 'ancho', 'ocupadas')
+
+    def __init__(self, ancho=0):
+        self.ancho = max(ancho, len(Idioma))
+        self.tablas = [None] * (self.ancho * self.ancho)
+        self.ocupadas = []
+
+    @classmethod
+    def desde_anidado(cls, diccionario):
+        """Matriz a partir del formato antiguo {origen: {destino: tabla}}"""
+        matriz = cls()
+        for origen, destinos in diccionario.items():
+            for destino, tabla in destinos.items():
+                if tabla:
+                    matriz.asignar(origen, destino, tabla)
+        return matriz
+
+    def tabla(self, origen, destino):
+        ancho = self.ancho
+        if origen.id < ancho and destino.id < ancho:
+            return self.tablas[origen.id * ancho + destino.id]
+        return None
+
+    def asignar(self, origen, destino, tabla):
+        if origen.id >= self.ancho or destino.id >= self.ancho:
+            self._ampliar(max(origen.id, destino.id) + 1)
+        indice = origen.id * self.ancho + destino.id
+        if self.tablas[indice] is None:
+            insort(self.ocupadas, indice)
+        self.tablas[indice] = tabla
+
+    def _ampliar(self, minimo):
+        ancho_anterior = self.ancho
+        ancho = max(minimo, 2 * ancho_anterior)
+        tablas = [None] * (ancho * ancho)
+        ocupadas = []
+        for indice in self.ocupadas:
+            origen, destino = divmod(indice, ancho_anterior)
+            tablas[origen * ancho + destino] = self.tablas[indice]
+            ocupadas.append(origen * ancho + destino)
+        self.tablas, self.ancho, self.ocupadas = tablas, ancho, ocupadas
+
+    def pares(self):
+        """(origen, destino, tabla) de cada par con tabla, en orden de id"""
+        idiomas = list(Idioma)
+        ancho = self.ancho
+        tablas = self.tablas
+        for indice in list(self.ocupadas):
+            origen, destino = divmod(indice, ancho)
+            yield idiomas[origen], idiomas[destino], tablas[indice]
+
+    def fila(self, origen):
+        """{destino: tabla} de los pares con tabla que parten de origen"""
+        ancho = self.ancho
+        if origen.id >= ancho:
+            return {}
+        idiomas = list(Idioma)
+        inicio = origen.id * ancho
+        fin = inicio + ancho
+        return {idiomas[indice - inicio]: self.tablas[indice]
+                for indice in self.ocupadas[bisect_left(self.ocupadas, inicio):bisect_left(self.ocupadas, fin)]}
+
+    def copiar(self):
+        """Copia de la matriz que comparte las tablas"""
+        copia = MatrizPares.__new__(MatrizPares)
+        copia.ancho = self.ancho
+        copia.tablas = list(self.tablas)
+        copia.ocupadas = list(self.ocupadas)
+        return copia
+
+
+class VistaDiccionario(Mapping):
+    """
+    Vista de sólo lectura con la forma del antiguo diccionario anidado:
+    diccionario[origen][destino][texto]. Sólo contiene los pares con tabla.
+    """
+
+    def __init__(self, matriz):
+        self._matriz = matriz
+
+    def __getitem__(self, origen):
+        destinos = self._matriz.fila(origen) if isinstance(origen, Idioma) else None
+        if not destinos:
+            raise KeyError(origen)
+        return destinos
+
+    def __iter__(self):
+        for origen in list(Idioma):
+            if self._matriz.fila(origen):
+                yield origen
+
+    def __len__(self):
+        return sum(1 for _ in self)
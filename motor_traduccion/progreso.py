@@ -0,0 +1,69 @@
+"""
+Avisos de progreso y cancelación de las operaciones largas (cargar, guardar
+y exportar).
+
+Las operaciones aceptan progreso=None o una función
+progreso(fase, hecho, total) a la que llaman cada cierto trabajo: `fase` es
+un texto ('Leyendo', 'Procesando', ...), `hecho` bytes o entradas y `total`
+lo mismo en total, o None si no se conoce. La función se llama desde el
+hilo que ejecuta la operación; para cancelarla lanza OperacionCancelada, y
+la operación devuelve (False, mensaje) sin haber modificado el traductor ni
+el archivo de destino.
+"""
+
+# Cada cuántas entradas se avisa al recorrer traducciones o registros
+CADA_ENTRADAS = 8192
+# Tamaño de los trozos al leer un archivo avisando de los bytes leídos
+TAMANO_LECTURA = 1 << 20
+
+
+class OperacionCancelada(Exception):
+    """La lanza la función de progreso para interrumpir la operación en curso"""
+
+
+def leer(f, progreso, total, posicion=None):
+    """
+    Todo el contenido de f, por trozos y avisando de los bytes leídos.
+    `posicion` da los bytes consumidos del archivo cuando f descomprime
+    (por defecto, lo leído de f).
+    """
+    if progreso is None:
+        return f.read()
+    trozos = []
+    leidos = 0
+    while True:
+        trozo = f.read(TAMANO_LECTURA)
+        if not trozo:
+            break
+        trozos.append(trozo)
+        leidos += len(trozo)
+        progreso('Leyendo', posicion() if posicion is not None else leidos, total)
+    return b''.join(trozos)
+
+
+class Contador:
+    """Cuenta las entradas procesadas de una fase y avisa a progreso cada CADA_ENTRADAS"""
+
+    def __init__(self, progreso, fase, total=None):
+        self.progreso = progreso
+        self.fase = fase
+        self.total = total
+        self.hecho = 0
+
+    def recorrer(self, iterable):
+        """iterable tal cual si no hay progreso; si no, contando sus elementos"""
+        if self.progreso is None:
+            return iterable
+        return self._recorrer(iterable)
+
+    def _recorrer(self, iterable):
+        for elemento in iterable:
+            yield elemento
+            self.hecho += 1
+            if self.hecho % CADA_ENTRADAS == 0:
+                self.progreso(self.fase, self.hecho, self.total)
+
+    def sumar(self, cantidad):
+        if self.progreso is not None:
+            self.hecho += cantidad
+            self.progreso(self.fase, self.hecho, self.total)
@@ -0,0 +1,121 @@
+"""
+Almacén columnar de puntuaciones para recalcular todas las traducciones a la vez.
+
+Cambiar la política de puntuación (promedios, decaimiento temporal, nuevo
+orden de cada par) recorriendo objetos Traduccion cuesta un bucle Python por
+entrada y por historial. AlmacenPuntuaciones extrae una vez las columnas
+(suma, cantidad de evaluaciones y fecha de última modificación de cada
+entrada) y opera sobre ellas: con NumPy de forma vectorial y, si NumPy no
+está instalado, con listas y el mismo resultado.
+"""
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SEGUNDOS_POR_DIA = 86400.0
+
+
+class AlmacenPuntuaciones:
+    """
+    Una fila por traducción. `entradas[i]` es (origen, destino, clave) y
+    `pares[i]` el índice del par de esa fila en `lista_pares`.
+
+    Es una foto: se construye desde una instantánea del traductor y las
+    evaluaciones posteriores no se reflejan hasta volver a construirlo.
+    """
+
+    def __init__(self, entradas, pares, lista_pares, sumas, cantidades, fechas, usar_numpy=True):
+        self.entradas = entradas
+        self.lista_pares = lista_pares
+        self.vectorial = usar_numpy and np is not None
+        if self.vectorial:
+            self.pares = np.asarray(pares, dtype=np.int32)
+            self.sumas = np.asarray(sumas, dtype=np.float64)
+            self.cantidades = np.asarray(cantidades, dtype=np.int64)
+            self.fechas = np.asarray(fechas, dtype=np.float64)
+        else:
+            self.pares = pares
+            self.sumas = sumas
+            self.cantidades = cantidades
+            self.fechas = fechas
+
+    def __len__(self):
+        return len(self.entradas)
+
+    @classmethod
+    def desde_traductor(cls, traductor, usar_numpy=True):
+        """Extrae las columnas de una instantánea del traductor"""
+        instantanea = traductor.instantanea()
+        entradas, pares, lista_pares = [], [], []
+        sumas, cantidades, fechas = [], [], []
+        for origen, destino, tabla in instantanea._matriz.pares():
+            indice_par = len(lista_pares)
+            lista_pares.append((origen, destino))
+            for clave, traduccion in tabla.items():
+                entradas.append((origen, destino, clave))
+                pares.append(indice_par)
+                sumas.append(traduccion.suma_puntuaciones)
+                cantidades.append(traduccion.total_evaluaciones)
+                fechas.append(traduccion.fecha_ultima_modificacion.timestamp())
+        return cls(entradas, pares, lista_pares, sumas, cantidades, fechas, usar_numpy)
+
+    def promedios(self):
+        """Promedio de cada entrada (0 para las que no tienen evaluaciones)"""
+        if self.vectorial:
+            return np.divide(self.sumas, self.cantidades, out=np.zeros(len(self.sumas)),
+                             where=self.cantidades > 0)
+        return [suma / cantidad if cantidad else 0.0 for suma, cantidad in zip(self.sumas, self.cantidades)]
+
+    def con_decaimiento(self, vida_media_dias, ahora=None, neutra=5.0, puntuaciones=None):
+        """
+        Acerca cada puntuación a `neutra` según la antigüedad de su última
+        modificación: a una vida media de distancia queda a mitad de camino.
+        """
+        if puntuaciones is None:
+            puntuaciones = self.promedios()
+        elif self.vectorial:
+            puntuaciones = np.asarray(puntuaciones, dtype=np.float64)
+        ahora = time.time() if ahora is None else ahora
+        vida_media = vida_media_dias * SEGUNDOS_POR_DIA
+        if self.vectorial:
+            peso = np.exp2(-np.maximum(ahora - self.fechas, 0.0) / vida_media)
+            return neutra + (puntuaciones - neutra) * peso
+        return [neutra + (puntuacion - neutra) * 2.0 ** (-max(ahora - fecha, 0.0) / vida_media)
+                for puntuacion, fecha in zip(puntuaciones, self.fechas)]
+
+    def ranking(self, puntuaciones):
+        """{(origen, destino): [claves de mejor a peor]} para todos los pares en una pasada"""
+        if self.vectorial:
+            puntuaciones = np.asarray(puntuaciones, dtype=np.float64)
+            orden = np.lexsort((-puntuaciones, self.pares))
+            pares_ordenados = self.pares[orden]
+            cortes = np.flatnonzero(np.diff(pares_ordenados)) + 1
+            claves = np.array([clave for _, _, clave in self.entradas], dtype=object)[orden]
+            grupos = np.split(claves, cortes)
+            primeros = np.concatenate(([0], cortes)) if len(orden) else []
+            return {self.lista_pares[pares_ordenados[inicio]]: grupo.tolist()
+                    for inicio, grupo in zip(primeros, grupos)}
+        filas_por_par = {}
+        for fila, par in enumerate(self.pares):
+            filas_por_par.setdefault(par, []).append(fila)
+        resultado = {}
+        for par, filas in filas_por_par.items():
+            filas.sort(key=puntuaciones.__getitem__, reverse=True)
+            resultado[self.lista_pares[par]] = [self.entradas[fila][2] for fila in filas]
+        return resultado
+
+    def aplicar(self, traductor, puntuaciones):
+        """
+        Fija las puntuaciones calculadas como puntuacion_politica de cada
+        traducción (ver TraductorAprendizaje.fijar_puntuaciones); las medias
+        de las que se extrajeron las columnas no cambian.
+        """
+        if self.vectorial:
+            puntuaciones = np.asarray(puntuaciones).tolist()
+        return traductor.fijar_puntuaciones(
+            (origen, destino, clave, puntuacion)
+            for (origen, destino, clave), puntuacion in zip(self.entradas, puntuaciones)
+        )
@@ -0,0 +1,170 @@
+"""
+Funciones de ranking para ordenar las traducciones de un par.
+
+Cada ranking da dos valores por traducción, ambos en O(1) a partir de
+puntuacion (la media o la fijada por una política, ver
+AlmacenPuntuaciones.aplicar), suma_puntuaciones, total_evaluaciones y
+fecha_ultima_modificacion:
+
+- puntuar(traduccion, ahora): la puntuación que se muestra;
+- clave(traduccion): un valor comparable (un número o una tupla) que ordena
+  igual que puntuar() y que no cambia con el paso del tiempo, de modo que
+  los índices ordenados sólo tienen que recolocar una entrada cuando ésta
+  se evalúa.
+"""
+import time
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from math import inf, log2
+
+SEGUNDOS_POR_DIA = 86400.0
+
+
+class RankingPromedio:
+    """Media simple de las evaluaciones (el comportamiento original), o la puntuación fijada por una política"""
+    nombre = 'promedio'
+
+    def puntuar(self, traduccion, ahora=None):
+        return traduccion.puntuacion
+
+    def clave(self, traduccion):
+        return traduccion.puntuacion
+
+
+class RankingBayesiano:
+    """
+    Media bayesiana: cada entrada parte de `peso` evaluaciones ficticias con
+    valor `prior`, así que una sola evaluación de 10 no supera a cientos de
+    evaluaciones de 9.8. Con una puntuación fijada por una política se
+    suaviza ésta, como si fuera la media de total_evaluaciones evaluaciones.
+    """
+    nombre = 'bayesiano'
+
+    def __init__(self, prior=5.0, peso=10.0):
+        self.prior = prior
+        self.peso = peso
+
+    def puntuar(self, traduccion, ahora=None):
+        total = traduccion.total_evaluaciones
+        politica = traduccion.puntuacion_politica
+        suma = traduccion.suma_puntuaciones if politica is None else politica * total
+        return (self.peso * self.prior + suma) / (self.peso + total)
+
+    def clave(self, traduccion):
+        return self.puntuar(traduccion)
+
+
+class RankingDecaimiento:
+    """
+    Decaimiento exponencial hacia `neutra` según la antigüedad de
+    fecha_ultima_modificacion: a una vida media de distancia, la puntuación
+    (según `base`) queda a mitad de camino de la neutra.
+
+    puntuar(t) = neutra + (base - neutra) * 2^-(t - modificacion) / vida_media
+    El factor 2^-t / vida_media es común a todas las entradas, así que
+    (base - neutra) * 2^(modificacion - origen) / vida_media ordena igual en
+    cualquier instante sin recalcularse. Esa potencia desborda (o se queda
+    en 0 y empata) a unas mil vidas medias de origen, así que la clave se
+    calcula en escala logarítmica: (signo, signo * log2 de su valor
+    absoluto), que ordena igual.
+    """
+    nombre = 'decaimiento'
+
+    def __init__(self, vida_media_dias=30.0, neutra=5.0, base=None, origen=None):
+        self.vida_media = vida_media_dias * SEGUNDOS_POR_DIA
+        self.neutra = neutra
+        self.base = base or RankingPromedio()
+        self.origen = time.time() if origen is None else origen
+
+    def puntuar(self, traduccion, ahora=None):
+        ahora = time.time() if ahora is None else ahora
+        edad = max(ahora - traduccion.fecha_ultima_modificacion.timestamp(), 0.0)
+        return self.neutra + (self.base.puntuar(traduccion) - self.neutra) * 2.0 ** (-edad / self.vida_media)
+
+    def clave(self, traduccion):
+        diferencia = self.base.puntuar(traduccion) - self.neutra
+        if not diferencia:
+            return 0, 0.0
+        signo = 1 if diferencia > 0 else -1
+        exponente = (traduccion.fecha_ultima_modificacion.timestamp() - self.origen) / self.vida_media
+        return signo, signo * (log2(abs(diferencia)) + exponente)
+
+
+RANKINGS = {
+    RankingPromedio.nombre: RankingPromedio,
+    RankingBayesiano.nombre: RankingBayesiano,
+    RankingDecaimiento.nombre: RankingDecaimiento,
+}
+
+
+def recorrer_mejores(orden, inicio=0):
+    """
+    Entradas de orden, [(clave, llegada, texto)] ascendente, de mejor a peor
+    (mayor clave y, a igualdad, menor llegada), saltando las `inicio` mejores.
+    """
+    posicion = len(orden) - 1 - inicio
+    fin = None
+    while posicion >= 0:
+        clave = orden[posicion][0]
+        if fin is None:
+            fin = bisect_right(orden, (clave, inf), posicion)
+        grupo = bisect_left(orden, (clave,), 0, posicion + 1)
+        # Dentro del grupo [grupo, fin) la mejor es la que llegó antes
+        for desplazada in range(grupo + fin - 1 - posicion, fin):
+            yield orden[desplazada]
+        posicion = grupo - 1
+        fin = grupo
+
+
+class IndicePuntuaciones:
+    """
+    Textos de un par ordenados por la clave de un ranking, de peor a mejor.
+    Reordenar una entrada cuesta una búsqueda binaria y un desplazamiento de
+    la lista, en lugar de ordenar el par entero en cada consulta.
+
+    Los empates se deshacen por orden de llegada al par, como la ordenación
+    estable de la tabla: cada entrada de orden es (clave, llegada, texto).
+    De peor a mejor basta recorrer orden; de mejor a peor se recorren los
+    grupos de claves iguales desde el final, cada uno hacia delante.
+    """
+
+    def __init__(self, ranking, tabla):
+        self.ranking = ranking
+        self.entradas = {texto: (ranking.clave(traduccion), llegada, texto)
+                         for llegada, (texto, traduccion) in enumerate(tabla.items())}
+        self.llegadas = len(self.entradas)
+        self.orden = sorted(self.entradas.values())
+
+    def __len__(self):
+        return len(self.orden)
+
+    def actualizar(self, texto, traduccion):
+        anterior = self.entradas.get(texto)
+        if anterior is not None:
+            del self.orden[bisect_left(self.orden, anterior)]
+            llegada = anterior[1]
+        else:
+            llegada = self.llegadas
+            self.llegadas += 1
+        entrada = self.entradas[texto] = (self.ranking.clave(traduccion), llegada, texto)
+        insort(self.orden, entrada)
+
+    def recorrer_mejores(self, inicio=0):
+        """Entradas de orden de mejor a peor, saltando las `inicio` mejores"""
+        return recorrer_mejores(self.orden, inicio)
+
+    def pagina(self, inicio, cantidad, mejores=False):
+        """Textos de las posiciones [inicio, inicio + cantidad) contando desde el peor o desde el mejor"""
+        if cantidad <= 0 or inicio < 0:
+            return []
+        if mejores:
+            seleccion = islice(self.recorrer_mejores(inicio), cantidad)
+        else:
+            seleccion = self.orden[inicio:inicio + cantidad]
+        return [texto for _, _, texto in seleccion]
+
+    def mejores(self, limite):
+        return self.pagina(0, limite, mejores=True)
+
+    def peores(self, limite):
+        return self.pagina(0, limite)
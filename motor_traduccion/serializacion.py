@@ -0,0 +1,450 @@
+"""
+Conversión entre el traductor y los datos de sus archivos, y compresión.
+
+Hay dos codificaciones de los datos:
+
+- clásica (versión 1.0): {'diccionario': {origen: {destino: {texto: {...}}}},
+  'historial': [{...}]}, con los nombres de campo repetidos en cada entrada;
+- por filas (versión 2.0, 'formato': 'filas'): cada traducción es una lista
+  en el orden de Traduccion.CAMPOS_FILA y cada registro de historial una
+  lista en el orden de CAMPOS_HISTORIAL; los idiomas se guardan una vez en
+  'idiomas' y se referencian por posición.
+
+Cualquiera de las dos puede ir en JSON sin comprimir o comprimido con gzip,
+lzma o bz2 (biblioteca estándar). Al leer, el códec se detecta por los
+primeros bytes del archivo, no por la extensión.
+
+La escritura es atómica (archivo temporal en el mismo directorio, fsync y
+os.replace) y lleva una suma de control CRC-32 calculada mientras se
+escribe: en JSON es la última clave, 'suma_control', y cubre los bytes sin
+comprimir anteriores a ella; en el binario (motor_traduccion.binario) va
+tras el contenido. Al leer se comprueba si está (los archivos antiguos no la
+tienen). Con conservar_anterior=True el archivo sustituido se guarda en
+ruta_anterior(archivo), al que se puede volver si el actual no se lee.
+
+La lectura está separada en dos pasos: leer_datos convierte los datos en un
+diccionario anidado y un historial nuevos sin tocar el traductor, y el
+traductor los aplica después (TraductorAprendizaje.aplicar_carga), de modo
+que la versión concurrente sólo excluye a los lectores durante la aplicación.
+"""
+import io
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from sys import intern
+
+from . import binario
+from .modelos import Idioma, Traduccion, registrar_idioma
+from .progreso import TAMANO_LECTURA, Contador, leer
+
+# Los módulos de compresión, pickle, shutil y zlib se importan al usarlos:
+# importar el motor no debe pagarlos si no se lee ni se guarda nada
+
+
+def _abrir_gzip(archivo, modo):
+    import gzip
+    # Nivel 6: el 9 por defecto tarda casi el doble y apenas reduce más
+    return gzip.open(archivo, modo, compresslevel=6)
+
+
+def _abrir_lzma(archivo, modo):
+    import lzma
+    return lzma.open(archivo, modo)
+
+
+def _abrir_bz2(archivo, modo):
+    import bz2
+    return bz2.open(archivo, modo)
+
+
+CODECS = {
+    'ninguno': open,
+    'gzip': _abrir_gzip,
+    'lzma': _abrir_lzma,
+    'bz2': _abrir_bz2,
+}
+
+EXTENSIONES_CODEC = {'.gz': 'gzip', '.xz': 'lzma', '.lzma': 'lzma', '.bz2': 'bz2'}
+
+_FIRMAS_CODEC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'lzma'),
+    (b'BZh', 'bz2'),
+)
+
+# Trozos de iterencode que se juntan antes de codificar, sumar y escribir
+TAMANO_BLOQUE = 8192
+
+_SUMA_JSON = re.compile(rb',\s*"suma_control"\s*:\s*"crc32:([0-9a-f]{8})"\s*\}\s*$')
+_MARCA_BINARIO = b'\x00suma_control:crc32:'
+
+
+class SumaControlIncorrecta(ValueError):
+    """El contenido no coincide con la suma de control guardada: el archivo está dañado"""
+
+
+# Campos fijos de un registro de historial en el formato por filas; otros
+# campos, si los hubiera, van en un diccionario al final de la fila
+CAMPOS_HISTORIAL = ('fecha', 'accion', 'origen', 'destino', 'texto_origen',
+                    'texto_traduccion', 'puntuacion', 'puntuacion_anterior')
+
+
+def codec_de_archivo(archivo):
+    """Códec según la extensión ('traducciones.json.gz' -> 'gzip')"""
+    return EXTENSIONES_CODEC.get(os.path.splitext(archivo)[1].lower(), 'ninguno')
+
+
+def es_json(archivo):
+    """True para .json y .json comprimido (.json.gz, .json.xz, .json.bz2)"""
+    base = archivo
+    if os.path.splitext(base)[1].lower() in EXTENSIONES_CODEC:
+        base = os.path.splitext(base)[0]
+    return base.lower().endswith('.json')
+
+
+def ruta_anterior(archivo):
+    """Copia anterior de un archivo: 'dic.json.gz' -> 'dic.anterior.json.gz'"""
+    base, extension = os.path.splitext(archivo)
+    if extension.lower() in EXTENSIONES_CODEC:
+        base, extension_json = os.path.splitext(base)
+        extension = extension_json + extension
+    return base + '.anterior' + extension
+
+
+def detectar_codec(archivo):
+    with open(archivo, 'rb') as f:
+        inicio = f.read(6)
+    for firma, codec in _FIRMAS_CODEC:
+        if inicio.startswith(firma):
+            return codec
+    return 'ninguno'
+
+
+def _registro_serializable(registro):
+    registro_copy = registro.copy()
+    registro_copy['fecha'] = registro_copy['fecha'].isoformat()
+    if 'origen' in registro_copy and isinstance(registro_copy['origen'], Idioma):
+        registro_copy['origen'] = registro_copy['origen'].value
+    if 'destino' in registro_copy and isinstance(registro_copy['destino'], Idioma):
+        registro_copy['destino'] = registro_copy['destino'].value
+    return registro_copy
+
+
+def _total_entradas(vista):
+    return sum(len(tabla) for _, _, tabla in vista._matriz.pares()) + len(vista.historial_traducciones)
+
+
+def datos_clasicos(vista, progreso=None):
+    """Datos en la codificación clásica a partir de un traductor o una instantánea"""
+    contador = Contador(progreso, 'Preparando', progreso and _total_entradas(vista))
+    datos_serializables = {}
+    for idioma_origen, idioma_destino, traducciones in vista._matriz.pares():
+        destinos = datos_serializables.setdefault(idioma_origen.value, {})
+        destinos[idioma_destino.value] = {texto: traduccion.to_dict()
+                                          for texto, traduccion in contador.recorrer(traducciones.items())}
+    return {
+        'diccionario': datos_serializables,
+        'historial': [_registro_serializable(registro)
+                      for registro in contador.recorrer(vista.historial_traducciones)],
+        'fecha_guardado': datetime.now().isoformat(),
+        'version': '1.0'
+    }
+
+
+def datos_por_filas(vista, progreso=None):
+    """Datos en la codificación por filas a partir de un traductor o una instantánea"""
+    contador = Contador(progreso, 'Preparando', progreso and _total_entradas(vista))
+    posiciones = {}
+    idiomas = []
+
+    def posicion(idioma):
+        if not isinstance(idioma, Idioma):
+            return idioma
+        indice = posiciones.get(idioma)
+        if indice is None:
+            indice = posiciones[idioma] = len(idiomas)
+            idiomas.append(idioma.value)
+        return indice
+
+    pares = []
+    for idioma_origen, idioma_destino, traducciones in vista._matriz.pares():
+        pares.append([posicion(idioma_origen), posicion(idioma_destino),
+                      [traduccion.to_fila(texto) for texto, traduccion in contador.recorrer(traducciones.items())]])
+
+    campos_fijos = set(CAMPOS_HISTORIAL)
+    historial = []
+    for registro in contador.recorrer(vista.historial_traducciones):
+        fila = [registro['fecha'].isoformat(), registro.get('accion'),
+                posicion(registro.get('origen')), posicion(registro.get('destino'))]
+        fila.extend(registro.get(campo) for campo in CAMPOS_HISTORIAL[4:])
+        # Un campo fijo ausente se lee como ausente; si estaba con None, el
+        # None va en los extras para que el registro se lea igual
+        extra = {campo: valor for campo, valor in registro.items()
+                 if campo not in campos_fijos or valor is None}
+        if extra:
+            fila.append(extra)
+        historial.append(fila)
+
+    return {
+        'version': '2.0',
+        'formato': 'filas',
+        'fecha_guardado': datetime.now().isoformat(),
+        'idiomas': idiomas,
+        'campos_traduccion': list(Traduccion.CAMPOS_FILA),
+        'campos_historial': list(CAMPOS_HISTORIAL),
+        'pares': pares,
+        'historial': historial
+    }
+
+
+class _EscritorConSuma:
+    """Envuelve un archivo binario y acumula el CRC-32 de lo que se escribe"""
+
+    def __init__(self, f):
+        from zlib import crc32
+        self._crc32 = crc32
+        self.f = f
+        self.suma = 0
+
+    def write(self, datos):
+        self.suma = self._crc32(datos, self.suma)
+        return self.f.write(datos)
+
+
+def _sincronizar_directorio(directorio):
+    # Hace persistente el renombrado; no todos los sistemas permiten abrir un directorio
+    try:
+        descriptor = os.open(directorio, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+@contextmanager
+def escritura_atomica(archivo, conservar_anterior=False):
+    """
+    Archivo binario temporal que sustituye a `archivo` al salir sin errores,
+    tras fsync; si hay un error se borra y `archivo` queda como estaba.
+    """
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    temporal = os.path.join(directorio, f".{os.path.basename(archivo)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    # Permisos como los de open(archivo, 'w'): los del archivo existente o los de la umask
+    descriptor = os.open(temporal, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            if os.path.exists(archivo):
+                import shutil
+                shutil.copymode(archivo, temporal)
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if conservar_anterior and os.path.exists(archivo):
+            os.replace(archivo, ruta_anterior(archivo))
+        os.replace(temporal, archivo)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+    _sincronizar_directorio(directorio)
+
+
+def _comprimido(f, codec):
+    if codec == 'ninguno':
+        return nullcontext(f)
+    return CODECS[codec](f, 'wb')
+
+
+def escribir_json(datos, archivo, codec='ninguno', compacto=False, conservar_anterior=False, progreso=None):
+    """
+    Escribe `datos` (un diccionario) con 'suma_control' como última clave.
+    El texto sale de iterencode, igual que en json.dump, y la suma se
+    acumula sobre los mismos bytes que se escriben.
+    """
+    if compacto:
+        codificador = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        pie = ',"suma_control":"crc32:{:08x}"}}'
+    else:
+        codificador = json.JSONEncoder(ensure_ascii=False, indent=2)
+        pie = ',\n  "suma_control": "crc32:{:08x}"\n}}'
+    with escritura_atomica(archivo, conservar_anterior) as bruto, _comprimido(bruto, codec) as f:
+        escritor = _EscritorConSuma(f)
+        bloque = []
+        for trozo in codificador.iterencode(datos):
+            bloque.append(trozo)
+            if len(bloque) >= TAMANO_BLOQUE:
+                # Se retienen los últimos trozos: el cierre del objeto ('\n}' con
+                # sangría, en dos trozos) va después de la suma
+                retenidos = bloque[-2:]
+                escritor.write(''.join(bloque[:-2]).encode('utf-8'))
+                bloque = retenidos
+                if progreso is not None:
+                    progreso('Escribiendo', bruto.tell(), None)
+        final = ''.join(bloque)
+        escritor.write(final[:final.rindex('}')].rstrip().encode('utf-8'))
+        f.write(pie.format(escritor.suma).encode('utf-8'))
+
+
+def escribir_binario(vista, archivo, conservar_anterior=False, progreso=None):
+    """Guarda un traductor o una instantánea en el formato de motor_traduccion.binario"""
+    bloques = binario.codificar(vista, progreso)
+    total = sum(len(bloque) for bloque in bloques)
+    with escritura_atomica(archivo, conservar_anterior) as f:
+        escritor = _EscritorConSuma(f)
+        escritos = 0
+        for bloque in bloques:
+            escritor.write(bloque)
+            escritos += len(bloque)
+            if progreso is not None and len(bloque) >= TAMANO_LECTURA:
+                progreso('Escribiendo', escritos, total)
+        f.write(_MARCA_BINARIO + b'%08x' % escritor.suma)
+
+
+def _cargar_pickle(contenido):
+    """
+    Lee los binarios antiguos (pickle de los datos clásicos, que sólo
+    contienen dict, list, str y números) sin permitir cargar ninguna clase
+    ni función, que es lo que haría ejecutar código del archivo.
+    """
+    import pickle
+
+    class DesempaquetadorSeguro(pickle.Unpickler):
+        def find_class(self, modulo, nombre):
+            raise pickle.UnpicklingError(f"El archivo pide cargar {modulo}.{nombre}, que no está permitido")
+
+    return DesempaquetadorSeguro(io.BytesIO(contenido)).load()
+
+
+def _comprobar_suma(contenido, fin, esperada, archivo):
+    from zlib import crc32
+    if crc32(memoryview(contenido)[:fin]) != esperada:
+        raise SumaControlIncorrecta(f"Suma de control incorrecta, el archivo está dañado: {archivo}")
+
+
+def _leer_archivo(archivo, progreso):
+    """Contenido descomprimido de `archivo`, avisando de los bytes leídos del disco"""
+    codec = detectar_codec(archivo)
+    with open(archivo, 'rb') as bruto:
+        total = os.fstat(bruto.fileno()).st_size
+        if codec == 'ninguno':
+            return leer(bruto, progreso, total)
+        with CODECS[codec](bruto, 'rb') as f:
+            return leer(f, progreso, total, bruto.tell)
+
+
+def leer_json(archivo, progreso=None):
+    contenido = _leer_archivo(archivo, progreso)
+    encontrada = _SUMA_JSON.search(contenido, max(0, len(contenido) - 128))
+    if encontrada is not None:
+        _comprobar_suma(contenido, encontrada.start(), int(encontrada.group(1), 16), archivo)
+    return json.loads(contenido)
+
+
+def leer_binario(archivo, progreso=None):
+    """(diccionario_nuevo, historial_nuevo) de un archivo binario, nuevo o pickle antiguo"""
+    with open(archivo, 'rb') as f:
+        contenido = leer(f, progreso, os.fstat(f.fileno()).st_size)
+    fin = len(contenido) - len(_MARCA_BINARIO) - 8
+    if fin >= 0 and contenido[fin:fin + len(_MARCA_BINARIO)] == _MARCA_BINARIO:
+        _comprobar_suma(contenido, fin, int(contenido[-8:], 16), archivo)
+    else:
+        fin = len(contenido)
+    if binario.es_binario(contenido):
+        return binario.decodificar(memoryview(contenido)[:fin], progreso)
+    # pickle ignora lo que sigue al objeto, incluida la suma de control
+    return leer_datos(_cargar_pickle(contenido), progreso)
+
+
+def _internar_registro(registro):
+    """Comparte las cadenas de un registro de historial cargado con las del diccionario"""
+    for campo in ('accion', 'texto_origen', 'texto_traduccion'):
+        valor = registro.get(campo)
+        if isinstance(valor, str):
+            registro[campo] = intern(valor)
+
+
+def leer_datos(datos_completos, progreso=None):
+    """
+    (diccionario_nuevo, historial_nuevo) a partir de datos en cualquiera de
+    las dos codificaciones. Los idiomas que aún no existen se registran: el
+    archivo define el conjunto.
+    """
+    if datos_completos.get('formato') == 'filas':
+        return _leer_filas(datos_completos, progreso)
+    contador = Contador(progreso, 'Procesando', progreso and (
+        sum(len(traducciones) for destinos in datos_completos['diccionario'].values()
+            for traducciones in destinos.values()) + len(datos_completos.get('historial', []))))
+
+    diccionario_nuevo = {}
+    historial_nuevo = []
+
+    for idioma_origen_str, destinos in datos_completos['diccionario'].items():
+        idioma_origen = registrar_idioma(idioma_origen_str)
+
+        diccionario_nuevo[idioma_origen] = {}
+
+        for idioma_destino_str, traducciones in destinos.items():
+            if not traducciones:
+                continue
+
+            idioma_destino = registrar_idioma(idioma_destino_str)
+
+            diccionario_nuevo[idioma_origen][idioma_destino] = {}
+
+            for texto, datos_traduccion in contador.recorrer(traducciones.items()):
+                diccionario_nuevo[idioma_origen][idioma_destino][intern(texto)] = Traduccion.from_dict(datos_traduccion)
+
+    for registro in contador.recorrer(datos_completos.get('historial', [])):
+        registro_copy = registro.copy()
+        registro_copy['fecha'] = datetime.fromisoformat(registro_copy['fecha'])
+        _internar_registro(registro_copy)
+
+        if 'origen' in registro_copy and isinstance(registro_copy['origen'], str):
+            registro_copy['origen'] = registrar_idioma(registro_copy['origen'])
+
+        if 'destino' in registro_copy and isinstance(registro_copy['destino'], str):
+            registro_copy['destino'] = registrar_idioma(registro_copy['destino'])
+
+        historial_nuevo.append(registro_copy)
+
+    return diccionario_nuevo, historial_nuevo
+
+
+def _leer_filas(datos_completos, progreso):
+    contador = Contador(progreso, 'Procesando', progreso and (
+        sum(len(filas) for _, _, filas in datos_completos['pares']) + len(datos_completos.get('historial', []))))
+    idiomas = [registrar_idioma(valor) for valor in datos_completos['idiomas']]
+    diccionario_nuevo = {}
+    for origen, destino, filas in datos_completos['pares']:
+        if not filas:
+            continue
+        tabla = diccionario_nuevo.setdefault(idiomas[origen], {}).setdefault(idiomas[destino], {})
+        for fila in contador.recorrer(filas):
+            texto, traduccion = Traduccion.from_fila(fila)
+            tabla[texto] = traduccion
+
+    historial_nuevo = []
+    campos_variables = CAMPOS_HISTORIAL[4:]
+    for fila in contador.recorrer(datos_completos.get('historial', [])):
+        registro = {'fecha': datetime.fromisoformat(fila[0])}
+        if fila[1] is not None:
+            registro['accion'] = fila[1]
+        if fila[2] is not None:
+            registro['origen'] = idiomas[fila[2]] if isinstance(fila[2], int) else registrar_idioma(fila[2])
+        if fila[3] is not None:
+            registro['destino'] = idiomas[fila[3]] if isinstance(fila[3], int) else registrar_idioma(fila[3])
+        for campo, valor in zip(campos_variables, fila[4:]):
+            if valor is not None:
+                registro[campo] = valor
+        if len(fila) > len(CAMPOS_HISTORIAL):
+            registro.update(fila[-1])
+        _internar_registro(registro)
+        historial_nuevo.append(registro)
+    return diccionario_nuevo, historial_nuevo
@@ -0,0 +1,168 @@
+"""
+Operaciones del servicio de traducción independientes del transporte.
+
+Los servidores (HTTP con hilos y asyncio) reciben peticiones JSON ya
+decodificadas y delegan aquí; así ambos comparten validación y formato de
+respuesta.
+"""
+from .concurrencia import CerrojoLecturaEscritura
+from .modelos import idioma_desde_texto
+from .serializacion import es_json
+
+
+class ErrorPeticion(ValueError):
+    """Petición mal formada; los servidores la devuelven como 400"""
+
+
+def _idioma(datos, campo):
+    valor = datos.get(campo)
+    if not isinstance(valor, str):
+        raise ErrorPeticion(f"Falta el campo '{campo}'")
+    idioma = idioma_desde_texto(valor)
+    if idioma is None:
+        raise ErrorPeticion(f"Idioma desconocido: {valor}")
+    return idioma
+
+
+def _texto(datos, campo):
+    valor = datos.get(campo)
+    if not isinstance(valor, str) or not valor.strip():
+        raise ErrorPeticion(f"Falta el campo '{campo}'")
+    return valor
+
+
+def _puntuacion(datos, campo='puntuacion', defecto=None):
+    valor = datos.get(campo, defecto)
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        raise ErrorPeticion(f"El campo '{campo}' debe ser numérico")
+    return valor
+
+
+class ServicioTraduccion:
+    """
+    Expone un TraductorAprendizaje como operaciones sobre diccionarios JSON.
+
+    Las consultas toman el cerrojo en modo lectura y pueden atenderse en
+    paralelo; las modificaciones lo toman en modo escritura. Si el traductor
+    es un TraductorAprendizajeConcurrente se comparte su propio cerrojo.
+    """
+
+    def __init__(self, traductor, archivo=None):
+        self.traductor = traductor
+        self.archivo = archivo
+        self.cerrojo = getattr(traductor, 'cerrojo', None) or CerrojoLecturaEscritura()
+        self.modificado = False
+        # Se incrementa con cada cambio; el guardado sólo limpia `modificado`
+        # si no ha cambiado mientras escribía
+        self.cambios = 0
+        self.operaciones = {
+            'traducir': self.traducir,
+            'traducir_lote': self.traducir_lote,
+            'evaluar': self.evaluar,
+            'agregar': self.agregar,
+            'lote': self.lote,
+            'estadisticas': self.estadisticas,
+            'guardar': self.guardar,
+        }
+
+    def marcar_modificado(self):
+        self.cambios += 1
+        self.modificado = True
+    
+    def ejecutar(self, operacion, datos):
+        funcion = self.operaciones.get(operacion)
+        if funcion is None:
+            raise ErrorPeticion(f"Operación desconocida: {operacion}")
+        if not isinstance(datos, dict):
+            raise ErrorPeticion("El cuerpo debe ser un objeto JSON")
+        return funcion(datos)
+
+    def traducir(self, datos):
+        origen = _idioma(datos, 'origen')
+        destino = _idioma(datos, 'destino')
+        texto = _texto(datos, 'texto')
+        registrar = bool(datos.get('registrar', False))
+        with self.cerrojo.lectura():
+            traduccion = self.traductor.traducir(origen, destino, texto, registrar=registrar)
+            if registrar and traduccion is not None:
+                self.marcar_modificado()
+        return {'texto': texto, 'traduccion': traduccion}
+
+    def traducir_lote(self, datos):
+        """Traduce una lista de textos de un mismo par con una sola toma del cerrojo"""
+        origen = _idioma(datos, 'origen')
+        destino = _idioma(datos, 'destino')
+        textos = datos.get('textos')
+        if not isinstance(textos, list) or not all(isinstance(t, str) for t in textos):
+            raise ErrorPeticion("El campo 'textos' debe ser una lista de cadenas")
+        registrar = bool(datos.get('registrar', False))
+        traducir = self.traductor.traducir
+        with self.cerrojo.lectura():
+            traducciones = [traducir(origen, destino, texto, registrar=registrar) for texto in textos]
+            if registrar:
+                self.marcar_modificado()
+        return {'traducciones': traducciones}
+
+    def evaluar(self, datos):
+        origen = _idioma(datos, 'origen')
+        destino = _idioma(datos, 'destino')
+        texto = _texto(datos, 'texto')
+        puntuacion = _puntuacion(datos)
+        with self.cerrojo.escritura():
+            exito, mensaje = self.traductor.evaluar_traduccion(origen, destino, texto, puntuacion)
+            if exito:
+                self.marcar_modificado()
+        return {'exito': exito, 'mensaje': mensaje}
+
+    def agregar(self, datos):
+        origen = _idioma(datos, 'origen')
+        destino = _idioma(datos, 'destino')
+        texto = _texto(datos, 'texto')
+        traduccion = _texto(datos, 'traduccion')
+        puntuacion = _puntuacion(datos, defecto=5)
+        if origen == destino:
+            raise ErrorPeticion("Los idiomas origen y destino deben ser diferentes")
+        with self.cerrojo.escritura():
+            self.traductor.agregar_traduccion_con_puntuacion(origen, destino, texto, traduccion, puntuacion)
+            if datos.get('inversa'):
+                self.traductor.agregar_traduccion_con_puntuacion(destino, origen, traduccion, texto, puntuacion)
+            self.marcar_modificado()
+        return {'exito': True}
+
+    def lote(self, datos):
+        """Ejecuta varias operaciones en una sola petición; los errores se devuelven por elemento"""
+        peticiones = datos.get('peticiones')
+        if not isinstance(peticiones, list):
+            raise ErrorPeticion("El campo 'peticiones' debe ser una lista")
+        respuestas = []
+        for peticion in peticiones:
+            try:
+                if not isinstance(peticion, dict) or peticion.get('operacion') in ('lote', 'guardar'):
+                    raise ErrorPeticion("Operación no permitida dentro de un lote")
+                respuestas.append(self.ejecutar(peticion.get('operacion'), peticion))
+            except ErrorPeticion as e:
+                respuestas.append({'error': str(e)})
+        return {'respuestas': respuestas}
+
+    def estadisticas(self, datos):
+        with self.cerrojo.lectura():
+            return self.traductor.obtener_estadisticas()
+
+    def guardar(self, datos):
+        if not self.archivo:
+            raise ErrorPeticion("El servicio no tiene archivo de diccionario configurado")
+        # Sólo la instantánea se toma con el cerrojo (de escritura, para que
+        # ninguna consulta anote historial entre la instantánea y la lectura de
+        # `cambios`); el volcado a disco se hace fuera y no bloquea a nadie
+        with self.cerrojo.escritura():
+            instantanea = self.traductor.instantanea()
+            cambios = self.cambios
+        if es_json(self.archivo):
+            exito, mensaje = instantanea.guardar_diccionario_json(self.archivo, conservar_anterior=True)
+        else:
+            exito, mensaje = instantanea.guardar_diccionario_binario(self.archivo, conservar_anterior=True)
+        if exito:
+            with self.cerrojo.escritura():
+                if self.cambios == cambios:
+                    self.modificado = False
+        return {'exito': exito, 'mensaje': mensaje}
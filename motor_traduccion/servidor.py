@@ -0,0 +1,129 @@
+"""
+Servidor HTTP local del traductor.
+
+Usa HTTP/1.1 con conexiones persistentes (keep-alive) y un hilo por
+conexión. Todas las operaciones reciben y devuelven JSON:
+
+    POST /traducir        {"origen", "destino", "texto", "registrar"?}
+    POST /traducir/lote   {"origen", "destino", "textos": [...]}
+    POST /evaluar         {"origen", "destino", "texto", "puntuacion"}
+    POST /agregar         {"origen", "destino", "texto", "traduccion", "puntuacion"?, "inversa"?}
+    POST /lote            {"peticiones": [{"operacion": "traducir", ...}, ...]}
+    POST /guardar
+    GET  /estadisticas
+    GET  /salud
+"""
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .servicio import ErrorPeticion, ServicioTraduccion
+
+TAMANO_MAXIMO_CUERPO = 16 * 1024 * 1024
+
+RUTAS_POST = {
+    '/traducir': 'traducir',
+    '/traducir/lote': 'traducir_lote',
+    '/evaluar': 'evaluar',
+    '/agregar': 'agregar',
+    '/lote': 'lote',
+    '/guardar': 'guardar',
+}
+
+RUTAS_GET = {
+    '/estadisticas': 'estadisticas',
+}
+
+
+class ManejadorTraduccion(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "TraductorHTTP/1.0"
+    # Cabeceras y cuerpo van en escrituras separadas: sin TCP_NODELAY el
+    # algoritmo de Nagle retrasa cada respuesta en conexiones persistentes
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path == '/salud':
+            self.responder(200, {'estado': 'ok'})
+            return
+        operacion = RUTAS_GET.get(self.path)
+        if operacion is None:
+            self.responder(404, {'error': f"Ruta desconocida: {self.path}"})
+            return
+        self.despachar(operacion, {})
+
+    def do_POST(self):
+        operacion = RUTAS_POST.get(self.path)
+        try:
+            longitud = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            longitud = -1
+        if longitud < 0:
+            # Sin una longitud válida no se sabe dónde acaba el cuerpo
+            self.close_connection = True
+            self.responder(400, {'error': "Content-Length inválido"})
+            return
+        if longitud > TAMANO_MAXIMO_CUERPO:
+            self.close_connection = True
+            self.responder(413, {'error': "Cuerpo demasiado grande"})
+            return
+        # El cuerpo se lee siempre para no desincronizar la conexión persistente
+        cuerpo = self.rfile.read(longitud) if longitud else b''
+        if operacion is None:
+            self.responder(404, {'error': f"Ruta desconocida: {self.path}"})
+            return
+        try:
+            datos = json.loads(cuerpo) if cuerpo else {}
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            self.responder(400, {'error': "JSON inválido"})
+            return
+        self.despachar(operacion, datos)
+
+    def despachar(self, operacion, datos):
+        try:
+            resultado = self.server.servicio.ejecutar(operacion, datos)
+        except ErrorPeticion as e:
+            self.responder(400, {'error': str(e)})
+            return
+        except Exception as e:
+            self.responder(500, {'error': f"Error interno: {e}"})
+            return
+        self.responder(200, resultado)
+
+    def responder(self, codigo, datos):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, format, *args):
+        if self.server.verboso:
+            super().log_message(format, *args)
+
+
+class ServidorTraduccion(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, direccion, servicio, verboso=False):
+        super().__init__(direccion, ManejadorTraduccion)
+        self.servicio = servicio
+        self.verboso = verboso
+
+
+def crear_servidor(traductor, host='127.0.0.1', puerto=8765, archivo=None, verboso=False):
+    """Crea el servidor sin arrancarlo (puerto=0 elige uno libre)"""
+    return ServidorTraduccion((host, puerto), ServicioTraduccion(traductor, archivo), verboso)
+
+
+def servir(traductor, host='127.0.0.1', puerto=8765, archivo=None, verboso=False):
+    """Atiende peticiones hasta Ctrl+C; devuelve True si el diccionario cambió"""
+    servidor = crear_servidor(traductor, host, puerto, archivo, verboso)
+    print(f"Servidor de traducción escuchando en http://{host}:{servidor.server_address[1]}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+    return servidor.servicio.modificado
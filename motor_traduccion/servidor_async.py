@@ -0,0 +1,293 @@
+"""
+Servidor asyncio del traductor para muchas conexiones concurrentes.
+
+Expone las mismas rutas que servidor.py, con tres diferencias internas:
+
+- Las consultas idénticas (mismo par y mismo texto sin distinguir mayúsculas)
+  que llegan en la misma vuelta del bucle se resuelven una sola vez y todas
+  las peticiones comparten el resultado. En este modo las consultas no se
+  anotan en el historial.
+- Las evaluaciones se acumulan durante una ventana corta y se aplican en una
+  sola pasada de mutación.
+- Todas las mutaciones y el guardado se ejecutan en un único hilo escritor,
+  así que el bucle nunca espera al disco y el guardado nunca ve una pasada a
+  medias. El guardado se programa tras cada cambio y se agrupa por intervalo.
+  Las operaciones de sólo lectura (traducir_lote, estadisticas) y las
+  consultas agrupadas van a un grupo de hilos lectores: no esperan detrás de
+  las mutaciones y el bucle nunca espera al cerrojo.
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http.client import responses
+
+from .servicio import ErrorPeticion, ServicioTraduccion, _idioma, _puntuacion, _texto
+from .servidor import RUTAS_GET, RUTAS_POST, TAMANO_MAXIMO_CUERPO
+
+VENTANA_EVALUACIONES = 0.002
+INTERVALO_GUARDADO = 5.0
+HILOS_LECTORES = 4
+
+# Operaciones de ServicioTraduccion que no modifican el diccionario
+OPERACIONES_LECTURA = {'traducir_lote', 'estadisticas'}
+
+
+class ServidorAsincrono:
+    def __init__(self, traductor, archivo=None, ventana_evaluaciones=VENTANA_EVALUACIONES,
+                 intervalo_guardado=INTERVALO_GUARDADO):
+        self.traductor = traductor
+        self.servicio = ServicioTraduccion(traductor, archivo)
+        self.ventana_evaluaciones = ventana_evaluaciones
+        self.intervalo_guardado = intervalo_guardado
+        self.escritor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='traductor-escritor')
+        self.lectores = ThreadPoolExecutor(max_workers=HILOS_LECTORES, thread_name_prefix='traductor-lector')
+        self.consultas = {}
+        self.resoluciones_pendientes = set()
+        self.evaluaciones = []
+        self.pasadas_pendientes = set()
+        self.guardado_programado = None
+        self.servidor = None
+        self.estadisticas = {'consultas': 0, 'resoluciones': 0, 'evaluaciones': 0, 'pasadas_evaluacion': 0,
+                             'guardados': 0}
+
+    # Consultas agrupadas
+
+    def consultar(self, origen, destino, texto):
+        """Devuelve un futuro compartido por todas las consultas idénticas pendientes"""
+        self.estadisticas['consultas'] += 1
+        clave = (origen, destino, texto.lower())
+        futuro = self.consultas.get(clave)
+        if futuro is None:
+            bucle = asyncio.get_running_loop()
+            if not self.consultas:
+                bucle.call_soon(self.resolver_consultas)
+            futuro = bucle.create_future()
+            self.consultas[clave] = futuro
+        return futuro
+
+    def resolver_consultas(self):
+        consultas, self.consultas = self.consultas, {}
+        resolucion = asyncio.ensure_future(self.aplicar_consultas(consultas))
+        self.resoluciones_pendientes.add(resolucion)
+        resolucion.add_done_callback(self.resoluciones_pendientes.discard)
+
+    async def aplicar_consultas(self, consultas):
+        bucle = asyncio.get_running_loop()
+        try:
+            resultados = await bucle.run_in_executor(self.lectores, self._pasada_consultas, list(consultas))
+        except Exception as e:
+            resultados = [(False, e)] * len(consultas)
+        for futuro, (exito, resultado) in zip(consultas.values(), resultados):
+            if futuro.done():
+                continue
+            if exito:
+                futuro.set_result(resultado)
+            else:
+                futuro.set_exception(resultado)
+        self.estadisticas['resoluciones'] += len(consultas)
+
+    def _pasada_consultas(self, claves):
+        """Traduce todas las consultas del lote bajo una sola toma del cerrojo (hilo lector)"""
+        traducir = self.traductor.traducir
+        resultados = []
+        # Sin el cerrojo, una consulta podría recordar como fallo un texto que
+        # el hilo escritor está agregando en ese momento
+        with self.servicio.cerrojo.lectura():
+            for origen, destino, texto in claves:
+                try:
+                    resultados.append((True, traducir(origen, destino, texto, registrar=False)))
+                except Exception as e:
+                    resultados.append((False, e))
+        return resultados
+
+    # Evaluaciones por lotes
+
+    def evaluar(self, origen, destino, texto, puntuacion):
+        bucle = asyncio.get_running_loop()
+        if not self.evaluaciones:
+            bucle.call_later(self.ventana_evaluaciones, self.vaciar_evaluaciones)
+        futuro = bucle.create_future()
+        self.evaluaciones.append((origen, destino, texto, puntuacion, futuro))
+        return futuro
+
+    def vaciar_evaluaciones(self):
+        lote, self.evaluaciones = self.evaluaciones, []
+        if lote:
+            pasada = asyncio.ensure_future(self.aplicar_evaluaciones(lote))
+            self.pasadas_pendientes.add(pasada)
+            pasada.add_done_callback(self.pasadas_pendientes.discard)
+
+    async def aplicar_evaluaciones(self, lote):
+        bucle = asyncio.get_running_loop()
+        try:
+            resultados = await bucle.run_in_executor(self.escritor, self._pasada_evaluaciones, lote)
+        except Exception as e:
+            for *_, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+        for (*_, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+        self.estadisticas['evaluaciones'] += len(lote)
+        self.estadisticas['pasadas_evaluacion'] += 1
+        if any(exito for exito, _ in resultados):
+            self.programar_guardado()
+
+    def _pasada_evaluaciones(self, lote):
+        """Aplica todas las evaluaciones del lote bajo una sola toma del cerrojo (hilo escritor)"""
+        evaluar = self.traductor.evaluar_traduccion
+        with self.servicio.cerrojo.escritura():
+            resultados = [evaluar(origen, destino, texto, puntuacion)
+                          for origen, destino, texto, puntuacion, _ in lote]
+            if any(exito for exito, _ in resultados):
+                self.servicio.marcar_modificado()
+        return resultados
+
+    # Persistencia asíncrona
+
+    def programar_guardado(self):
+        if not self.servicio.archivo or self.guardado_programado is not None:
+            return
+        bucle = asyncio.get_running_loop()
+        self.guardado_programado = bucle.call_later(self.intervalo_guardado, self._lanzar_guardado)
+
+    def _lanzar_guardado(self):
+        self.guardado_programado = None
+        asyncio.ensure_future(self.guardar())
+
+    async def guardar(self):
+        if not self.servicio.archivo or not self.servicio.modificado:
+            return
+        bucle = asyncio.get_running_loop()
+        resultado = await bucle.run_in_executor(self.escritor, self.servicio.guardar, {})
+        self.estadisticas['guardados'] += 1
+        if not resultado['exito']:
+            print(resultado['mensaje'])
+
+    # Protocolo HTTP
+
+    async def procesar(self, metodo, ruta, cuerpo):
+        if metodo == 'GET' and ruta == '/salud':
+            return 200, {'estado': 'ok', **self.estadisticas}
+        operacion = (RUTAS_POST if metodo == 'POST' else RUTAS_GET).get(ruta)
+        if operacion is None:
+            return 404, {'error': f"Ruta desconocida: {ruta}"}
+        try:
+            datos = json.loads(cuerpo) if cuerpo else {}
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return 400, {'error': "JSON inválido"}
+
+        try:
+            if not isinstance(datos, dict):
+                raise ErrorPeticion("El cuerpo debe ser un objeto JSON")
+            if operacion == 'traducir':
+                texto = _texto(datos, 'texto')
+                traduccion = await self.consultar(_idioma(datos, 'origen'), _idioma(datos, 'destino'), texto)
+                return 200, {'texto': texto, 'traduccion': traduccion}
+            if operacion == 'evaluar':
+                exito, mensaje = await self.evaluar(_idioma(datos, 'origen'), _idioma(datos, 'destino'),
+                                                    _texto(datos, 'texto'), _puntuacion(datos))
+                return 200, {'exito': exito, 'mensaje': mensaje}
+            bucle = asyncio.get_running_loop()
+            ejecutor = self.lectores if operacion in OPERACIONES_LECTURA else self.escritor
+            resultado = await bucle.run_in_executor(ejecutor, self.servicio.ejecutar, operacion, datos)
+            if self.servicio.modificado:
+                self.programar_guardado()
+            return 200, resultado
+        except ErrorPeticion as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f"Error interno: {e}"}
+
+    async def atender(self, lector, escritor):
+        try:
+            while True:
+                try:
+                    cabecera = await lector.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                lineas = cabecera.decode('latin-1').split("\r\n")
+                try:
+                    metodo, ruta, version = lineas[0].split(" ", 2)
+                except ValueError:
+                    break
+                cabeceras = {}
+                for linea in lineas[1:]:
+                    nombre, separador, valor = linea.partition(":")
+                    if separador:
+                        cabeceras[nombre.strip().lower()] = valor.strip()
+
+                try:
+                    longitud = int(cabeceras.get('content-length') or 0)
+                except ValueError:
+                    longitud = -1
+                if longitud < 0:
+                    # Sin una longitud válida no se sabe dónde acaba el cuerpo
+                    escritor.write(self.respuesta(400, {'error': "Content-Length inválido"}, False))
+                    break
+                if longitud > TAMANO_MAXIMO_CUERPO:
+                    escritor.write(self.respuesta(413, {'error': "Cuerpo demasiado grande"}, False))
+                    break
+                cuerpo = await lector.readexactly(longitud) if longitud else b''
+
+                mantener = (version.strip() == 'HTTP/1.1'
+                            and cabeceras.get('connection', '').lower() != 'close')
+                codigo, datos = await self.procesar(metodo, ruta, cuerpo)
+                escritor.write(self.respuesta(codigo, datos, mantener))
+                await escritor.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    @staticmethod
+    def respuesta(codigo, datos, mantener):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        cabecera = (f"HTTP/1.1 {codigo} {responses.get(codigo, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(cuerpo)}\r\n"
+                    f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n")
+        return cabecera.encode('latin-1') + cuerpo
+
+    async def iniciar(self, host='127.0.0.1', puerto=8765):
+        self.servidor = await asyncio.start_server(self.atender, host, puerto)
+        return self.servidor.sockets[0].getsockname()[:2]
+
+    async def cerrar(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        if self.guardado_programado is not None:
+            self.guardado_programado.cancel()
+            self.guardado_programado = None
+        # Las evaluaciones de la última ventana marcan el servicio como
+        # modificado al terminar su pasada: hay que esperarlas antes de guardar
+        self.vaciar_evaluaciones()
+        if self.pasadas_pendientes:
+            await asyncio.gather(*self.pasadas_pendientes)
+        await self.guardar()
+        self.escritor.shutdown(wait=True)
+        self.lectores.shutdown(wait=True)
+
+
+def servir_asincrono(traductor, host='127.0.0.1', puerto=8765, archivo=None,
+                     intervalo_guardado=INTERVALO_GUARDADO):
+    """Atiende peticiones con asyncio hasta Ctrl+C; devuelve True si quedaron cambios sin guardar"""
+    servidor = ServidorAsincrono(traductor, archivo, intervalo_guardado=intervalo_guardado)
+
+    async def principal():
+        direccion = await servidor.iniciar(host, puerto)
+        print(f"Servidor de traducción (asyncio) escuchando en http://{direccion[0]}:{direccion[1]}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await servidor.cerrar()
+
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
+    return servidor.servicio.modificado
@@ -0,0 +1,790 @@
+"""Motor de traducción con aprendizaje incremental (sin dependencias de interfaz)"""
+import gc
+import json
+import os
+import threading
+from sys import intern
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+
+from .autocompletado import IndicePrefijos
+from .bloom import FiltroBloom
+from .cache import CacheTraducciones
+from .historial import IndiceHistorial
+from .consultas import ConsultasDiccionario
+from .instantanea import InstantaneaTraductor
+from .modelos import Idioma, Traduccion
+from .pares import MatrizPares
+from .progreso import OperacionCancelada
+from .modificaciones import IndiceModificaciones
+from .ranking import IndicePuntuaciones, RankingPromedio
+from .serializacion import leer_binario, leer_datos, leer_json, ruta_anterior
+
+TAMANO_LOTE_IMPORTACION = 10000
+
+@contextmanager
+def _sin_recolector():
+    """
+    Pausa el recolector de ciclos mientras se crean muchos objetos sin ciclos
+    (registros, traducciones): si no, sus pasadas recorren una y otra vez
+    todo lo ya creado y se llevan la mitad del tiempo de una carga masiva.
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+class TraductorAprendizaje(ConsultasDiccionario):
+    """
+    Clase del traductor con capacidad de fusionar diccionarios.
+
+    Las tablas de cada par se guardan en una MatrizPares indexada por el id
+    entero de los idiomas; self.diccionario es una vista con la forma del
+    antiguo diccionario anidado, y asignarle un diccionario anidado reemplaza
+    la matriz.
+
+    Las instantáneas (instantanea()) comparten con el traductor vivo las tablas
+    de los pares y los objetos Traduccion. Mientras exista alguna, la primera
+    modificación de un par copia su tabla y la de una traducción la clona, de
+    modo que la instantánea nunca ve cambios posteriores; los pares no tocados
+    siguen compartidos. Sin instantáneas vivas no se copia nada.
+    
+    Con capacidad_fallos > 0 traducir() recuerda en una caché LRU los textos
+    sin traducción, invalidada por clave en cada modificación, y con
+    tasa_falsos_positivos un filtro de Bloom por par descarta los textos que
+    seguro no existen sin llegar a buscarlos.
+    
+    Mejores y peores salen de un índice ordenado por par según self.ranking
+    (media simple por defecto, ver motor_traduccion.ranking), creado en la
+    primera consulta del par y actualizado en cada modificación; el
+    autocompletado usa además un índice de prefijos por par (ver
+    motor_traduccion.autocompletado). El historial se consulta por páginas
+    con un índice por acción, par y texto (ver motor_traduccion.historial).
+    """
+    def __init__(self, capacidad_fallos=0, tasa_falsos_positivos=None, ranking=None):
+        self.historial_traducciones = []
+        self.cache_fallos = CacheTraducciones(capacidad_fallos) if capacidad_fallos else None
+        self.tasa_falsos_positivos = tasa_falsos_positivos
+        self._filtros = {}
+        self.ranking = ranking or RankingPromedio()
+        self._indices = {}
+        self._prefijos = {}
+        self._modificaciones = None
+        self._indice_historial = IndiceHistorial()
+        self._generacion = 0
+        self._tablas_compartidas = set()
+        self._instantaneas = weakref.WeakSet()
+        self._cerrojo_instantaneas = threading.Lock()
+        self.inicializar_diccionario()
+        self.inicializar_traducciones()
+    
+    @ConsultasDiccionario.diccionario.setter
+    def diccionario(self, diccionario):
+        self._matriz = MatrizPares.desde_anidado(diccionario)
+        self._total_traducciones = sum(len(tabla) for _, _, tabla in self._matriz.pares())
+    
+    def inicializar_diccionario(self):
+        """Deja el diccionario vacío; la tabla de cada par se crea con su primera traducción"""
+        self._matriz = MatrizPares()
+        self._total_traducciones = 0
+    
+    def inicializar_traducciones(self):
+        """Agrega traducciones iniciales al diccionario (con puntuación por defecto 5)"""
+        # Español -> Inglés
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "hola", "hello")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "adiós", "goodbye")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "gracias", "thank you")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "por favor", "please")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "agua", "water")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "comida", "food")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "casa", "house")
+        
+        # Inglés -> Español
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "hello", "hola")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "goodbye", "adiós")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "thank you", "gracias")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "please", "por favor")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "water", "agua")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "food", "comida")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.ESPANOL, "house", "casa")
+        
+        # Español -> Francés
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "hola", "bonjour")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "adiós", "au revoir")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "gracias", "merci")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.FRANCES, "agua", "eau")
+        
+        # Francés -> Español
+        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "bonjour", "hola")
+        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "au revoir", "adiós")
+        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "merci", "gracias")
+        self.agregar_traduccion(Idioma.FRANCES, Idioma.ESPANOL, "eau", "agua")
+        
+        # Español -> Portugués
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "hola", "olá")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "adiós", "adeus")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "gracias", "obrigado")
+        self.agregar_traduccion(Idioma.ESPANOL, Idioma.PORTUGUES, "agua", "água")
+        
+        # Portugués -> Español
+        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "olá", "hola")
+        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "adeus", "adiós")
+        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "obrigado", "gracias")
+        self.agregar_traduccion(Idioma.PORTUGUES, Idioma.ESPANOL, "água", "agua")
+        
+        # Inglés -> Francés
+        self.agregar_traduccion(Idioma.INGLES, Idioma.FRANCES, "hello", "bonjour")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.FRANCES, "goodbye", "au revoir")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.FRANCES, "water", "eau")
+        
+        # Inglés -> Portugués
+        self.agregar_traduccion(Idioma.INGLES, Idioma.PORTUGUES, "hello", "olá")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.PORTUGUES, "goodbye", "adeus")
+        self.agregar_traduccion(Idioma.INGLES, Idioma.PORTUGUES, "water", "água")
+    
+    def instantanea(self):
+        """Devuelve una vista congelada del diccionario y del historial en este momento"""
+        with self._cerrojo_instantaneas:
+            self._generacion += 1
+            self._tablas_compartidas = {(origen, destino) for origen, destino, _ in self._matriz.pares()}
+            vista = InstantaneaTraductor(self._matriz, self.historial_traducciones, self.ranking)
+            self._instantaneas.add(vista)
+        return vista
+    
+    def _tabla_mutable(self, origen, destino):
+        """Tabla del par lista para modificar; la copia si una instantánea la comparte"""
+        tabla = self._matriz.tabla(origen, destino)
+        if tabla is None:
+            tabla = {}
+            self._matriz.asignar(origen, destino, tabla)
+        elif self._tablas_compartidas and (origen, destino) in self._tablas_compartidas:
+            self._tablas_compartidas.discard((origen, destino))
+            if self._instantaneas:
+                tabla = dict(tabla)
+                self._matriz.asignar(origen, destino, tabla)
+            else:
+                self._tablas_compartidas.clear()
+        return tabla
+    
+    def _traduccion_mutable(self, origen, destino, texto_lower):
+        """Traducción lista para modificar; la clona si una instantánea la comparte"""
+        tabla = self._tabla_mutable(origen, destino)
+        traduccion = tabla[texto_lower]
+        if traduccion._generacion != self._generacion and self._instantaneas:
+            traduccion = tabla[texto_lower] = traduccion.copiar()
+            traduccion._generacion = self._generacion
+            self._invalidar(origen, destino, texto_lower)
+        return traduccion
+    
+    def _nueva_clave(self, origen, destino, texto_lower):
+        """Cuenta una clave recién creada y la añade al índice de prefijos del par"""
+        self._total_traducciones += 1
+        prefijos = self._prefijos.get((origen, destino))
+        if prefijos is not None:
+            prefijos.agregar(texto_lower)
+    
+    def _invalidar(self, origen, destino, texto_lower):
+        """Pone al día la caché de fallos y el filtro tras crear o reemplazar una clave"""
+        if self.cache_fallos is not None:
+            self.cache_fallos.invalidar(origen, destino, texto_lower)
+        filtro = self._filtros.get((origen, destino))
+        if filtro is not None:
+            filtro.agregar(texto_lower)
+            if filtro.saturado():
+                # Se reconstruye con más capacidad en la próxima consulta del par
+                del self._filtros[(origen, destino)]
+    
+    def _invalidar_todo(self):
+        self._tablas_compartidas = set()
+        self._filtros = {}
+        self._indices = {}
+        self._prefijos = {}
+        self._modificaciones = None
+        if self.cache_fallos is not None:
+            self.cache_fallos.vaciar()
+    
+    def _filtro(self, origen, destino, tabla):
+        filtro = self._filtros.get((origen, destino))
+        if filtro is None:
+            filtro = self._filtros[(origen, destino)] = FiltroBloom.desde_claves(tabla, self.tasa_falsos_positivos)
+        return filtro
+    
+    def usar_ranking(self, ranking):
+        """Cambia la función de ranking; los índices se reconstruyen en la próxima consulta"""
+        self.ranking = ranking
+        self._indices = {}
+    
+    def _reindexar(self, origen, destino, texto_lower, traduccion, modificada=True):
+        indice = self._indices.get((origen, destino))
+        if indice is not None:
+            indice.actualizar(texto_lower, traduccion)
+        modificaciones = self._modificaciones
+        if modificada and modificaciones is not None:
+            if not modificaciones.anotar(origen, destino, texto_lower, traduccion.fecha_ultima_modificacion):
+                self._modificaciones = None
+    
+    def modificadas_desde(self, fecha):
+        """
+        {(origen, destino): [textos]} de las traducciones modificadas en o
+        después de `fecha`, del índice por fecha de modificación (que se crea
+        en la primera consulta y se compacta cuando acumula demasiadas
+        repeticiones).
+        """
+        modificaciones = self._modificaciones
+        if modificaciones is None or modificaciones.necesita_compactar(self.obtener_total_traducciones()):
+            modificaciones = self._modificaciones = IndiceModificaciones(self._matriz)
+        return modificaciones.desde(fecha)
+    
+    def _indice(self, origen, destino):
+        tabla = self._matriz.tabla(origen, destino)
+        if tabla is None:
+            return None, None
+        indice = self._indices.get((origen, destino))
+        if indice is None:
+            indice = self._indices[(origen, destino)] = IndicePuntuaciones(self.ranking, tabla)
+        return indice, tabla
+    
+    def obtener_mejores_traducciones(self, idioma_origen, idioma_destino, limite=10):
+        indice, tabla = self._indice(idioma_origen, idioma_destino)
+        if indice is None:
+            return []
+        return [(texto, tabla[texto]) for texto in indice.mejores(limite)]
+    
+    def obtener_peores_traducciones(self, idioma_origen, idioma_destino, limite=10):
+        indice, tabla = self._indice(idioma_origen, idioma_destino)
+        if indice is None:
+            return []
+        return [(texto, tabla[texto]) for texto in indice.peores(limite)]
+    
+    def obtener_total_traducciones(self):
+        """Número total de traducciones, del contador que se actualiza en cada alta"""
+        return self._total_traducciones
+    
+    def autocompletar(self, idioma_origen, idioma_destino, prefijo, limite=10):
+        """
+        [(texto_origen, traduccion)] de hasta `limite` entradas del par cuyo
+        texto empieza por prefijo (sin distinguir mayúsculas), de mejor a peor
+        según self.ranking. El índice de prefijos del par se crea en la
+        primera consulta y recibe cada clave nueva.
+        """
+        puntuaciones, tabla = self._indice(idioma_origen, idioma_destino)
+        if puntuaciones is None:
+            return []
+        prefijos = self._prefijos.get((idioma_origen, idioma_destino))
+        if prefijos is None:
+            prefijos = self._prefijos[(idioma_origen, idioma_destino)] = IndicePrefijos(tabla)
+        return [(texto, tabla[texto]) for texto in prefijos.completar(prefijo.lower(), limite, puntuaciones)]
+    
+    def obtener_pagina_traducciones(self, idioma_origen, idioma_destino, inicio, cantidad, mejores=True):
+        indice, tabla = self._indice(idioma_origen, idioma_destino)
+        if indice is None:
+            return 0, []
+        return len(indice), [(texto, tabla[texto]) for texto in indice.pagina(inicio, cantidad, mejores)]
+    
+    def consultar_historial(self, inicio=0, cantidad=50, accion=None, origen=None, destino=None, texto=None):
+        """
+        (total, [(posicion, registro)]) de los registros del historial que
+        cumplen los filtros, del más reciente al más antiguo y saltando los
+        `inicio` más recientes; posicion es su índice en historial_traducciones.
+        texto filtra por texto de origen exacto, sin distinguir mayúsculas.
+        """
+        return self._indice_historial.pagina(self.historial_traducciones, inicio, cantidad,
+                                             accion, origen, destino, texto)
+    
+    def obtener_estadisticas(self):
+        estadisticas = self.instantanea().obtener_estadisticas()
+        if self.cache_fallos is not None:
+            estadisticas['cache_fallos'] = self.cache_fallos.estadisticas()
+        if self.tasa_falsos_positivos is not None:
+            estadisticas['filtro_bloom'] = self.estadisticas_filtros()
+        return estadisticas
+    
+    def estadisticas_filtros(self):
+        """Tasa configurada, estimada y observada de falsos positivos de los filtros de Bloom"""
+        filtros = list(self._filtros.values())
+        descartes = sum(f.descartes for f in filtros)
+        falsos_positivos = sum(f.falsos_positivos for f in filtros)
+        elementos = sum(f.elementos for f in filtros)
+        return {
+            'pares': len(filtros),
+            'bits': sum(f.bits for f in filtros),
+            'tasa_configurada': self.tasa_falsos_positivos,
+            'tasa_estimada': (sum(f.tasa_estimada() * f.elementos for f in filtros) / elementos
+                              if elementos else 0.0),
+            'tasa_observada': (falsos_positivos / (falsos_positivos + descartes)
+                               if falsos_positivos + descartes else 0.0),
+            'descartes': descartes,
+            'falsos_positivos': falsos_positivos,
+        }
+    
+    def guardar_diccionario_binario(self, archivo, conservar_anterior=False, progreso=None):
+        return self.instantanea().guardar_diccionario_binario(archivo, conservar_anterior, progreso)
+    
+    def guardar_diccionario_json(self, archivo, codec=None, compacto=False, conservar_anterior=False,
+                                 progreso=None):
+        return self.instantanea().guardar_diccionario_json(archivo, codec, compacto, conservar_anterior, progreso)
+    
+    def exportar_traducciones_texto(self, archivo):
+        return self.exportar_traducciones(archivo, 'texto')
+    
+    def instantanea_ordenada(self, modificadas_desde=None):
+        """
+        Instantánea más una copia del orden de los índices de puntuación ya
+        creados, {(origen, destino): [(clave, llegada, texto)]}, tomadas a la vez: la
+        exportación recorre ese orden en lugar de ordenar cada par. Con
+        modificadas_desde devuelve además los textos modificados desde esa
+        fecha (ver modificadas_desde); si no, None.
+        """
+        instantanea = self.instantanea()
+        if modificadas_desde is not None:
+            return instantanea, {}, self.modificadas_desde(modificadas_desde)
+        return instantanea, {par: list(indice.orden) for par, indice in list(self._indices.items())}, None
+    
+    def exportar_traducciones(self, archivo, formato=None, estadisticas=True, filtro=None, progreso=None):
+        instantanea, ordenes, cambios = self.instantanea_ordenada(filtro and filtro.modificadas_desde)
+        return instantanea.exportar_traducciones(archivo, formato, estadisticas, ordenes, filtro, cambios, progreso)
+    
+    def exportar_por_pares(self, directorio, formato='tsv', hilos=4, filtro=None):
+        instantanea, ordenes, cambios = self.instantanea_ordenada(filtro and filtro.modificadas_desde)
+        return instantanea.exportar_por_pares(directorio, formato, hilos, ordenes, filtro, cambios)
+    
+    def fusionar_traduccion(self, origen, destino, texto_origen, nueva_traduccion):
+        """
+        Fusiona una traducción: si ya existe, combina las estadísticas
+        Si no existe, la agrega
+        """
+        texto_origen_lower = intern(texto_origen.lower())
+        
+        
+        tabla = self._matriz.tabla(origen, destino)
+        existe = tabla is not None and texto_origen_lower in tabla
+        
+        if existe:
+            existente = self._traduccion_mutable(origen, destino, texto_origen_lower)
+            
+            if existente.texto != nueva_traduccion.texto:
+                existente.texto = intern(nueva_traduccion.texto)
+            
+            historial_combinado = existente.historial_puntuaciones + nueva_traduccion.historial_puntuaciones
+            existente.historial_puntuaciones = historial_combinado
+            existente.total_evaluaciones = len(historial_combinado)
+            existente.suma_puntuaciones = existente.suma_puntuaciones + nueva_traduccion.suma_puntuaciones
+            existente.puntuacion_promedio = existente.suma_puntuaciones / existente.total_evaluaciones
+            
+            existente.fecha_ultima_modificacion = datetime.now()
+            self._reindexar(origen, destino, texto_origen_lower, existente)
+            
+            return "actualizada"
+        else:
+            nueva_traduccion.texto = intern(nueva_traduccion.texto)
+            nueva_traduccion._generacion = self._generacion
+            self._tabla_mutable(origen, destino)[texto_origen_lower] = nueva_traduccion
+            self._nueva_clave(origen, destino, texto_origen_lower)
+            self._invalidar(origen, destino, texto_origen_lower)
+            self._reindexar(origen, destino, texto_origen_lower, nueva_traduccion)
+            return "agregada"
+    
+    def fusionar_diccionario_completo(self, nuevo_diccionario, nuevo_historial):
+        """
+        Fusiona un diccionario completo con el existente
+        Devuelve estadísticas de la fusión
+        """
+        estadisticas = {
+            'total_traducciones_antes': self.obtener_total_traducciones(),
+            'traducciones_agregadas': 0,
+            'traducciones_actualizadas': 0,
+            'errores': 0
+        }
+        
+        for origen, destinos in nuevo_diccionario.items():
+            for destino, traducciones in destinos.items():
+                for texto_origen, nueva_traduccion in traducciones.items():
+                    try:
+                        resultado = self.fusionar_traduccion(origen, destino, texto_origen, nueva_traduccion)
+                        if resultado == "agregada":
+                            estadisticas['traducciones_agregadas'] += 1
+                        elif resultado == "actualizada":
+                            estadisticas['traducciones_actualizadas'] += 1
+                    except Exception as e:
+                        estadisticas['errores'] += 1
+                        print(f"Error fusionando traducción: {e}")
+        
+        if nuevo_historial:
+            # Lista nueva en lugar de ordenar en el sitio: las instantáneas conservan la anterior
+            self.historial_traducciones = sorted(self.historial_traducciones + nuevo_historial,
+                                                key=lambda x: x['fecha'])
+        
+        estadisticas['total_traducciones_despues'] = self.obtener_total_traducciones()
+        return estadisticas
+    
+    def importar_lote(self, origen, destino, filas, inversas=False):
+        """
+        Fusiona un lote de filas (texto_origen, texto_traduccion, puntuacion)
+        con fusionar_traduccion; puntuacion None deja la inicial por defecto.
+        Con inversas, cada fila agrega también la traducción destino -> origen.
+        Devuelve (agregadas, actualizadas).
+        """
+        agregadas = actualizadas = 0
+        with _sin_recolector():
+            for texto_origen, texto_traduccion, puntuacion in filas:
+                sentidos = [(origen, destino, texto_origen, texto_traduccion)]
+                if inversas:
+                    sentidos.append((destino, origen, texto_traduccion, texto_origen))
+                for o, d, texto, texto_traducido in sentidos:
+                    nueva_traduccion = Traduccion(texto_traducido)
+                    if puntuacion is not None:
+                        nueva_traduccion.historial_puntuaciones = [puntuacion]
+                        nueva_traduccion.suma_puntuaciones = puntuacion
+                        nueva_traduccion.puntuacion_promedio = puntuacion
+                    if self.fusionar_traduccion(o, d, texto, nueva_traduccion) == "agregada":
+                        agregadas += 1
+                    else:
+                        actualizadas += 1
+        return agregadas, actualizadas
+    
+    def importar_archivo(self, archivo, origen, destino, formato=None, inversas=False,
+                         codigo_origen=None, codigo_destino=None, tamano_lote=TAMANO_LOTE_IMPORTACION):
+        """
+        Importa un glosario TSV, CSV o TMX (formato según la extensión si no se
+        indica) leyéndolo en streaming y fusionándolo por lotes de tamano_lote
+        filas. En TMX los códigos de idioma salen de CODIGOS_IDIOMA si no se
+        indican. Con la versión concurrente, cada lote toma el cerrojo de
+        escritura por separado y las lecturas siguen entre lotes.
+        """
+        from .importacion import CODIGOS_IDIOMA, crear_lector, formato_de_archivo
+        
+        formato = formato or formato_de_archivo(archivo)
+        if formato is None:
+            return False, f"No se reconoce el formato de {archivo} (tsv, csv o tmx)"
+        try:
+            lector = crear_lector(archivo, formato,
+                                  codigo_origen or CODIGOS_IDIOMA.get(origen.value),
+                                  codigo_destino or CODIGOS_IDIOMA.get(destino.value))
+            agregadas = actualizadas = leidas = 0
+            filas = iter(lector)
+            while lote := list(islice(filas, tamano_lote)):
+                resultado = self.importar_lote(origen, destino, lote, inversas)
+                agregadas += resultado[0]
+                actualizadas += resultado[1]
+                leidas += len(lote)
+        except FileNotFoundError:
+            return False, f"Archivo no encontrado: {archivo}"
+        except ValueError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"Error al importar {archivo}: {str(e)}"
+        
+        comentarios = getattr(lector, 'comentarios', 0)
+        mensaje = (f"Glosario importado desde {archivo} ({formato.upper()}, {origen.value} → {destino.value})\n\n"
+                   f"• Filas leídas: {leidas}\n"
+                   f"• Filas descartadas: {lector.descartadas}\n"
+                   + (f"• Líneas de comentario omitidas: {comentarios}\n" if comentarios else "") +
+                   f"• Traducciones agregadas: {agregadas}\n"
+                   f"• Traducciones actualizadas: {actualizadas}")
+        return True, mensaje
+    
+    def agregar_traduccion(self, idioma_origen, idioma_destino, texto_origen, texto_traduccion):
+        """Agrega una traducción con puntuación inicial por defecto (5)"""
+        self.agregar_traduccion_con_puntuacion(idioma_origen, idioma_destino, texto_origen, texto_traduccion, 5)
+    
+    def agregar_traduccion_con_puntuacion(self, idioma_origen, idioma_destino, texto_origen, texto_traduccion, puntuacion):
+        # Cadenas internadas: con traducciones inversas, la clave de un par, el
+        # texto del par contrario y los registros del historial son el mismo objeto
+        texto_origen = intern(texto_origen)
+        texto_traduccion = intern(texto_traduccion)
+        texto_origen_lower = intern(texto_origen.lower())
+        
+        nueva_traduccion = Traduccion(texto_traduccion)
+        nueva_traduccion.historial_puntuaciones = [puntuacion]
+        nueva_traduccion.suma_puntuaciones = puntuacion
+        nueva_traduccion.puntuacion_promedio = puntuacion
+        nueva_traduccion._generacion = self._generacion
+        
+        tabla = self._tabla_mutable(idioma_origen, idioma_destino)
+        if texto_origen_lower not in tabla:
+            self._nueva_clave(idioma_origen, idioma_destino, texto_origen_lower)
+        tabla[texto_origen_lower] = nueva_traduccion
+        self._invalidar(idioma_origen, idioma_destino, texto_origen_lower)
+        self._reindexar(idioma_origen, idioma_destino, texto_origen_lower, nueva_traduccion)
+        
+        self.historial_traducciones.append({
+            'fecha': datetime.now(),
+            'accion': 'agregar',
+            'origen': idioma_origen,
+            'destino': idioma_destino,
+            'texto_origen': texto_origen,
+            'texto_traduccion': texto_traduccion
+        })
+    
+    def traducir(self, idioma_origen, idioma_destino, texto, registrar=True):
+        """Devuelve la traducción o None; con registrar=False no se anota en el historial"""
+        traduccion = self._resolver(idioma_origen, idioma_destino, texto)
+        if traduccion is None:
+            return None
+        
+        if registrar:
+            self.historial_traducciones.append({
+                'fecha': datetime.now(),
+                'accion': 'traducir',
+                'origen': idioma_origen,
+                'destino': idioma_destino,
+                'texto_origen': intern(texto),
+                'texto_traduccion': traduccion.texto,
+                'puntuacion': traduccion.puntuacion_promedio
+            })
+        
+        return traduccion.texto
+    
+    def _resolver(self, idioma_origen, idioma_destino, texto):
+        """Objeto Traduccion que corresponde al texto tal como llega, o None"""
+        cache_fallos = self.cache_fallos
+        if cache_fallos is not None and cache_fallos.obtener(idioma_origen, idioma_destino, texto):
+            return None
+        
+        texto_lower = texto.lower()
+        tabla = self._matriz.tabla(idioma_origen, idioma_destino)
+        traduccion = None
+        if tabla is not None:
+            if self.tasa_falsos_positivos is None:
+                traduccion = tabla.get(texto_lower)
+            else:
+                filtro = self._filtro(idioma_origen, idioma_destino, tabla)
+                if texto_lower not in filtro:
+                    filtro.descartes += 1
+                else:
+                    traduccion = tabla.get(texto_lower)
+                    if traduccion is None:
+                        filtro.falsos_positivos += 1
+        
+        if traduccion is None and cache_fallos is not None:
+            cache_fallos.guardar(idioma_origen, idioma_destino, texto, texto_lower, True)
+        return traduccion
+    
+    def evaluar_traduccion(self, idioma_origen, idioma_destino, texto, puntuacion):
+        if puntuacion < 1 or puntuacion > 10:
+            return False, "La puntuación debe estar entre 1 y 10"
+        
+        texto_lower = texto.lower()
+        
+        if not self.existe_traduccion(idioma_origen, idioma_destino, texto):
+            return False, "No existe una traducción para ese texto"
+        
+        traduccion = self._traduccion_mutable(idioma_origen, idioma_destino, texto_lower)
+        puntuacion_anterior = traduccion.puntuacion_promedio
+        
+        traduccion.actualizar_puntuacion(puntuacion)
+        self._reindexar(idioma_origen, idioma_destino, texto_lower, traduccion)
+        
+        self.historial_traducciones.append({
+            'fecha': datetime.now(),
+            'accion': 'evaluar',
+            'origen': idioma_origen,
+            'destino': idioma_destino,
+            'texto_origen': intern(texto),
+            'puntuacion': puntuacion,
+            'puntuacion_anterior': puntuacion_anterior
+        })
+        
+        mensaje = (f"Evaluación registrada: {puntuacion}/10\n"
+                f"Puntuación anterior: {puntuacion_anterior:.1f}/10\n"
+                f"Nueva puntuación: {traduccion.puntuacion_promedio:.1f}/10")
+        
+        return True, mensaje
+    
+    def evaluar_lote(self, evaluaciones):
+        """
+        Aplica muchas evaluaciones de una vez; evaluaciones es un iterable de
+        (origen, destino, texto, puntuacion). Agrupa las puntuaciones por
+        entrada, busca cada entrada una sola vez y la actualiza con todo su
+        grupo. El resultado es el mismo que llamar a evaluar_traduccion por
+        fila, salvo que el historial queda agrupado por entrada.
+        
+        Devuelve (aceptadas, rechazos), con rechazos una lista de
+        (posición en evaluaciones, motivo).
+        """
+        with _sin_recolector():
+            return self._evaluar_lote(evaluaciones)
+    
+    def _evaluar_lote(self, evaluaciones):
+        grupos = {}
+        rechazos = []
+        aceptadas = 0
+        tablas = {}
+        for posicion, (origen, destino, texto, puntuacion) in enumerate(evaluaciones):
+            if not 1 <= puntuacion <= 10:
+                rechazos.append((posicion, "La puntuación debe estar entre 1 y 10"))
+                continue
+            texto_lower = texto.lower()
+            tabla = tablas.get((origen, destino))
+            if tabla is None:
+                tabla = tablas[(origen, destino)] = self._matriz.tabla(origen, destino) or {}
+            if texto_lower not in tabla:
+                rechazos.append((posicion, "No existe una traducción para ese texto"))
+                continue
+            grupo = grupos.get((origen, destino, texto_lower))
+            if grupo is None:
+                grupo = grupos[(origen, destino, texto_lower)] = (intern(texto), [])
+            grupo[1].append(puntuacion)
+            aceptadas += 1
+        
+        fecha = datetime.now()
+        registros = []
+        for (origen, destino, texto_lower), (texto, puntuaciones) in grupos.items():
+            traduccion = self._traduccion_mutable(origen, destino, texto_lower)
+            suma = traduccion.suma_puntuaciones
+            total = traduccion.total_evaluaciones
+            anterior = traduccion.puntuacion_promedio
+            for puntuacion in puntuaciones:
+                registros.append({
+                    'fecha': fecha,
+                    'accion': 'evaluar',
+                    'origen': origen,
+                    'destino': destino,
+                    'texto_origen': texto,
+                    'puntuacion': puntuacion,
+                    'puntuacion_anterior': anterior
+                })
+                suma += puntuacion
+                total += 1
+                anterior = suma / total
+            traduccion.actualizar_puntuaciones(puntuaciones)
+            self._reindexar(origen, destino, texto_lower, traduccion)
+        self.historial_traducciones.extend(registros)
+        return aceptadas, rechazos
+    
+    def fijar_puntuaciones(self, cambios):
+        """
+        Asigna puntuacion_politica a muchas traducciones de una vez; cambios
+        es un iterable de (origen, destino, clave, puntuacion), y None quita
+        la puntuación fijada. Lo usa AlmacenPuntuaciones para aplicar una
+        política de puntuación. Las medias y sumas no cambian: la siguiente
+        evaluación de cada entrada descarta su puntuación fijada, y al
+        guardar no se conserva (se vuelve a calcular con la política).
+        """
+        aplicados = 0
+        for origen, destino, clave, puntuacion in cambios:
+            tabla = self._matriz.tabla(origen, destino)
+            if tabla is not None and clave in tabla:
+                traduccion = self._traduccion_mutable(origen, destino, clave)
+                traduccion.puntuacion_politica = puntuacion
+                self._reindexar(origen, destino, clave, traduccion, modificada=False)
+                aplicados += 1
+        return aplicados
+    
+    def aplicar_carga(self, diccionario_nuevo, historial_nuevo, fusionar=True):
+        """
+        Segundo paso de una carga (el primero es serializacion.leer_datos):
+        fusiona lo leído con el contenido actual o lo reemplaza. Devuelve las
+        estadísticas de la fusión, o None al reemplazar.
+        """
+        if fusionar:
+            return self.fusionar_diccionario_completo(diccionario_nuevo, historial_nuevo)
+        self.diccionario = diccionario_nuevo
+        self.historial_traducciones = historial_nuevo
+        self._invalidar_todo()
+        return None
+    
+    def cargar_diccionario_binario(self, archivo, fusionar=True, respaldo=False, progreso=None):
+        """Con respaldo=True, si el archivo no se puede leer se carga su copia anterior"""
+        return self._cargar(self._cargar_binario, archivo, fusionar, respaldo, progreso)
+    
+    def _cargar_binario(self, archivo, fusionar, progreso):
+        try:
+            with _sin_recolector():
+                diccionario_nuevo, historial_nuevo = leer_binario(archivo, progreso)
+            if progreso is not None:
+                progreso('Aplicando', 0, None)
+            
+            if fusionar:
+                estadisticas = self.aplicar_carga(diccionario_nuevo, historial_nuevo, fusionar=True)
+                
+                mensaje = (f"Diccionario fusionado exitosamente desde {archivo}\n\n"
+                        f"Estadísticas de fusión:\n"
+                        f"• Traducciones antes: {estadisticas['total_traducciones_antes']}\n"
+                        f"• Traducciones agregadas: {estadisticas['traducciones_agregadas']}\n"
+                        f"• Traducciones actualizadas: {estadisticas['traducciones_actualizadas']}\n"
+                        f"• Traducciones después: {estadisticas['total_traducciones_despues']}\n"
+                        f"• Errores: {estadisticas['errores']}")
+                
+                return True, mensaje
+            else:
+                self.aplicar_carga(diccionario_nuevo, historial_nuevo, fusionar=False)
+                return True, f"Diccionario reemplazado exitosamente desde {archivo}"
+            
+        except FileNotFoundError:
+            return False, f"Archivo no encontrado: {archivo}"
+        except OperacionCancelada:
+            raise
+        except Exception as e:
+            return False, f"Error al cargar el diccionario: {str(e)}"
+    
+    def cargar_diccionario_json(self, archivo, fusionar=True, respaldo=False, progreso=None):
+        """
+        Carga JSON clásico o por filas, comprimido o no (ver
+        motor_traduccion.serializacion). Con respaldo=True, si el archivo no
+        se puede leer (falta, está truncado o falla su suma de control) se
+        carga la copia anterior que dejó guardar con conservar_anterior.
+        Ver motor_traduccion.progreso para progreso: una carga cancelada no
+        modifica el traductor.
+        """
+        return self._cargar(self._cargar_json, archivo, fusionar, respaldo, progreso)
+    
+    def _cargar(self, cargar, archivo, fusionar, respaldo, progreso):
+        try:
+            exito, mensaje = cargar(archivo, fusionar, progreso)
+            if exito or not respaldo:
+                return exito, mensaje
+            anterior = ruta_anterior(archivo)
+            if not os.path.exists(anterior):
+                return False, mensaje
+            exito, mensaje_anterior = cargar(anterior, fusionar, progreso)
+            if not exito:
+                return False, f"{mensaje}\n{mensaje_anterior}"
+            return True, f"{mensaje}\nSe cargó la copia anterior. {mensaje_anterior}"
+        except OperacionCancelada:
+            return False, "Carga cancelada"
+    
+    def _cargar_json(self, archivo, fusionar, progreso):
+        try:
+            with _sin_recolector():
+                diccionario_nuevo, historial_nuevo = leer_datos(leer_json(archivo, progreso), progreso)
+            if progreso is not None:
+                progreso('Aplicando', 0, None)
+            
+            if fusionar:
+                estadisticas = self.aplicar_carga(diccionario_nuevo, historial_nuevo, fusionar=True)
+                
+                mensaje = (f"Diccionario fusionado exitosamente desde JSON: {archivo}\n\n"
+                        f"Estadísticas de fusión:\n"
+                        f"• Traducciones antes: {estadisticas['total_traducciones_antes']}\n"
+                        f"• Traducciones agregadas: {estadisticas['traducciones_agregadas']}\n"
+                        f"• Traducciones actualizadas: {estadisticas['traducciones_actualizadas']}\n"
+                        f"• Traducciones después: {estadisticas['total_traducciones_despues']}\n"
+                        f"• Errores: {estadisticas['errores']}")
+                
+                return True, mensaje
+            else: 
+                self.aplicar_carga(diccionario_nuevo, historial_nuevo, fusionar=False)
+                return True, f"Diccionario reemplazado desde JSON: {archivo}"
+            
+        except FileNotFoundError:
+            return False, f"Archivo no encontrado: {archivo}"
+        except json.JSONDecodeError:
+            return False, f"Error en el formato JSON del archivo: {archivo}"
+        except OperacionCancelada:
+            raise
+        except Exception as e:
+            return False, f"Error al cargar el diccionario JSON: {str(e)}"
+    
+    def limpiar_diccionario(self):
+        """Limpia completamente el diccionario y el historial"""
+        self.historial_traducciones = []
+        self._invalidar_todo()
+        self.inicializar_diccionario()
+        return True, "Diccionario limpiado exitosamente"
+
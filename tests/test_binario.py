@@ -0,0 +1,88 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from motor_traduccion import Idioma, TraductorAprendizaje
+
+ORIGEN, DESTINO = Idioma.ESPANOL, Idioma.INGLES
+
+
+class PruebasIdaYVuelta(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.traductor = TraductorAprendizaje()
+        self.traductor.limpiar_diccionario()
+        self.traductor.agregar_traduccion_con_puntuacion(ORIGEN, DESTINO, "hola", "hello", 8)
+        self.traductor.evaluar_traduccion(ORIGEN, DESTINO, "hola", 6)
+        self.traductor.traducir(ORIGEN, DESTINO, "hola")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio, nombre)
+
+    def guardar_y_cargar(self, traductor, nombre):
+        guardar = traductor.guardar_diccionario_json if nombre.endswith('.json') else \
+            traductor.guardar_diccionario_binario
+        exito, mensaje = guardar(self.ruta(nombre))
+        self.assertTrue(exito, mensaje)
+        cargado = TraductorAprendizaje()
+        cargar = cargado.cargar_diccionario_json if nombre.endswith('.json') else \
+            cargado.cargar_diccionario_binario
+        exito, mensaje = cargar(self.ruta(nombre), fusionar=False)
+        self.assertTrue(exito, mensaje)
+        return cargado
+
+    def contenido_json(self, nombre):
+        with open(self.ruta(nombre), encoding='utf-8') as f:
+            datos = json.load(f)
+        datos.pop('suma_control', None)
+        datos.pop('fecha_guardado', None)
+        return datos
+
+    def test_json_binario_json_es_identico(self):
+        fecha = datetime(2024, 5, 1, 12, 30)
+        self.traductor.historial_traducciones += [
+            {'fecha': fecha, 'texto_origen': "sin acción"},
+            {'fecha': fecha, 'accion': 'importar', 'origen': None, 'archivo': "g.tsv"},
+            {'fecha': fecha, 'accion': 'evaluar', 'origen': ORIGEN, 'destino': DESTINO, 'puntuacion': "?"},
+        ]
+        self.traductor.diccionario[ORIGEN][DESTINO]["hola"].total_evaluaciones = 2.0
+
+        desde_json = self.guardar_y_cargar(self.traductor, 'a.json')
+        desde_binario = self.guardar_y_cargar(desde_json, 'b.bin')
+        self.guardar_y_cargar(desde_binario, 'c.json')
+        self.assertEqual(self.contenido_json('c.json'), self.contenido_json('a.json'))
+        self.assertEqual(desde_binario.historial_traducciones, desde_json.historial_traducciones)
+
+    def test_el_formato_por_filas_conserva_los_campos_con_none(self):
+        fecha = datetime(2024, 5, 1, 12, 30)
+        self.traductor.historial_traducciones += [
+            {'fecha': fecha, 'accion': 'x', 'puntuacion': None},
+            {'fecha': fecha, 'accion': None, 'origen': None, 'texto_origen': "hola"},
+            {'fecha': fecha, 'texto_traduccion': "hello"},
+        ]
+        clasico = self.guardar_y_cargar(self.traductor, 'a.json')
+        for nombre in ('b.json', 'c.json.xz'):
+            exito, mensaje = self.traductor.guardar_diccionario_json(self.ruta(nombre), compacto=True)
+            self.assertTrue(exito, mensaje)
+            cargado = TraductorAprendizaje()
+            exito, mensaje = cargado.cargar_diccionario_json(self.ruta(nombre), fusionar=False)
+            self.assertTrue(exito, mensaje)
+            self.assertEqual(cargado.historial_traducciones, clasico.historial_traducciones)
+            self.assertEqual(cargado.historial_traducciones, self.traductor.historial_traducciones)
+
+    def test_total_no_entero_se_rechaza_con_un_mensaje_claro(self):
+        self.traductor.diccionario[ORIGEN][DESTINO]["hola"].total_evaluaciones = 2.5
+        exito, mensaje = self.traductor.guardar_diccionario_binario(self.ruta('d.bin'))
+        self.assertFalse(exito)
+        self.assertIn("total_evaluaciones", mensaje)
+        self.assertFalse(os.path.exists(self.ruta('d.bin')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from motor_traduccion import Idioma, TraductorAprendizaje
+from motor_traduccion import exportacion
+
+
+class PruebasExportarPorPares(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.traductor = TraductorAprendizaje()
+        self.traductor.limpiar_diccionario()
+        self.traductor.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "hola", "hello")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_un_fallo_no_deja_el_archivo_a_medias(self):
+        exito, mensaje = self.traductor.exportar_por_pares(self.directorio, 'tsv')
+        self.assertTrue(exito, mensaje)
+        archivo, = os.listdir(self.directorio)
+        with open(os.path.join(self.directorio, archivo), encoding='utf-8') as f:
+            anterior = f.read()
+
+        def escribir_y_fallar(vista, f, *args, **kwargs):
+            f.write("parcial\n")
+            raise OSError("disco lleno")
+
+        self.traductor.agregar_traduccion(Idioma.ESPANOL, Idioma.INGLES, "adiós", "goodbye")
+        with mock.patch.object(exportacion, 'escribir_pares', escribir_y_fallar):
+            exito, _ = self.traductor.exportar_por_pares(self.directorio, 'tsv')
+        self.assertFalse(exito)
+        self.assertEqual(os.listdir(self.directorio), [archivo])
+        with open(os.path.join(self.directorio, archivo), encoding='utf-8') as f:
+            self.assertEqual(f.read(), anterior)
+
+
+if __name__ == '__main__':
+    unittest.main()
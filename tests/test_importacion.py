@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from motor_traduccion.importacion import LectorTabular
+
+
+class PruebasComentarios(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def leer(self, nombre, contenido, delimitador):
+        archivo = os.path.join(self.directorio, nombre)
+        with open(archivo, 'w', encoding='utf-8', newline='') as f:
+            f.write(contenido)
+        lector = LectorTabular(archivo, delimitador)
+        return list(lector), lector
+
+    def test_tsv(self):
+        filas, lector = self.leer('g.tsv', "# cabecera\nhola\thello\t8\n\n \t#tag\n#otra\n\tsin origen\n", '\t')
+        self.assertEqual(filas, [("hola", "hello", 8.0)])
+        self.assertEqual(lector.comentarios, 2)
+        self.assertEqual(lector.descartadas, 2)
+
+    def test_csv_con_almohadilla_entrecomillada(self):
+        contenido = ('# comentario\n"#etiqueta",hashtag\n'
+                     '"varias\n#líneas",multi line\n'
+                     'hola,hello,9\n')
+        filas, lector = self.leer('g.csv', contenido, ',')
+        self.assertEqual(filas, [("#etiqueta", "hashtag", None), ("varias\n#líneas", "multi line", None),
+                                 ("hola", "hello", 9.0)])
+        self.assertEqual(lector.comentarios, 1)
+        self.assertEqual(lector.descartadas, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from motor_traduccion import Idioma, TraductorAprendizaje
+from motor_traduccion.puntuaciones import AlmacenPuntuaciones, np
+from motor_traduccion.ranking import RankingBayesiano
+
+ORIGEN, DESTINO = Idioma.ESPANOL, Idioma.INGLES
+VIDA_MEDIA = 30.0
+
+
+class PruebasPoliticaPuntuacion(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ahora = time.time()
+        self.traductor = TraductorAprendizaje()
+        self.traductor.limpiar_diccionario()
+        ahora = datetime.fromtimestamp(self.ahora)
+        # La mejor media es la más antigua: el decaimiento la hace caer
+        for i, (puntuacion, dias) in enumerate([(10, 200), (8, 1), (7, 2), (3, 1), (6, 50)]):
+            self.traductor.agregar_traduccion_con_puntuacion(ORIGEN, DESTINO, f"texto{i}", f"text{i}", puntuacion)
+            self.tabla()[f"texto{i}"].fecha_ultima_modificacion = ahora - timedelta(days=dias)
+        self.medias = {clave: (t.puntuacion_promedio, t.suma_puntuaciones, t.total_evaluaciones)
+                       for clave, t in self.tabla().items()}
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def tabla(self, traductor=None):
+        return (traductor or self.traductor).diccionario[ORIGEN][DESTINO]
+
+    def reescalar(self, traductor):
+        almacen = AlmacenPuntuaciones.desde_traductor(traductor)
+        puntuaciones = almacen.con_decaimiento(VIDA_MEDIA, self.ahora)
+        almacen.aplicar(traductor, puntuaciones)
+        return dict(zip((clave for _, _, clave in almacen.entradas), puntuaciones))
+
+    def mejores(self, traductor):
+        return [texto for texto, _ in traductor.obtener_mejores_traducciones(ORIGEN, DESTINO, 10)]
+
+    def test_reescalar_no_toca_las_medias(self):
+        puntuaciones = self.reescalar(self.traductor)
+        self.assertEqual(self.mejores(self.traductor), sorted(puntuaciones, key=puntuaciones.get, reverse=True))
+        self.assertNotEqual(self.mejores(self.traductor)[0], "texto0")
+        for clave, traduccion in self.tabla().items():
+            self.assertEqual((traduccion.puntuacion_promedio, traduccion.suma_puntuaciones,
+                              traduccion.total_evaluaciones), self.medias[clave])
+            self.assertAlmostEqual(traduccion.puntuacion_politica, puntuaciones[clave])
+
+    def test_reescalar_y_despues_evaluar(self):
+        self.reescalar(self.traductor)
+        exito, _ = self.traductor.evaluar_traduccion(ORIGEN, DESTINO, "texto3", 9)
+        self.assertTrue(exito)
+        traduccion = self.tabla()["texto3"]
+        _, suma, total = self.medias["texto3"]
+        # La evaluación promedia sobre el historial real, no sobre la puntuación fijada
+        self.assertEqual(traduccion.puntuacion_promedio, (suma + 9) / (total + 1))
+        self.assertIsNone(traduccion.puntuacion_politica)
+        self.assertEqual(traduccion.puntuacion, traduccion.puntuacion_promedio)
+        orden = self.mejores(self.traductor)
+        puntuaciones = [self.tabla()[texto].puntuacion for texto in orden]
+        self.assertEqual(puntuaciones, sorted(puntuaciones, reverse=True))
+
+    def test_el_ranking_bayesiano_suaviza_la_puntuacion_fijada(self):
+        ranking = RankingBayesiano()
+        self.traductor.usar_ranking(ranking)
+        puntuaciones = self.reescalar(self.traductor)
+        for clave, traduccion in self.tabla().items():
+            _, _, total = self.medias[clave]
+            self.assertAlmostEqual(ranking.puntuar(traduccion),
+                                   (ranking.peso * ranking.prior + puntuaciones[clave] * total) / (ranking.peso + total))
+        orden = self.mejores(self.traductor)
+        valores = [ranking.puntuar(self.tabla()[texto]) for texto in orden]
+        self.assertEqual(valores, sorted(valores, reverse=True))
+
+    def test_reescalar_guardar_cargar_y_reescalar(self):
+        primeras = self.reescalar(self.traductor)
+        orden = self.mejores(self.traductor)
+        archivo = os.path.join(self.directorio, 'dic.json')
+        exito, mensaje = self.traductor.guardar_diccionario_json(archivo)
+        self.assertTrue(exito, mensaje)
+
+        cargado = TraductorAprendizaje()
+        exito, mensaje = cargado.cargar_diccionario_json(archivo, fusionar=False)
+        self.assertTrue(exito, mensaje)
+        for clave, traduccion in self.tabla(cargado).items():
+            # En el archivo queda la media, no la puntuación de la política
+            self.assertEqual(traduccion.puntuacion_promedio, self.medias[clave][0])
+            self.assertIsNone(traduccion.puntuacion_politica)
+
+        segundas = self.reescalar(cargado)
+        self.assertEqual(segundas.keys(), primeras.keys())
+        for clave in primeras:
+            self.assertAlmostEqual(segundas[clave], primeras[clave])
+        self.assertEqual(self.mejores(cargado), orden)
+
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class PruebasAlmacenVectorial(unittest.TestCase):
+    """La rama con NumPy da lo mismo que la de listas"""
+
+    def setUp(self):
+        self.traductor = TraductorAprendizaje()
+        for i in range(200):
+            origen, destino = (ORIGEN, DESTINO) if i % 3 else (DESTINO, ORIGEN)
+            self.traductor.agregar_traduccion_con_puntuacion(origen, destino, f"texto{i}", f"text{i}",
+                                                             (i * 7) % 10 + 1)
+        self.listas = AlmacenPuntuaciones.desde_traductor(self.traductor, usar_numpy=False)
+        self.vectorial = AlmacenPuntuaciones.desde_traductor(self.traductor, usar_numpy=True)
+        self.ahora = time.time() + 86400 * 10
+
+    def test_promedios_y_decaimiento(self):
+        self.assertTrue(self.vectorial.vectorial)
+        for calculo in (lambda a: a.promedios(), lambda a: a.con_decaimiento(VIDA_MEDIA, self.ahora),
+                        lambda a: a.con_decaimiento(VIDA_MEDIA, self.ahora, puntuaciones=[7.0] * len(a))):
+            for esperado, obtenido in zip(calculo(self.listas), calculo(self.vectorial).tolist()):
+                self.assertAlmostEqual(obtenido, esperado)
+
+    def test_ranking_con_empates(self):
+        puntuaciones = self.listas.promedios()
+        self.assertEqual(self.vectorial.ranking(puntuaciones), self.listas.ranking(puntuaciones))
+
+    def test_aplicar(self):
+        puntuaciones = self.vectorial.con_decaimiento(VIDA_MEDIA, self.ahora)
+        self.assertEqual(self.vectorial.aplicar(self.traductor, puntuaciones), len(self.vectorial))
+
+
+if __name__ == '__main__':
+    unittest.main()
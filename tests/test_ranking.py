@@ -0,0 +1,81 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from motor_traduccion import Idioma, TraductorAprendizaje
+from motor_traduccion import autocompletado
+from motor_traduccion.ranking import RankingDecaimiento
+
+ORIGEN, DESTINO = Idioma.ESPANOL, Idioma.INGLES
+
+
+class PruebasEmpates(unittest.TestCase):
+    """El índice deshace los empates por orden de llegada, como la ordenación estable de la tabla"""
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.traductor = TraductorAprendizaje()
+        for i in range(300):
+            self.traductor.agregar_traduccion_con_puntuacion(
+                ORIGEN, DESTINO, f"{rng.choice('abc')}texto {i:03d}", f"text {i}", rng.choice([3, 5, 8]))
+        # Crea el índice antes de evaluar para que se actualice incrementalmente
+        self.traductor.obtener_mejores_traducciones(ORIGEN, DESTINO)
+        for i in range(0, 300, 7):
+            texto = next(t for t in self.traductor.diccionario[ORIGEN][DESTINO] if t.endswith(f"{i:03d}"))
+            self.traductor.evaluar_traduccion(ORIGEN, DESTINO, texto, 8)
+        self.traductor.agregar_traduccion_con_puntuacion(ORIGEN, DESTINO, "atexto nuevo", "new text", 5)
+        self.vista = self.traductor.instantanea()
+
+    def textos(self, pares):
+        return [texto for texto, _ in pares]
+
+    def test_mejores_y_peores_coinciden_con_la_ordenacion_estable(self):
+        for limite in (1, 10, 301):
+            self.assertEqual(self.textos(self.traductor.obtener_mejores_traducciones(ORIGEN, DESTINO, limite)),
+                             self.textos(self.vista.obtener_mejores_traducciones(ORIGEN, DESTINO, limite)))
+            self.assertEqual(self.textos(self.traductor.obtener_peores_traducciones(ORIGEN, DESTINO, limite)),
+                             self.textos(self.vista.obtener_peores_traducciones(ORIGEN, DESTINO, limite)))
+
+    def test_paginas_coinciden_con_la_ordenacion_estable(self):
+        for mejores in (True, False):
+            for inicio in (0, 1, 37, 150, 299, 400):
+                total, pagina = self.traductor.obtener_pagina_traducciones(ORIGEN, DESTINO, inicio, 25, mejores)
+                esperado = self.vista.obtener_pagina_traducciones(ORIGEN, DESTINO, inicio, 25, mejores)
+                self.assertEqual((total, self.textos(pagina)), (esperado[0], self.textos(esperado[1])))
+
+    def test_autocompletar_sigue_el_orden_del_indice(self):
+        tabla = self.traductor.diccionario[ORIGEN][DESTINO]
+        clave = self.traductor.ranking.clave
+        for tramo_maximo in (autocompletado.TRAMO_MAXIMO, 0):
+            # Con TRAMO_MAXIMO=0 se recorre el índice de puntuaciones
+            with mock.patch.object(autocompletado, 'TRAMO_MAXIMO', tramo_maximo):
+                for prefijo in ("a", "b", "ctexto 1", ""):
+                    esperado = sorted((t for t in tabla if t.startswith(prefijo)),
+                                      key=lambda t: clave(tabla[t]), reverse=True)[:10]
+                    self.assertEqual(self.textos(self.traductor.autocompletar(ORIGEN, DESTINO, prefijo, 10)),
+                                     esperado)
+
+
+class PruebasDecaimiento(unittest.TestCase):
+    def test_lejos_de_origen_no_desborda_ni_empata(self):
+        origen = datetime(2024, 1, 1)
+        # Vida media de un segundo: las entradas quedan a miles de vidas medias de origen
+        ranking = RankingDecaimiento(vida_media_dias=1 / 86400, origen=origen.timestamp())
+        traductor = TraductorAprendizaje()
+        traductor.limpiar_diccionario()
+        traductor.usar_ranking(ranking)
+        # (texto, puntuación, segundos desde origen), de mejor a peor
+        entradas = [("futura", 9, 3000), ("reciente", 8, -5000), ("antigua", 9, -6000),
+                    ("neutra", 5, 0), ("mala antigua", 2, -6000), ("mala reciente", 3, -5000),
+                    ("mala futura", 1, 3000)]
+        for texto, puntuacion, segundos in reversed(entradas):
+            traductor.agregar_traduccion_con_puntuacion(ORIGEN, DESTINO, texto, texto, puntuacion)
+            traductor.diccionario[ORIGEN][DESTINO][texto].fecha_ultima_modificacion = \
+                origen + timedelta(seconds=segundos)
+        mejores = traductor.obtener_mejores_traducciones(ORIGEN, DESTINO, len(entradas))
+        self.assertEqual([texto for texto, _ in mejores], [texto for texto, _, _ in entradas])
+
+
+if __name__ == '__main__':
+    unittest.main()
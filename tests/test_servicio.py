@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from motor_traduccion import TraductorAprendizajeConcurrente
+from motor_traduccion.instantanea import InstantaneaTraductor
+from motor_traduccion.servicio import ServicioTraduccion
+
+
+class PruebasGuardado(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.archivo = os.path.join(self.directorio, 'dic.json')
+        self.servicio = ServicioTraduccion(TraductorAprendizajeConcurrente(), self.archivo)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def evaluar(self):
+        return self.servicio.evaluar({'origen': 'español', 'destino': 'inglés', 'texto': 'hola', 'puntuacion': 8})
+
+    def test_guardar_no_bloquea_a_los_escritores_mientras_escribe(self):
+        self.evaluar()
+        original = InstantaneaTraductor.guardar_diccionario_json
+        evaluaciones = []
+
+        def guardar_con_evaluacion_concurrente(instantanea, *args, **kwargs):
+            hilo = threading.Thread(target=lambda: evaluaciones.append(self.evaluar()))
+            hilo.start()
+            hilo.join(2)
+            return original(instantanea, *args, **kwargs)
+
+        with mock.patch.object(InstantaneaTraductor, 'guardar_diccionario_json', guardar_con_evaluacion_concurrente):
+            resultado = self.servicio.guardar({})
+
+        self.assertTrue(resultado['exito'])
+        self.assertEqual(len(evaluaciones), 1, "la evaluación esperó a que terminase el guardado")
+        # El cambio hecho durante el guardado no está en el archivo
+        self.assertTrue(self.servicio.modificado)
+
+    def test_guardar_sin_cambios_concurrentes_limpia_modificado(self):
+        self.evaluar()
+        self.assertTrue(self.servicio.guardar({})['exito'])
+        self.assertFalse(self.servicio.modificado)
+
+
+if __name__ == '__main__':
+    unittest.main()
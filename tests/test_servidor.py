@@ -0,0 +1,39 @@
+import socket
+import threading
+import unittest
+
+from motor_traduccion import TraductorAprendizajeConcurrente
+from motor_traduccion.servidor import TAMANO_MAXIMO_CUERPO, crear_servidor
+
+
+class PruebasContentLength(unittest.TestCase):
+    def setUp(self):
+        self.servidor = crear_servidor(TraductorAprendizajeConcurrente(), puerto=0)
+        self.hilo = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        self.hilo.start()
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def enviar(self, longitud):
+        with socket.create_connection(self.servidor.server_address[:2], timeout=5) as conexion:
+            conexion.sendall(f"POST /traducir HTTP/1.1\r\nContent-Length: {longitud}\r\n\r\n".encode('latin-1'))
+            respuesta = b''
+            while datos := conexion.recv(4096):
+                respuesta += datos
+        return respuesta
+
+    def test_longitud_no_numerica_o_negativa_responde_400_y_cierra(self):
+        for longitud in ("abc", "-5"):
+            respuesta = self.enviar(longitud)
+            self.assertTrue(respuesta.startswith(b"HTTP/1.1 400"), respuesta)
+            self.assertIn("Content-Length inválido".encode('utf-8'), respuesta)
+
+    def test_longitud_excesiva_responde_413(self):
+        respuesta = self.enviar(TAMANO_MAXIMO_CUERPO + 1)
+        self.assertTrue(respuesta.startswith(b"HTTP/1.1 413"), respuesta)
+
+
+if __name__ == '__main__':
+    unittest.main()
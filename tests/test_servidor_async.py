@@ -0,0 +1,95 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from motor_traduccion import Idioma, TraductorAprendizajeConcurrente
+from motor_traduccion.servidor_async import ServidorAsincrono
+
+
+class PruebasServidorAsincrono(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.archivo = os.path.join(self.directorio, 'dic.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_cerrar_guarda_las_evaluaciones_de_la_ultima_ventana(self):
+        traductor = TraductorAprendizajeConcurrente()
+        servidor = ServidorAsincrono(traductor, self.archivo, ventana_evaluaciones=60, intervalo_guardado=60)
+
+        async def evaluar_y_cerrar():
+            futuro = servidor.evaluar(Idioma.ESPANOL, Idioma.INGLES, "hola", 9)
+            # Con el escritor ocupado, la pasada de evaluaciones no termina
+            # antes de que cerrar() decida si hay algo que guardar
+            servidor.escritor.submit(time.sleep, 0.2)
+            await servidor.cerrar()
+            return futuro.result()
+
+        exito, _ = asyncio.run(evaluar_y_cerrar())
+        self.assertTrue(exito)
+
+        cargado = TraductorAprendizajeConcurrente()
+        exito, mensaje = cargado.cargar_diccionario_json(self.archivo, fusionar=False)
+        self.assertTrue(exito, mensaje)
+        self.assertEqual(cargado.diccionario[Idioma.ESPANOL][Idioma.INGLES]["hola"].total_evaluaciones, 2)
+
+    def test_content_length_invalido_responde_400(self):
+        servidor = ServidorAsincrono(TraductorAprendizajeConcurrente())
+
+        async def peticion():
+            host, puerto = await servidor.iniciar('127.0.0.1', 0)
+            lector, escritor = await asyncio.open_connection(host, puerto)
+            escritor.write(b"POST /traducir HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+            await escritor.drain()
+            respuesta = await lector.read()
+            escritor.close()
+            await servidor.cerrar()
+            return respuesta
+
+        respuesta = asyncio.run(peticion())
+        self.assertTrue(respuesta.startswith(b"HTTP/1.1 400"), respuesta)
+
+    def test_lecturas_no_usan_el_hilo_escritor(self):
+        servidor = ServidorAsincrono(TraductorAprendizajeConcurrente())
+
+        async def estadisticas_con_escritor_ocupado():
+            ocupado = servidor.escritor.submit(time.sleep, 1)
+            codigo, datos = await asyncio.wait_for(servidor.procesar('GET', '/estadisticas', b''), 0.5)
+            ocupado.result()
+            await servidor.cerrar()
+            return codigo, datos
+
+        codigo, datos = asyncio.run(estadisticas_con_escritor_ocupado())
+        self.assertEqual(codigo, 200)
+        self.assertIn('total_traducciones', datos)
+
+    def test_consultas_no_bloquean_el_bucle_con_el_cerrojo(self):
+        servidor = ServidorAsincrono(TraductorAprendizajeConcurrente())
+
+        def escritura_larga():
+            with servidor.servicio.cerrojo.escritura():
+                time.sleep(0.5)
+
+        async def consultar_con_escritura_en_curso():
+            ocupado = servidor.escritor.submit(escritura_larga)
+            await asyncio.sleep(0.05)
+            futuro = servidor.consultar(Idioma.ESPANOL, Idioma.INGLES, "hola")
+            inicio = time.perf_counter()
+            await asyncio.sleep(0.05)
+            espera_bucle = time.perf_counter() - inicio
+            traduccion = await futuro
+            ocupado.result()
+            await servidor.cerrar()
+            return espera_bucle, traduccion
+
+        espera_bucle, traduccion = asyncio.run(consultar_con_escritura_en_curso())
+        self.assertLess(espera_bucle, 0.3)
+        self.assertIsInstance(traduccion, str)
+
+
+if __name__ == '__main__':
+    unittest.main()